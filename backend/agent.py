@@ -4,25 +4,56 @@ Agentic tool calling system for Nyay Sathi.
 The LLM decides which tools to use based on the query.
 """
 
+import asyncio
 import json
-from typing import Any, AsyncGenerator
+import re
+from typing import Any, AsyncGenerator, NamedTuple, Optional
 
-from groq import Groq
-
-from config import GROQ_API_KEY, GROQ_MODEL
+from answer_cache import SemanticAnswerCache, question_numbers
+from config import (
+    AGENT_PREFETCH_RETRIEVAL,
+    ANSWER_CACHE_ENABLED,
+    ANSWER_CACHE_SIZE,
+    ANSWER_CACHE_THRESHOLD,
+    ANSWER_CACHE_TTL,
+    GROQ_API_KEY,
+    GROQ_MODEL,
+    TOOL_TIMEOUT,
+    TOP_K,
+)
+from executors import get_executor
+from llm_client import get_llm_client
 from logger import rag_logger as logger
-from tools import TOOLS, AGENT_SYSTEM_PROMPT
+from sanitizer import canonicalize_query
+from tools import AGENT_SYSTEM_PROMPT, TOOLS
 
 # Lazy imports to avoid circular dependencies
 _rag_engine = None
 _browser = None
+_answer_cache: Optional[SemanticAnswerCache] = None
 
 
 def _get_rag_engine():
     global _rag_engine
     if _rag_engine is None:
-        from rag_engine import retrieve, get_vectors_count
-        _rag_engine = {"retrieve": retrieve, "count": get_vectors_count}
+        from rag_engine import (
+            embed_query,
+            get_index_version,
+            get_vectors_count,
+            infer_filters,
+            lookup_statute,
+            retrieve,
+            retrieve_multi,
+        )
+        _rag_engine = {
+            "retrieve": retrieve,
+            "retrieve_multi": retrieve_multi,
+            "count": get_vectors_count,
+            "version": get_index_version,
+            "lookup": lookup_statute,
+            "infer": infer_filters,
+            "embed": embed_query,
+        }
     return _rag_engine
 
 
@@ -65,10 +96,113 @@ TOOL_DISPLAY_INFO = {
 }
 
 
+def _tool_display_info(name: str) -> dict[str, str]:
+    return TOOL_DISPLAY_INFO.get(name, {
+        "name": name, "icon": "🔧", "searching": f"Running {name}", "detail": ""
+    })
+
+
 # =============================================================================
 # TOOL EXECUTION
 # =============================================================================
 
+def _format_rag_results(results: list[dict]) -> list[dict]:
+    """Format retrieved sections for the LLM - truncate text to prevent context bloat."""
+    formatted = []
+    for i, r in enumerate(results[:3], 1):
+        formatted.append({
+            "index": i,
+            "act": r.get("act_name", "Unknown"),
+            "section": r.get("section_number", ""),
+            "text": r.get("text", "")[:800],  # Increased for better context
+            "score": round(r.get("score", 0), 3),
+        })
+    return formatted
+
+
+def _tool_message_content(result: dict) -> str:
+    """Serialize a tool result for the conversation, truncated to prevent context bloat."""
+    result_str = json.dumps(result, ensure_ascii=False)
+    if len(result_str) > 3000:
+        result_str = result_str[:3000] + '..."}'
+    return result_str
+
+
+async def _exact_reference_result(query: str) -> Optional[dict]:
+    """
+    Resolve a literal statute reference ("Section 302 IPC") without the LLM.
+
+    The lookup waits on the index read lock, so it runs on the CPU pool.
+
+    Returns:
+        A rag_search tool result, or None if the query is not an
+        unambiguous reference to an indexed section.
+    """
+    if _is_greeting(query):
+        return None
+    results = await get_executor("cpu").run(_get_rag_engine()["lookup"], query)
+    if not results:
+        return None
+    return {"status": "success", "data": _format_rag_results(results)}
+
+
+async def _prefetch_rag_search(query: str) -> Optional[dict]:
+    """
+    rag_search result for the question itself, fetched before the first completion.
+
+    Exact statute references come from the hash index; other questions go
+    through full retrieval when AGENT_PREFETCH_RETRIEVAL is set.
+
+    Returns:
+        A rag_search tool result (possibly "no_results"), or None for
+        greetings, when prefetching is off, or if retrieval failed; the
+        first completion is then forced to call rag_search itself.
+    """
+    if _is_greeting(query):
+        return None
+    exact = await _exact_reference_result(query)
+    if exact or not AGENT_PREFETCH_RETRIEVAL:
+        return exact
+    result = await _run_tool("rag_search", {"query": query})
+    if result["status"] == "error":
+        logger.warning(
+            f"Retrieval prefetch failed, leaving rag_search to the LLM: {result['reason']}"
+        )
+        return None
+    return result
+
+
+def _synthetic_rag_messages(query: str, result: dict) -> list[dict]:
+    """
+    Assistant tool call + tool result pair, as if the LLM had called rag_search.
+
+    Lets the first real completion answer directly instead of spending a
+    forced round-trip just to echo the search query back.
+    """
+    call_id = "call_prefetched_rag_search"
+    return [
+        {
+            "role": "assistant",
+            "content": "",
+            "tool_calls": [
+                {
+                    "id": call_id,
+                    "type": "function",
+                    "function": {
+                        "name": "rag_search",
+                        "arguments": json.dumps({"query": query}, ensure_ascii=False),
+                    },
+                }
+            ],
+        },
+        {
+            "role": "tool",
+            "tool_call_id": call_id,
+            "content": _tool_message_content(result),
+        },
+    ]
+
+
 async def execute_tool(name: str, args: dict) -> dict:
     """
     Execute a tool and return the result.
@@ -78,27 +212,36 @@ async def execute_tool(name: str, args: dict) -> dict:
     if name == "rag_search":
         rag = _get_rag_engine()
         query = args.get("query", "")
+        # Sub-queries are searched together with the question in one batch
+        queries = [query, *(q for q in args.get("queries") or [] if isinstance(q, str))]
+        filters = {key: args[key] for key in ("act", "category", "year") if args.get(key)}
+
+        # Run synchronous RAG (which waits on the index read lock) on the
+        # bounded CPU pool to avoid blocking the event loop (raises
+        # ExecutorSaturated when the pool is full)
+        pool = get_executor("cpu")
+        inferred = False
+        if not filters:
+            # Narrow by acts / years named in the question ("under the POCSO Act")
+            filters = await pool.run(rag["infer"], query) or {}
+            inferred = bool(filters)
         
-        # Run synchronous RAG in thread pool to avoid blocking event loop
-        import asyncio
-        loop = asyncio.get_running_loop()
-        results = await loop.run_in_executor(None, rag["retrieve"], query)
+        results = await pool.run(rag["retrieve_multi"], queries, TOP_K, filters or None)
+
+        # A filter the corpus cannot satisfy should not hide unfiltered hits
+        if not results and filters:
+            filters = {}
+            results = await pool.run(rag["retrieve_multi"], queries)
         
-        # Format results for LLM - truncate text to prevent context bloat
         if not results:
             return {"status": "no_results", "data": []}
         
-        formatted = []
-        for i, r in enumerate(results[:3], 1):
-            formatted.append({
-                "index": i,
-                "act": r.get("act_name", "Unknown"),
-                "section": r.get("section_number", ""),
-                "text": r.get("text", "")[:800],  # Increased for better context
-                "score": round(r.get("score", 0), 3),
-            })
-        
-        return {"status": "success", "data": formatted}
+        result: dict[str, Any] = {"status": "success"}
+        if filters:
+            # Ahead of "data" so it survives truncation of the tool message
+            result["filters"] = {**filters, "inferred": inferred}
+        result["data"] = _format_rag_results(results)
+        return result
     
     elif name == "web_search":
         browser = await _get_browser()
@@ -136,6 +279,228 @@ async def execute_tool(name: str, args: dict) -> dict:
         return {"status": "error", "reason": f"Unknown tool: {name}"}
 
 
+async def _run_tool(name: str, args: dict) -> dict:
+    """execute_tool with a TOOL_TIMEOUT deadline; failures become error results."""
+    try:
+        return await asyncio.wait_for(execute_tool(name, args), TOOL_TIMEOUT)
+    except asyncio.TimeoutError:
+        logger.warning(f"Tool {name} timed out after {TOOL_TIMEOUT}s")
+        return {"status": "error", "reason": f"{name} timed out after {TOOL_TIMEOUT:g}s"}
+    except Exception as e:
+        logger.error(f"Tool execution failed: {e}")
+        return {"status": "error", "reason": str(e)}
+
+
+async def _run_tools(calls: list[tuple[str, dict]]) -> list[dict]:
+    """Run a turn's tool calls concurrently; results in call order."""
+    return list(await asyncio.gather(*(_run_tool(name, args) for name, args in calls)))
+
+
+async def _run_tools_as_completed(
+    calls: list[tuple[str, dict]]
+) -> AsyncGenerator[tuple[int, dict], None]:
+    """
+    Run a turn's tool calls concurrently, yielding (position, result) as each finishes.
+
+    Calls still running when the consumer stops (client disconnected) are cancelled.
+    """
+    async def run(position: int, name: str, args: dict) -> tuple[int, dict]:
+        return position, await _run_tool(name, args)
+
+    tasks = [asyncio.create_task(run(i, name, args)) for i, (name, args) in enumerate(calls)]
+    try:
+        for finished in asyncio.as_completed(tasks):
+            yield await finished
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+def _parse_text_tool_args(args_str: str) -> dict:
+    """Arguments of a text tool call ("<rag_search>{...}"), parsed leniently."""
+    try:
+        return json.loads(args_str)
+    except json.JSONDecodeError:
+        # Clean up string and try again
+        cleaned = args_str.strip().replace("'", '"')
+        try:
+            return json.loads(cleaned)
+        except json.JSONDecodeError:
+            # Fallback
+            return {"query": args_str.strip(), "url": args_str.strip()}
+
+
+def _parse_tool_call_args(tool_call) -> dict:
+    try:
+        return json.loads(tool_call.function.arguments)
+    except (TypeError, ValueError):
+        # Missing or malformed arguments
+        return {}
+
+
+# =============================================================================
+# ANSWER CACHE
+# =============================================================================
+
+# Only answers grounded in tool results are reused
+_CACHEABLE_MODES = ("grounded", "hybrid")
+
+
+def _confidence(mode: str) -> str:
+    """Confidence level reported for an answer mode."""
+    if mode == "grounded":
+        return "high"
+    if mode == "hybrid":
+        return "medium"
+    return "low"
+
+
+def _collect_sources(tools_used: list[dict]) -> tuple[list[dict], list[dict]]:
+    """Local and web sources from successful rag_search / web_search calls."""
+    local_sources = []
+    web_sources = []
+
+    for tool in tools_used:
+        if tool["name"] == "rag_search" and tool.get("result") == "success":
+            data = tool.get("data", [])
+            if isinstance(data, list):
+                for item in data:
+                    local_sources.append({
+                        "act": item.get("act", "Unknown"),
+                        "section": str(item.get("section", "")),
+                        "text": item.get("text", "")[:300],
+                        "score": item.get("score", 0)
+                    })
+
+        elif tool["name"] == "web_search" and tool.get("result") == "success":
+            data = tool.get("data", [])
+            if isinstance(data, list):
+                for item in data:
+                    web_sources.append({
+                        "url": item.get("url", ""),
+                        "title": item.get("title", ""),
+                        "domain": item.get("domain", "")
+                    })
+
+    return local_sources, web_sources
+
+
+def _lookup_cached_answer(query: str) -> tuple[Optional[tuple[dict, float]], Optional[tuple]]:
+    """
+    Embed the question and look it up in the semantic answer cache.
+
+    Blocking (embedding + FAISS search); runs on the CPU pool.
+
+    Returns:
+        ((answer, similarity) or None, key to store the new answer under).
+    """
+    global _answer_cache
+
+    rag = _get_rag_engine()
+    version = rag["version"]()
+    if not version:
+        return None, None
+
+    vector = rag["embed"](query)
+    if _answer_cache is None:
+        _answer_cache = SemanticAnswerCache(
+            vector.shape[0],
+            threshold=ANSWER_CACHE_THRESHOLD,
+            maxsize=ANSWER_CACHE_SIZE,
+            ttl=ANSWER_CACHE_TTL,
+        )
+    key = (vector, question_numbers(canonicalize_query(query)), version)
+    return _answer_cache.get(*key), key
+
+
+async def _find_cached_answer(query: str) -> tuple[Optional[tuple[dict, float]], Optional[tuple]]:
+    """Semantic answer cache lookup off the event loop; a failed lookup counts as a miss."""
+    if not ANSWER_CACHE_ENABLED or _is_greeting(query):
+        return None, None
+    try:
+        return await get_executor("cpu").run(_lookup_cached_answer, query)
+    except Exception as e:
+        logger.warning(f"Answer cache lookup failed: {e}")
+        return None, None
+
+
+async def _cache_answer(
+    key: Optional[tuple], answer: str, mode: str, tools_used: list[dict]
+) -> None:
+    """Store a finished answer under its lookup key, off the event loop; failures are logged."""
+    if key is None or _answer_cache is None or mode not in _CACHEABLE_MODES:
+        return
+    try:
+        await get_executor("cpu").run(
+            _answer_cache.set, *key, {"answer": answer, "mode": mode, "tools_used": tools_used}
+        )
+    except Exception as e:
+        logger.warning(f"Answer cache store failed: {e}")
+
+
+def _cached_result(cached: dict, similarity: float) -> dict:
+    """run_agent() result for a cached answer."""
+    logger.info(f"Answered from cache (similarity {similarity:.3f})")
+    return {
+        **cached,
+        "tokens_in": 0,
+        "tokens_out": 0,
+        "cached": True,
+        "similarity": round(similarity, 4),
+    }
+
+
+def _replay_cached_answer(cached: dict, similarity: float) -> list[dict]:
+    """The tool, sources, answer_delta and answer events of a cached answer, for the stream."""
+    events = [{
+        "type": "status",
+        "message": "Found an answer to a similar question",
+        "icon": "⚡",
+    }]
+    for tool in cached["tools_used"]:
+        tool_info = _tool_display_info(tool["name"])
+        data = tool.get("data")
+        result_count = len(data) if isinstance(data, list) else (1 if data else 0)
+        succeeded = tool["result"] == "success"
+        events.append({
+            "type": "tool_start",
+            "tool": tool["name"],
+            "display_name": tool_info["name"],
+            "icon": tool_info["icon"],
+            "message": tool_info["searching"],
+            "detail": tool_info["detail"],
+            "query": tool["args"].get("query", tool["args"].get("url", "")),
+        })
+        events.append({
+            "type": "tool_result",
+            "tool": tool["name"],
+            "display_name": tool_info["name"],
+            "icon": "✓" if succeeded else "✗",
+            "status": tool["result"],
+            "count": result_count,
+            "message": f"Found {result_count} results" if succeeded else "No results",
+        })
+
+    local_sources, web_sources = _collect_sources(cached["tools_used"])
+    if local_sources or web_sources:
+        events.append({"type": "sources", "local": local_sources, "web": web_sources})
+
+    result = _cached_result(cached, similarity)
+    # Sent whole, for clients that render the answer from deltas
+    events.append({"type": "answer_delta", "text": result["answer"]})
+    events.append({
+        "type": "answer",
+        "text": result["answer"],
+        "mode": result["mode"],
+        "confidence": _confidence(result["mode"]),
+        "tokens_in": 0,
+        "tokens_out": 0,
+        "cached": True,
+        "similarity": result["similarity"],
+    })
+    return events
+
+
 # =============================================================================
 # AGENT LOOP
 # =============================================================================
@@ -156,7 +521,12 @@ async def run_agent(query: str, max_iterations: int = 5) -> dict:
             "tokens_out": 0,
         }
     
-    client = Groq(api_key=GROQ_API_KEY)
+    # Paraphrases of recently answered questions skip the LLM entirely
+    cached, cache_key = await _find_cached_answer(query)
+    if cached:
+        return _cached_result(*cached)
+
+    client = get_llm_client()
     messages = [
         {"role": "system", "content": AGENT_SYSTEM_PROMPT},
         {"role": "user", "content": query},
@@ -166,18 +536,29 @@ async def run_agent(query: str, max_iterations: int = 5) -> dict:
     total_tokens_in = 0
     total_tokens_out = 0
     
+    # Retrieval for the question runs up front, skipping the forced rag_search turn
+    prefetched = await _prefetch_rag_search(query)
+    if prefetched:
+        messages.extend(_synthetic_rag_messages(query, prefetched))
+        tools_used.append({
+            "name": "rag_search",
+            "args": {"query": query},
+            "result": prefetched["status"],
+            "data": prefetched.get("data"),
+        })
+
     for iteration in range(max_iterations):
         logger.debug(f"Agent iteration {iteration + 1}/{max_iterations}")
         
         try:
             # Force tool use on first iteration for legal questions
             # This ensures RAG is always consulted first
-            if iteration == 0 and not _is_greeting(query):
+            if iteration == 0 and not prefetched and not _is_greeting(query):
                 current_tool_choice = {"type": "function", "function": {"name": "rag_search"}}
             else:
                 current_tool_choice = "auto"
             
-            response = client.chat.completions.create(
+            response = await client.chat.completions.create(
                 model=GROQ_MODEL,
                 messages=messages,
                 tools=TOOLS,
@@ -212,35 +593,20 @@ async def run_agent(query: str, max_iterations: int = 5) -> dict:
                     ]
                 })
                 
-                for tool_call in message.tool_calls:
-                    name = tool_call.function.name
-                    try:
-                        args = json.loads(tool_call.function.arguments)
-                    except:
-                        args = {}
-                    
-                    try:
-                        result = await execute_tool(name, args)
-                    except Exception as e:
-                        logger.error(f"Tool execution failed: {e}")
-                        result = {"status": "error", "reason": str(e)}
+                calls = [(tc.function.name, _parse_tool_call_args(tc)) for tc in message.tool_calls]
+                results = await _run_tools(calls)
+                for tool_call, (name, args), result in zip(message.tool_calls, calls, results):
                     tools_used.append({"name": name, "args": args, "result": result["status"], "data": result.get("data")})
                     
-                    # Truncate tool result to prevent context bloat
-                    result_str = json.dumps(result, ensure_ascii=False)
-                    if len(result_str) > 3000:
-                        result_str = result_str[:3000] + '..."}'
-                    
                     messages.append({
                         "role": "tool",
                         "tool_call_id": tool_call.id,
-                        "content": result_str,
+                        "content": _tool_message_content(result),
                     })
                 continue
             
             # Check for XML-style tool calls (Fallback with loose Regex)
             content = message.content or ""
-            import re
             
             tool_matches = []
             for tool_def in TOOLS:
@@ -257,24 +623,9 @@ async def run_agent(query: str, max_iterations: int = 5) -> dict:
                 messages.append({"role": "assistant", "content": content})
                 
                 tool_results = []
-                for name, args_str in tool_matches:
-                    try:
-                        # Try parsing JSON
-                        args = json.loads(args_str)
-                    except:
-                        # Clean up string and try again
-                        cleaned = args_str.strip().replace("'", '"')
-                        try:
-                            args = json.loads(cleaned)
-                        except:
-                            # Fallback
-                            args = {"query": args_str.strip(), "url": args_str.strip()}
-                    
-                    try:
-                        result = await execute_tool(name, args)
-                    except Exception as e:
-                        logger.error(f"Tool execution failed: {e}")
-                        result = {"status": "error", "reason": str(e)}
+                calls = [(name, _parse_text_tool_args(args_str)) for name, args_str in tool_matches]
+                results = await _run_tools(calls)
+                for (name, args), result in zip(calls, results):
                     # Include data in tools_used so main.py can extract sources
                     tools_used.append({"name": name, "args": args, "result": result["status"], "data": result.get("data")})
                     tool_results.append(f"Result of {name}: {json.dumps(result, ensure_ascii=False)}")
@@ -298,6 +649,7 @@ async def run_agent(query: str, max_iterations: int = 5) -> dict:
                 else:
                     mode = "fallback"
                 
+                await _cache_answer(cache_key, answer, mode, tools_used)
                 return {
                     "answer": answer,
                     "mode": mode,
@@ -326,6 +678,131 @@ async def run_agent(query: str, max_iterations: int = 5) -> dict:
     }
 
 
+# =============================================================================
+# STREAMED COMPLETIONS
+# =============================================================================
+
+# Text tool calls ("<rag_search>{...}") of models without structured tool calling
+_TOOL_TAG_RE = re.compile(
+    "|".join(f"<{tool_def['function']['name']}>" for tool_def in TOOLS),
+    re.IGNORECASE,
+)
+
+
+class _ToolCallFunction(NamedTuple):
+    name: str
+    arguments: str
+
+
+class _ToolCall(NamedTuple):
+    id: str
+    function: _ToolCallFunction
+
+
+class _StreamedTurn:
+    """
+    One completion requested with stream=True, assembled as it arrives.
+
+    After stream() is exhausted, content / tool_calls / tokens mirror the
+    fields of a non-streamed response.
+    """
+
+    def __init__(self):
+        self.content = ""
+        self.tokens_in = 0
+        self.tokens_out = 0
+        self._calls: dict[int, dict[str, str]] = {}
+
+    @property
+    def tool_calls(self) -> list[_ToolCall]:
+        return [
+            _ToolCall(call["id"], _ToolCallFunction(call["name"], call["arguments"]))
+            for _, call in sorted(self._calls.items())
+        ]
+
+    @property
+    def is_tool_turn(self) -> bool:
+        """Whether the turn calls tools (structured or as text tags) rather than answering."""
+        return bool(self._calls) or bool(_TOOL_TAG_RE.search(self.content))
+
+    async def stream(self, client, **kwargs) -> AsyncGenerator[str, None]:
+        """Request the completion and yield its content deltas."""
+        chunks = await client.chat.completions.create(stream=True, **kwargs)
+        async for chunk in chunks:
+            # Groq reports usage on the last chunk under x_groq
+            usage = getattr(chunk, "usage", None)
+            if usage is None:
+                usage = getattr(getattr(chunk, "x_groq", None), "usage", None)
+            if usage:
+                self.tokens_in = usage.prompt_tokens
+                self.tokens_out = usage.completion_tokens
+            if not chunk.choices:
+                continue
+
+            delta = chunk.choices[0].delta
+            # Tool calls arrive in fragments keyed by index
+            for fragment in delta.tool_calls or []:
+                call = self._calls.setdefault(
+                    fragment.index, {"id": "", "name": "", "arguments": ""}
+                )
+                if fragment.id:
+                    call["id"] = fragment.id
+                if fragment.function is not None:
+                    if fragment.function.name:
+                        call["name"] = fragment.function.name
+                    if fragment.function.arguments:
+                        call["arguments"] += fragment.function.arguments
+            if delta.content:
+                self.content += delta.content
+                yield delta.content
+
+    def answer_prefix(self) -> str:
+        """
+        Content that is safe to show as answer text so far.
+
+        A trailing "<..." is held back until it is clearly not the start
+        of a text tool call.
+        """
+        cut = self.content.rfind("<")
+        if cut != -1 and ">" not in self.content[cut:]:
+            return self.content[:cut]
+        return self.content
+
+
+def _tool_start_event(name: str, call_id: str, args: dict) -> dict:
+    """tool_start event for a tool call the model made."""
+    tool_info = _tool_display_info(name)
+    return {
+        "type": "tool_start",
+        "tool": name,
+        "call_id": call_id,
+        "display_name": tool_info["name"],
+        "icon": tool_info["icon"],
+        "message": tool_info["searching"],
+        "detail": tool_info["detail"],
+        "query": args.get("query", args.get("url", "")),
+    }
+
+
+def _tool_result_event(name: str, call_id: str, result: dict) -> dict:
+    """tool_result event for a finished tool call."""
+    found = result["status"] == "success"
+    result_count = 0
+    if found:
+        data = result.get("data", [])
+        result_count = len(data) if isinstance(data, list) else 1
+    return {
+        "type": "tool_result",
+        "tool": name,
+        "call_id": call_id,
+        "display_name": _tool_display_info(name)["name"],
+        "icon": "✓" if found else "✗",
+        "status": result["status"],
+        "count": result_count,
+        "message": f"Found {result_count} results" if found else "No results",
+    }
+
+
 # =============================================================================
 # STREAMING AGENT (for live status updates)
 # =============================================================================
@@ -336,11 +813,17 @@ async def run_agent_streaming(query: str, max_iterations: int = 5) -> AsyncGener
     
     Yields events like:
     - {"type": "status", "message": "...", "icon": "..."}
-    - {"type": "tool_start", "tool": "rag_search", "query": "..."}
-    - {"type": "tool_result", "tool": "...", "status": "success", "count": N}
+    - {"type": "tool_start", "tool": "rag_search", "call_id": "...", "query": "..."}
+    - {"type": "tool_result", "tool": "...", "call_id": "...", "status": "success", "count": N}
     - {"type": "thinking", "message": "..."}
-    - {"type": "answer", "text": "...", "mode": "...", "confidence": "..."}
+    - {"type": "answer_delta", "text": "..."} (answer text as it is generated)
+    - {"type": "answer_reset"} (discard the deltas so far: the turn called tools)
+    - {"type": "answer", "text": "...", "mode": "...", "confidence": "...",
+       "tokens_in": N, "tokens_out": N}
     - {"type": "sources", "local": [...], "web": [...]}
+
+    The tool calls of one turn run concurrently: every tool_start comes
+    first, then the tool_results in the order the calls finish.
     """
     if not GROQ_API_KEY:
         yield {"type": "error", "message": "API key not configured"}
@@ -354,7 +837,14 @@ async def run_agent_streaming(query: str, max_iterations: int = 5) -> AsyncGener
         "detail": query[:100] + "..." if len(query) > 100 else query
     }
     
-    client = Groq(api_key=GROQ_API_KEY)
+    # Paraphrases of recently answered questions replay the cached answer
+    cached, cache_key = await _find_cached_answer(query)
+    if cached:
+        for event in _replay_cached_answer(*cached):
+            yield event
+        return
+
+    client = get_llm_client()
     messages = [
         {"role": "system", "content": AGENT_SYSTEM_PROMPT},
         {"role": "user", "content": query},
@@ -364,6 +854,54 @@ async def run_agent_streaming(query: str, max_iterations: int = 5) -> AsyncGener
     total_tokens_in = 0
     total_tokens_out = 0
     
+    # Retrieval for the question runs up front, skipping the forced rag_search turn
+    tool_info = TOOL_DISPLAY_INFO["rag_search"]
+    tool_start = {
+        "type": "tool_start",
+        "tool": "rag_search",
+        "display_name": tool_info["name"],
+        "icon": tool_info["icon"],
+        "message": tool_info["searching"],
+        "detail": tool_info["detail"],
+        "query": query
+    }
+    # Full retrieval takes a moment: announce it before it runs
+    announced = AGENT_PREFETCH_RETRIEVAL and not _is_greeting(query)
+    if announced:
+        yield tool_start
+    prefetched = await _prefetch_rag_search(query)
+    if prefetched:
+        if not announced:
+            yield tool_start
+        result_count = len(prefetched.get("data", []))
+        found = prefetched["status"] == "success"
+        yield {
+            "type": "tool_result",
+            "tool": "rag_search",
+            "display_name": tool_info["name"],
+            "icon": "✓" if found else "✗",
+            "status": prefetched["status"],
+            "count": result_count,
+            "message": f"Found {result_count} results" if found else "No results"
+        }
+        messages.extend(_synthetic_rag_messages(query, prefetched))
+        tools_used.append({
+            "name": "rag_search",
+            "args": {"query": query},
+            "result": prefetched["status"],
+            "data": prefetched.get("data")
+        })
+    elif announced:
+        yield {
+            "type": "tool_result",
+            "tool": "rag_search",
+            "display_name": tool_info["name"],
+            "icon": "✗",
+            "status": "error",
+            "count": 0,
+            "message": "Search failed, retrying"
+        }
+
     for iteration in range(max_iterations):
         logger.debug(f"Agent iteration {iteration + 1}/{max_iterations}")
         
@@ -377,25 +915,37 @@ async def run_agent_streaming(query: str, max_iterations: int = 5) -> AsyncGener
         
         try:
             # Force tool use on first iteration for legal questions
-            if iteration == 0 and not _is_greeting(query):
+            if iteration == 0 and not prefetched and not _is_greeting(query):
                 current_tool_choice = {"type": "function", "function": {"name": "rag_search"}}
             else:
                 current_tool_choice = "auto"
             
-            response = client.chat.completions.create(
+            # Streamed: answer text is forwarded as it is generated, until
+            # the turn turns out to call tools instead
+            message = _StreamedTurn()
+            sent = ""
+            async for _ in message.stream(
+                client,
                 model=GROQ_MODEL,
                 messages=messages,
                 tools=TOOLS,
                 tool_choice=current_tool_choice,
                 temperature=0.1,
                 max_tokens=2048,
-            )
+            ):
+                if message.is_tool_turn:
+                    continue
+                text = message.answer_prefix()
+                if len(text) > len(sent):
+                    yield {"type": "answer_delta", "text": text[len(sent):]}
+                    sent = text
             
-            if response.usage:
-                total_tokens_in += response.usage.prompt_tokens
-                total_tokens_out += response.usage.completion_tokens
+            total_tokens_in += message.tokens_in
+            total_tokens_out += message.tokens_out
             
-            message = response.choices[0].message
+            # Text already shown belonged to a tool-calling turn: take it back
+            if sent and message.is_tool_turn:
+                yield {"type": "answer_reset"}
             
             # Handle tool calls
             if message.tool_calls:
@@ -415,52 +965,20 @@ async def run_agent_streaming(query: str, max_iterations: int = 5) -> AsyncGener
                     ]
                 })
                 
-                for tool_call in message.tool_calls:
-                    name = tool_call.function.name
-                    try:
-                        args = json.loads(tool_call.function.arguments)
-                    except:
-                        args = {}
-                    
-                    # Get tool display info
-                    tool_info = TOOL_DISPLAY_INFO.get(name, {
-                        "name": name, "icon": "🔧", "searching": f"Running {name}", "detail": ""
-                    })
-                    
-                    # Emit tool start event
-                    yield {
-                        "type": "tool_start",
-                        "tool": name,
-                        "display_name": tool_info["name"],
-                        "icon": tool_info["icon"],
-                        "message": tool_info["searching"],
-                        "detail": tool_info["detail"],
-                        "query": args.get("query", args.get("url", ""))
-                    }
-                    
-                    try:
-                        result = await execute_tool(name, args)
-                    except Exception as e:
-                        logger.error(f"Tool execution failed: {e}")
-                        result = {"status": "error", "reason": str(e)}
-                    
-                    # Count results
-                    result_count = 0
-                    if result.get("status") == "success":
-                        data = result.get("data", [])
-                        result_count = len(data) if isinstance(data, list) else 1
-                    
-                    # Emit tool result event
-                    yield {
-                        "type": "tool_result",
-                        "tool": name,
-                        "display_name": tool_info["name"],
-                        "icon": "✓" if result["status"] == "success" else "✗",
-                        "status": result["status"],
-                        "count": result_count,
-                        "message": f"Found {result_count} results" if result["status"] == "success" else "No results"
-                    }
-                    
+                calls = [(tc.function.name, _parse_tool_call_args(tc)) for tc in message.tool_calls]
+
+                # Every call starts at once; results are reported as they finish
+                for tool_call, (name, args) in zip(message.tool_calls, calls):
+                    yield _tool_start_event(name, tool_call.id, args)
+
+                results: list[dict] = [{}] * len(calls)
+                async for position, result in _run_tools_as_completed(calls):
+                    results[position] = result
+                    call_id = message.tool_calls[position].id
+                    yield _tool_result_event(calls[position][0], call_id, result)
+
+                # The conversation keeps the model's tool_call order
+                for tool_call, (name, args), result in zip(message.tool_calls, calls, results):
                     tools_used.append({
                         "name": name, 
                         "args": args, 
@@ -468,20 +986,15 @@ async def run_agent_streaming(query: str, max_iterations: int = 5) -> AsyncGener
                         "data": result.get("data")
                     })
                     
-                    result_str = json.dumps(result, ensure_ascii=False)
-                    if len(result_str) > 3000:
-                        result_str = result_str[:3000] + '..."}'
-                    
                     messages.append({
                         "role": "tool",
                         "tool_call_id": tool_call.id,
-                        "content": result_str,
+                        "content": _tool_message_content(result),
                     })
                 continue
             
             # Handle XML-style tool calls (fallback)
             content = message.content or ""
-            import re
             
             tool_matches = []
             for tool_def in TOOLS:
@@ -495,44 +1008,17 @@ async def run_agent_streaming(query: str, max_iterations: int = 5) -> AsyncGener
                 messages.append({"role": "assistant", "content": content})
                 
                 tool_results = []
-                for name, args_str in tool_matches:
-                    try:
-                        args = json.loads(args_str)
-                    except:
-                        cleaned = args_str.strip().replace("'", '"')
-                        try:
-                            args = json.loads(cleaned)
-                        except:
-                            args = {"query": args_str.strip(), "url": args_str.strip()}
-                    
-                    tool_info = TOOL_DISPLAY_INFO.get(name, {
-                        "name": name, "icon": "🔧", "searching": f"Running {name}", "detail": ""
-                    })
-                    
-                    yield {
-                        "type": "tool_start",
-                        "tool": name,
-                        "display_name": tool_info["name"],
-                        "icon": tool_info["icon"],
-                        "message": tool_info["searching"],
-                        "query": args.get("query", args.get("url", ""))
-                    }
-                    
-                    try:
-                        result = await execute_tool(name, args)
-                    except Exception as e:
-                        logger.error(f"Tool execution failed: {e}")
-                        result = {"status": "error", "reason": str(e)}
-                    
-                    result_count = len(result.get("data", [])) if isinstance(result.get("data"), list) else (1 if result.get("data") else 0)
-                    
-                    yield {
-                        "type": "tool_result",
-                        "tool": name,
-                        "status": result["status"],
-                        "count": result_count
-                    }
-                    
+                calls = [(name, _parse_text_tool_args(args_str)) for name, args_str in tool_matches]
+                for position, (name, args) in enumerate(calls):
+                    yield _tool_start_event(name, f"text_{iteration}_{position}", args)
+
+                results = [{}] * len(calls)
+                async for position, result in _run_tools_as_completed(calls):
+                    results[position] = result
+                    call_id = f"text_{iteration}_{position}"
+                    yield _tool_result_event(calls[position][0], call_id, result)
+
+                for (name, args), result in zip(calls, results):
                     tools_used.append({
                         "name": name,
                         "args": args,
@@ -548,12 +1034,10 @@ async def run_agent_streaming(query: str, max_iterations: int = 5) -> AsyncGener
                 continue
             
             else:
-                # Final answer - LLM is done
-                yield {
-                    "type": "status",
-                    "message": "Generating response",
-                    "icon": "✍️"
-                }
+                # Final answer - LLM is done; flush any held-back text so the
+                # deltas add up to the full answer
+                if len(message.content) > len(sent):
+                    yield {"type": "answer_delta", "text": message.content[len(sent):]}
                 
                 answer = message.content or "I couldn't generate a response."
                 
@@ -565,39 +1049,8 @@ async def run_agent_streaming(query: str, max_iterations: int = 5) -> AsyncGener
                 else:
                     mode = "fallback"
                 
-                # Confidence
-                if mode == "grounded":
-                    confidence = "high"
-                elif mode == "hybrid":
-                    confidence = "medium"
-                else:
-                    confidence = "low"
-                
-                # Extract sources
-                local_sources = []
-                web_sources = []
-                
-                for tool in tools_used:
-                    if tool["name"] == "rag_search" and tool.get("result") == "success":
-                        data = tool.get("data", [])
-                        if isinstance(data, list):
-                            for item in data:
-                                local_sources.append({
-                                    "act": item.get("act", "Unknown"),
-                                    "section": str(item.get("section", "")),
-                                    "text": item.get("text", "")[:300],
-                                    "score": item.get("score", 0)
-                                })
-                    
-                    elif tool["name"] == "web_search" and tool.get("result") == "success":
-                        data = tool.get("data", [])
-                        if isinstance(data, list):
-                            for item in data:
-                                web_sources.append({
-                                    "url": item.get("url", ""),
-                                    "title": item.get("title", ""),
-                                    "domain": item.get("domain", "")
-                                })
+                confidence = _confidence(mode)
+                local_sources, web_sources = _collect_sources(tools_used)
                 
                 # Emit sources
                 if local_sources or web_sources:
@@ -607,6 +1060,8 @@ async def run_agent_streaming(query: str, max_iterations: int = 5) -> AsyncGener
                         "web": web_sources
                     }
                 
+                await _cache_answer(cache_key, answer, mode, tools_used)
+
                 # Emit final answer
                 yield {
                     "type": "answer",
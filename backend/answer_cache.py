@@ -0,0 +1,193 @@
+"""
+Semantic answer cache for Nyay Sathi.
+
+Many questions are paraphrases of earlier ones ("what is the punishment
+for murder" / "punishment for murder in India"). The cache keeps the
+final answer of an agent run together with the question's embedding in
+a small FAISS inner-product index of its own, so a new question whose
+embedding is close enough to a cached one is answered without any LLM
+call.
+
+Matching is deliberately strict: besides the similarity threshold, the
+numbers in both questions (section numbers, years) must agree, since
+"Section 302 IPC" and "Section 304 IPC" embed almost identically but
+have different answers. Entries expire after a TTL, the least recently
+used are evicted beyond maxsize, and every entry belongs to one legal
+index version: the first lookup under a new version empties the cache.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, NamedTuple, Optional
+
+import faiss
+import numpy as np
+
+import metrics
+
+_NUMBER_RE = re.compile(r"\d+[a-z]?")
+
+
+def question_numbers(canonical: str) -> tuple[str, ...]:
+    """Distinct numbers in a canonical question ("302", "498a", "2023")."""
+    return tuple(sorted(set(_NUMBER_RE.findall(canonical))))
+
+
+class _Entry(NamedTuple):
+    expires_at: float
+    numbers: tuple[str, ...]
+    value: dict[str, Any]
+
+
+class SemanticAnswerCache:
+    """
+    Answers keyed by question embedding, matched by cosine similarity.
+
+    Args:
+        dimension: Embedding dimension.
+        threshold: Minimum cosine similarity for a hit.
+        maxsize: Maximum number of cached answers.
+        ttl: Seconds an answer stays valid, or None for no expiry.
+        candidates: Nearest cached questions checked per lookup.
+    """
+
+    def __init__(
+        self,
+        dimension: int,
+        threshold: float = 0.95,
+        maxsize: int = 2048,
+        ttl: Optional[float] = None,
+        candidates: int = 4,
+    ):
+        self.dimension = dimension
+        self.threshold = threshold
+        self.maxsize = max(1, maxsize)
+        self.ttl = ttl if ttl and ttl > 0 else None
+        self.candidates = candidates
+
+        # IDMap2 over an exact index so single entries can be removed
+        self._index = faiss.IndexIDMap2(faiss.IndexFlatIP(dimension))
+        self._entries: OrderedDict[int, _Entry] = OrderedDict()
+        self._next_id = 0
+        self._version = ""
+        self._lock = threading.Lock()
+
+        self._hits = metrics.counter(
+            "answer_cache_hits", "Questions answered from the semantic answer cache"
+        )
+        self._misses = metrics.counter(
+            "answer_cache_misses", "Questions with no close enough cached answer"
+        )
+        self._size = metrics.gauge("answer_cache_entries", "Answers currently cached")
+        self._similarity = metrics.histogram(
+            "answer_cache_similarity", "Similarity of the nearest cached question"
+        )
+
+    def _remove(self, ids: list[int]) -> None:
+        for entry_id in ids:
+            del self._entries[entry_id]
+        self._index.remove_ids(np.asarray(ids, dtype=np.int64))
+
+    def _sync_version(self, version: str) -> None:
+        """Drop every entry when the legal index version changes."""
+        if version != self._version:
+            self._entries.clear()
+            self._index.reset()
+            self._version = version
+
+    def get(
+        self, vector: np.ndarray, numbers: tuple[str, ...], version: str
+    ) -> Optional[tuple[dict, float]]:
+        """
+        Find the cached answer to a near-identical question.
+
+        Args:
+            vector: Normalized question embedding.
+            numbers: question_numbers() of the canonical question.
+            version: Current legal index version.
+
+        Returns:
+            (answer, similarity), or None on a miss.
+        """
+        with self._lock:
+            self._sync_version(version)
+            if not self._entries:
+                self._misses.inc()
+                return None
+
+            k = min(self.candidates, len(self._entries))
+            scores, ids = self._index.search(vector[None, :].astype(np.float32), k)
+            self._similarity.observe(float(scores[0][0]))
+
+            now = time.monotonic()
+            expired = []
+            found = None
+            for score, entry_id in zip(scores[0].tolist(), ids[0].tolist()):
+                if score < self.threshold:
+                    break
+                entry = self._entries.get(entry_id)
+                if entry is None:
+                    continue
+                if entry.expires_at < now:
+                    expired.append(entry_id)
+                elif entry.numbers == numbers:
+                    found = (entry_id, entry, score)
+                    break
+
+            if expired:
+                self._remove(expired)
+                self._size.set(len(self._entries))
+            if found is None:
+                self._misses.inc()
+                return None
+
+            entry_id, entry, score = found
+            self._entries.move_to_end(entry_id)
+            self._hits.inc()
+            return entry.value, score
+
+    def set(
+        self, vector: np.ndarray, numbers: tuple[str, ...], version: str, value: dict[str, Any]
+    ) -> None:
+        """
+        Cache an answer, replacing the entry of a near-identical question.
+
+        An answer grounded on an index version that is no longer current
+        (the index was reloaded while it was generated) is not cached.
+
+        Args:
+            vector: Normalized question embedding.
+            numbers: question_numbers() of the canonical question.
+            version: Legal index version the answer was grounded on.
+            value: The answer to cache.
+        """
+        vector = vector[None, :].astype(np.float32)
+        with self._lock:
+            if version != self._version:
+                return
+
+            if self._entries:
+                scores, ids = self._index.search(vector, min(self.candidates, len(self._entries)))
+                stale = [
+                    entry_id for score, entry_id in zip(scores[0].tolist(), ids[0].tolist())
+                    if score >= self.threshold and self._entries[entry_id].numbers == numbers
+                ]
+                if stale:
+                    self._remove(stale)
+
+            while len(self._entries) >= self.maxsize:
+                self._remove([next(iter(self._entries))])
+
+            entry_id = self._next_id
+            self._next_id += 1
+            expires_at = time.monotonic() + self.ttl if self.ttl else float("inf")
+            self._index.add_with_ids(vector, np.asarray([entry_id], dtype=np.int64))
+            self._entries[entry_id] = _Entry(expires_at, numbers, value)
+            self._size.set(len(self._entries))
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,167 @@
+"""
+Persistent answer cache for Nyay Sathi.
+
+The in-process caches go cold on every deploy and are duplicated per
+uvicorn worker. This cache keeps finished responses in a local SQLite
+database in WAL mode instead: all workers on a host read and write the
+same file concurrently, and a restarted or newly added worker starts
+warm.
+
+Values are JSON compressed with zstd. The database is kept under a byte
+budget by evicting the least recently used responses, and entries
+expire after a TTL. Keys are built by the caller (question, model and
+index version) and hashed, so a new model or index never serves a stale
+answer.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+import zstandard
+
+import metrics
+from logger import app_logger as logger
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS answers (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS answers_accessed_at ON answers (accessed_at);
+"""
+
+# Access times are only rewritten when older than this, so hot entries
+# do not turn every read into a write
+_TOUCH_INTERVAL = 60.0
+
+
+def cache_key(*parts: Any) -> str:
+    """Stable key for JSON-serializable key parts."""
+    return hashlib.sha256(json.dumps(parts, ensure_ascii=False).encode()).hexdigest()
+
+
+class PersistentAnswerCache:
+    """
+    Size-bounded, TTL'd response cache in a shared SQLite file.
+
+    Every method blocks on disk I/O; call them from the "io" pool.
+
+    Args:
+        path: Database file (created with its directory if needed).
+        max_bytes: Budget for the compressed values; least recently used
+            entries are evicted beyond it.
+        ttl: Seconds an entry stays valid, or None for no expiry.
+        level: zstd compression level.
+    """
+
+    def __init__(self, path: Path, max_bytes: int, ttl: Optional[float] = None, level: int = 3):
+        self.path = Path(path)
+        self.max_bytes = max(1, max_bytes)
+        self.ttl = ttl if ttl and ttl > 0 else None
+        self.level = level
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        self._evict_lock = threading.Lock()
+        self._connection().executescript(_SCHEMA)
+
+        self._hits = metrics.counter(
+            "answer_store_hits", "Responses served from the persistent answer cache"
+        )
+        self._misses = metrics.counter(
+            "answer_store_misses", "Persistent answer cache lookups that found nothing"
+        )
+        self._evictions = metrics.counter(
+            "answer_store_evictions", "Responses evicted from the persistent cache"
+        )
+        self._bytes = metrics.gauge(
+            "answer_store_bytes", "Compressed bytes in the persistent answer cache"
+        )
+        total = self._connection().execute("SELECT COALESCE(SUM(size), 0) FROM answers")
+        self._bytes.set(total.fetchone()[0])
+
+    def _connection(self) -> sqlite3.Connection:
+        """This thread's connection (sqlite3 connections are not shared across threads)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+            # WAL: readers never block the writer (or each other) across processes
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            self._local.compressor = zstandard.ZstdCompressor(level=self.level)
+            self._local.decompressor = zstandard.ZstdDecompressor()
+        return conn
+
+    def get(self, key: str) -> Optional[Any]:
+        """Cached value for key, or None if absent or expired."""
+        conn = self._connection()
+        row = conn.execute(
+            "SELECT value, created_at, accessed_at FROM answers WHERE key = ?", (key,)
+        ).fetchone()
+        now = time.time()
+        if row is None or (self.ttl is not None and row[1] + self.ttl < now):
+            if row is not None:
+                conn.execute("DELETE FROM answers WHERE key = ?", (key,))
+            self._misses.inc()
+            return None
+
+        value, _, accessed_at = row
+        if now - accessed_at > _TOUCH_INTERVAL:
+            conn.execute("UPDATE answers SET accessed_at = ? WHERE key = ?", (now, key))
+        self._hits.inc()
+        return json.loads(self._local.decompressor.decompress(value))
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a JSON-serializable value, then evict down to the byte budget."""
+        conn = self._connection()
+        raw = json.dumps(value, ensure_ascii=False).encode("utf-8")
+        blob = self._local.compressor.compress(raw)
+        now = time.time()
+        conn.execute(
+            "INSERT OR REPLACE INTO answers (key, value, size, created_at, accessed_at) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (key, blob, len(blob), now, now),
+        )
+        self._evict(conn)
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Drop expired entries, then the least recently used ones beyond max_bytes."""
+        with self._evict_lock:
+            if self.ttl is not None:
+                conn.execute("DELETE FROM answers WHERE created_at < ?", (time.time() - self.ttl,))
+
+            total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM answers").fetchone()[0]
+            if total > self.max_bytes:
+                # Evict to 90% of the budget so the next few writes do not each evict
+                excess = total - int(self.max_bytes * 0.9)
+                victims: list[tuple[str, int]] = []
+                freed = 0
+                rows = conn.execute("SELECT key, size FROM answers ORDER BY accessed_at")
+                for key, size in rows.fetchall():
+                    victims.append((key, size))
+                    freed += size
+                    if freed >= excess:
+                        break
+                conn.executemany(
+                    "DELETE FROM answers WHERE key = ?", [(key,) for key, _ in victims]
+                )
+                self._evictions.inc(len(victims))
+                total -= freed
+                logger.debug(f"Evicted {len(victims)} cached answers ({freed} bytes)")
+            self._bytes.set(total)
+
+    def clear(self) -> None:
+        """Delete every entry."""
+        self._connection().execute("DELETE FROM answers")
+        self._bytes.set(0)
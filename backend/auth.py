@@ -9,7 +9,7 @@ from typing import Optional
 from fastapi import HTTPException, Security, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
-from config import API_SECRET_KEYS
+from config import ADMIN_API_KEYS, API_SECRET_KEYS
 from logger import app_logger as logger
 
 # Bearer token scheme
@@ -48,3 +48,35 @@ def verify_api_key(credentials: HTTPAuthorizationCredentials = Security(security
         )
 
     return token
+
+
+def verify_admin_key(credentials: HTTPAuthorizationCredentials = Security(security)) -> str:
+    """
+    Verify the Bearer token against the configured admin keys.
+
+    Args:
+        credentials: The HTTP authorization credentials.
+
+    Returns:
+        The valid token.
+
+    Raises:
+        HTTPException: If admin endpoints are disabled or the token is invalid.
+    """
+    token = credentials.credentials
+
+    if not ADMIN_API_KEYS:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Admin endpoints are disabled (ADMIN_API_KEYS not set)",
+        )
+
+    if token not in ADMIN_API_KEYS:
+        logger.warning(f"Invalid admin key attempt: {token[:4]}***")
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid authentication credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    return token
@@ -0,0 +1,150 @@
+"""
+Micro-batching for Nyay Sathi retrieval.
+
+Concurrent callers submit single items and block until their result is
+ready. A worker thread collects items arriving within a short window (or
+up to a maximum batch size) and processes them with one call, so N
+concurrent queries cost one batched forward pass instead of N.
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, Generic, Optional, TypeVar
+
+import metrics
+from logger import rag_logger as logger
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class MicroBatcher(Generic[T, R]):
+    """
+    Coalesces concurrent submissions into batches.
+
+    Args:
+        name: Name used for the worker thread and metric names.
+        process_fn: Processes a batch of items, returning one result per item
+            in the same order.
+        max_batch_size: Maximum items processed together.
+        max_wait_ms: How long the first item of a batch waits for company.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        process_fn: Callable[[list[T]], list[R]],
+        max_batch_size: int = 32,
+        max_wait_ms: float = 5.0,
+    ):
+        self.name = name
+        self.process_fn = process_fn
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0.0, max_wait_ms) / 1000.0
+
+        self._queue: queue.Queue[tuple[T, Future, float]] = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+
+        self._batch_size = metrics.histogram(
+            f"{name}_batch_size", "Items processed per batch"
+        )
+        self._queue_delay = metrics.histogram(
+            f"{name}_queue_delay_ms", "Time items waited before their batch started"
+        )
+        self._batch_latency = metrics.histogram(
+            f"{name}_batch_latency_ms", "Time spent processing one batch"
+        )
+
+    def submit(self, item: T) -> R:
+        """
+        Submit one item and block until its result is available.
+
+        Raises:
+            Exception: Whatever process_fn raised for this item's batch.
+        """
+        self._ensure_worker()
+        future: Future = Future()
+        self._queue.put((item, future, time.perf_counter()))
+        return future.result()
+
+    def submit_many(self, items: list[T]) -> list[R]:
+        """
+        Submit several items at once and block until all results are available.
+
+        The items are enqueued together, so they land in the same batch
+        (up to max_batch_size) along with any concurrent submissions.
+        """
+        self._ensure_worker()
+        futures: list[Future] = []
+        now = time.perf_counter()
+        for item in items:
+            future: Future = Future()
+            self._queue.put((item, future, now))
+            futures.append(future)
+        return [future.result() for future in futures]
+
+    def _ensure_worker(self) -> None:
+        if self._worker is not None:
+            return
+        with self._start_lock:
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run, name=f"{self.name}-batcher", daemon=True
+                )
+                self._worker.start()
+                logger.debug(
+                    f"Started {self.name} batcher "
+                    f"(max_batch={self.max_batch_size}, wait={self.max_wait * 1000:.1f}ms)"
+                )
+
+    def _collect(self) -> list[tuple[T, Future, float]]:
+        """Block for one item, then gather more until full or the window closes."""
+        first = self._queue.get()
+        batch = [first]
+        deadline = first[2] + self.max_wait
+
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            try:
+                if remaining <= 0:
+                    batch.append(self._queue.get_nowait())
+                else:
+                    batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._collect()
+            started = time.perf_counter()
+
+            self._batch_size.observe(len(batch))
+            for _, _, enqueued in batch:
+                self._queue_delay.observe((started - enqueued) * 1000)
+
+            try:
+                results = self.process_fn([item for item, _, _ in batch])
+            except Exception as e:
+                logger.error(f"{self.name} batch of {len(batch)} failed: {e}")
+                for _, future, _ in batch:
+                    future.set_exception(e)
+                continue
+            finally:
+                self._batch_latency.observe((time.perf_counter() - started) * 1000)
+
+            for (_, future, _), result in zip(batch, results):
+                future.set_result(result)
+
+            # A short result list must not leave callers blocked forever
+            if len(results) < len(batch):
+                error = RuntimeError(
+                    f"{self.name} batch returned {len(results)} results for {len(batch)} items"
+                )
+                logger.error(str(error))
+                for _, future, _ in batch[len(results):]:
+                    future.set_exception(error)
@@ -0,0 +1,146 @@
+"""
+In-memory caches for Nyay Sathi.
+
+Provides a thread-safe LRU cache with optional per-entry TTL, an
+optional byte budget, and hit/miss counters registered in the metrics
+module.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, Optional, TypeVar
+
+import metrics
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class LRUCache(Generic[K, V]):
+    """
+    Bounded LRU cache with optional time-to-live.
+
+    Args:
+        name: Prefix for the cache's metric names.
+        maxsize: Maximum number of entries; 0 disables the cache.
+        ttl: Seconds an entry stays valid, or None for no expiry.
+        max_bytes: Maximum total size of the cached values; 0 for no limit.
+        sizeof: Size in bytes of a value (required with max_bytes).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        maxsize: int,
+        ttl: Optional[float] = None,
+        max_bytes: int = 0,
+        sizeof: Optional[Callable[[V], int]] = None,
+    ):
+        if max_bytes > 0 and sizeof is None:
+            raise ValueError("max_bytes requires a sizeof function")
+
+        self.name = name
+        self.maxsize = max(0, maxsize)
+        self.ttl = ttl if ttl and ttl > 0 else None
+        self.max_bytes = max(0, max_bytes)
+        self.sizeof = sizeof
+
+        self._data: OrderedDict[K, tuple[float, V, int]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+        self._hits = metrics.counter(f"{name}_cache_hits", "Cache lookups that found a live entry")
+        self._misses = metrics.counter(f"{name}_cache_misses", "Cache lookups that found nothing")
+        self._evictions = metrics.counter(f"{name}_cache_evictions", "Entries evicted for space")
+        self._size = metrics.gauge(f"{name}_cache_entries", "Entries currently cached")
+        self._hit_ratio = metrics.gauge(f"{name}_cache_hit_ratio", "Lifetime hits / lookups")
+        if self.sizeof is not None:
+            self._size_bytes = metrics.gauge(
+                f"{name}_cache_bytes", "Approximate bytes of cached values"
+            )
+
+    @property
+    def enabled(self) -> bool:
+        return self.maxsize > 0
+
+    def get(self, key: K) -> Optional[V]:
+        """Return the cached value, or None if absent or expired."""
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                expires_at, value, _ = entry
+                if expires_at >= time.monotonic():
+                    self._data.move_to_end(key)
+                    self._hits.inc()
+                    self._update_hit_ratio()
+                    return value
+                self._remove(key)
+                self._update_size()
+
+        self._misses.inc()
+        self._update_hit_ratio()
+        return None
+
+    def set(self, key: K, value: V) -> None:
+        """Insert or refresh an entry, evicting the least recently used if full."""
+        if not self.enabled:
+            return
+
+        nbytes = self.sizeof(value) if self.sizeof is not None else 0
+        if self.max_bytes and nbytes > self.max_bytes:
+            return
+
+        expires_at = time.monotonic() + self.ttl if self.ttl else float("inf")
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+            self._data[key] = (expires_at, value, nbytes)
+            self._bytes += nbytes
+            while len(self._data) > self.maxsize or (
+                self.max_bytes and self._bytes > self.max_bytes
+            ):
+                self._remove(next(iter(self._data)))
+                self._evictions.inc()
+            self._update_size()
+
+    def _remove(self, key: K) -> None:
+        """Drop one entry (caller holds the lock)."""
+        _, _, nbytes = self._data.pop(key)
+        self._bytes -= nbytes
+
+    def _update_size(self) -> None:
+        self._size.set(len(self._data))
+        if self.sizeof is not None:
+            self._size_bytes.set(self._bytes)
+
+    def _update_hit_ratio(self) -> None:
+        hits = self._hits.value
+        self._hit_ratio.set(round(hits / (hits + self._misses.value), 4))
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+            self._update_size()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> dict:
+        """Hit/miss counters and current size."""
+        hits, misses = self._hits.value, self._misses.value
+        lookups = hits + misses
+        stats = {
+            "entries": len(self._data),
+            "hits": int(hits),
+            "misses": int(misses),
+            "hit_ratio": round(hits / lookups, 4) if lookups else 0.0,
+        }
+        if self.sizeof is not None:
+            stats["bytes"] = self._bytes
+        return stats
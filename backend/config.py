@@ -35,6 +35,26 @@ DATA_DIR: Final[Path] = BASE_DIR / "data" / "processed"
 
 FAISS_INDEX_PATH: Final[Path] = DATA_DIR / "faiss.index"
 FAISS_META_PATH: Final[Path] = DATA_DIR / "faiss_meta.pkl"
+# Columnar, memory-mapped metadata (preferred over the pickle when present)
+FAISS_META_STORE_PATH: Final[Path] = DATA_DIR / "faiss_meta"
+BM25_PATH: Final[Path] = DATA_DIR / "bm25.npz"
+# Act names and years used to infer filters from query text
+ACTS_METADATA_PATH: Final[Path] = BASE_DIR / "data" / "raw" / "metadata" / "acts_metadata.json"
+MANIFEST_PATH: Final[Path] = DATA_DIR / "manifest.json"
+# float16 copy of the vectors, written only for compressed (SQ/PQ/binary) indexes
+RERANK_VECTORS_PATH: Final[Path] = DATA_DIR / "vectors_fp16.npy"
+
+# Memory-map the FAISS index read-only so all workers share one page-cache copy
+FAISS_MMAP: Final[bool] = os.getenv("FAISS_MMAP", "true").lower() == "true"
+# Startup check of index artifacts against manifest.json:
+# "off", "size" (cheap, default) or "checksum" (SHA-256 of every file)
+INDEX_VERIFY: Final[str] = os.getenv("INDEX_VERIFY", "size").lower()
+# FAISS search parameters (e.g. "nprobe=8", "efSearch=64"); overrides the
+# auto-tuned value stored in manifest.json by build_faiss_index.py
+FAISS_SEARCH_PARAMS: Final[str] = os.getenv("FAISS_SEARCH_PARAMS", "")
+# With a compressed index, fetch top_k * RERANK_OVERFETCH candidates and
+# re-rank them by exact inner product against the float16 vectors
+RERANK_OVERFETCH: Final[int] = int(os.getenv("RERANK_OVERFETCH", "4"))
 
 # =============================================================================
 # API KEYS
@@ -48,12 +68,29 @@ GROQ_API_KEY: Final[str] = os.getenv("GROQ_API_KEY", "")
 
 EMBEDDING_MODEL: Final[str] = "sentence-transformers/all-MiniLM-L6-v2"
 
+# Embedding backend: "torch" (sentence-transformers) or "onnx" (int8 ONNX Runtime,
+# exported by scripts/export_onnx_embedder.py - no torch required at runtime)
+EMBEDDING_BACKEND: Final[str] = os.getenv("EMBEDDING_BACKEND", "torch").lower()
+ONNX_MODEL_DIR: Final[Path] = Path(os.getenv("ONNX_MODEL_DIR", str(DATA_DIR / "onnx_embedder")))
+
 # Groq models ranked by capability:
 # - llama-3.3-70b-versatile: 128K context, best reasoning (recommended)
 # - llama-3.1-70b-versatile: 128K context, great reasoning
 # - llama-3.1-8b-instant: 8K context, fast but limited (previous default)
 GROQ_MODEL: Final[str] = os.getenv("GROQ_MODEL", "llama-3.3-70b-versatile")
 
+# =============================================================================
+# LLM CLIENT (shared async connection pool)
+# =============================================================================
+
+# One AsyncGroq client is created at startup and reused by every request.
+# These limits size its keep-alive connection pool.
+LLM_MAX_CONNECTIONS: Final[int] = int(os.getenv("LLM_MAX_CONNECTIONS", "100"))
+LLM_MAX_KEEPALIVE_CONNECTIONS: Final[int] = int(os.getenv("LLM_MAX_KEEPALIVE_CONNECTIONS", "20"))
+LLM_KEEPALIVE_EXPIRY: Final[float] = float(os.getenv("LLM_KEEPALIVE_EXPIRY", "60.0"))
+LLM_TIMEOUT: Final[float] = float(os.getenv("LLM_TIMEOUT", "60.0"))
+LLM_MAX_RETRIES: Final[int] = int(os.getenv("LLM_MAX_RETRIES", "2"))
+
 # =============================================================================
 # RAG SETTINGS
 # =============================================================================
@@ -62,6 +99,130 @@ TOP_K: Final[int] = 5
 # Higher threshold = more confident/relevant results only
 CONFIDENCE_THRESHOLD: Final[float] = 0.60
 
+# Micro-batching: concurrent queries arriving within the wait window are
+# embedded and searched together (one forward pass, one index.search call)
+EMBED_BATCH_ENABLED: Final[bool] = os.getenv("EMBED_BATCH_ENABLED", "true").lower() == "true"
+EMBED_BATCH_MAX_SIZE: Final[int] = int(os.getenv("EMBED_BATCH_MAX_SIZE", "32"))
+EMBED_BATCH_MAX_WAIT_MS: Final[float] = float(os.getenv("EMBED_BATCH_MAX_WAIT_MS", "5.0"))
+
+# Query embedding cache (LRU + TTL, keyed on the canonicalized query; 0 disables)
+QUERY_CACHE_SIZE: Final[int] = int(os.getenv("QUERY_CACHE_SIZE", "2048"))
+QUERY_CACHE_TTL: Final[float] = float(os.getenv("QUERY_CACHE_TTL", "3600"))
+
+# Retrieval result cache: ranked chunk ids and scores per (query, k, filters),
+# keyed on the loaded index version so a rebuilt index never serves stale hits
+RESULT_CACHE_SIZE: Final[int] = int(os.getenv("RESULT_CACHE_SIZE", "4096"))
+RESULT_CACHE_MAX_MB: Final[float] = float(os.getenv("RESULT_CACHE_MAX_MB", "16"))
+RESULT_CACHE_TTL: Final[float] = float(os.getenv("RESULT_CACHE_TTL", "3600"))
+
+# Hybrid retrieval: BM25 over chunk texts fused with dense scores via
+# reciprocal-rank fusion (used when bm25.npz is present)
+HYBRID_SEARCH_ENABLED: Final[bool] = os.getenv("HYBRID_SEARCH_ENABLED", "true").lower() == "true"
+HYBRID_CANDIDATES: Final[int] = int(os.getenv("HYBRID_CANDIDATES", "50"))
+RRF_K: Final[int] = int(os.getenv("RRF_K", "60"))
+
+# Exact statute references ("Section 302 IPC", "BNS 103") are answered from an
+# (act, section) hash index without the embedder, FAISS or the forced
+# rag_search LLM turn
+STATUTE_FAST_PATH_ENABLED: Final[bool] = (
+    os.getenv("STATUTE_FAST_PATH_ENABLED", "true").lower() == "true"
+)
+# Run rag_search on the question itself before the first LLM call, instead of
+# spending a forced completion on choosing the search query
+AGENT_PREFETCH_RETRIEVAL: Final[bool] = (
+    os.getenv("AGENT_PREFETCH_RETRIEVAL", "true").lower() == "true"
+)
+# Seconds each tool call may take; the tool calls of one turn run concurrently.
+# A search that times out while still queued is dropped from the CPU pool, but
+# one already running cannot be interrupted: it holds its pool slot until it
+# finishes, so several slow searches can make the pool reject healthy requests
+# (ExecutorSaturated) for a while.
+TOOL_TIMEOUT: Final[float] = float(os.getenv("TOOL_TIMEOUT", "20.0"))
+
+# Return k distinct sections: chunk hits are grouped by parent section and
+# the section text is stitched back together without the chunk overlap
+SECTION_GROUPING_ENABLED: Final[bool] = (
+    os.getenv("SECTION_GROUPING_ENABLED", "true").lower() == "true"
+)
+# Chunk hits fetched per requested section before grouping
+SECTION_GROUP_OVERFETCH: Final[int] = int(os.getenv("SECTION_GROUP_OVERFETCH", "3"))
+
+# Multi-query retrieval: rag_search sub-queries plus locally generated
+# variants (old IPC / CrPC / Evidence Act <-> new BNS / BNSS / BSA names and
+# sections) are embedded and searched together and fused with RRF
+QUERY_EXPANSION_ENABLED: Final[bool] = (
+    os.getenv("QUERY_EXPANSION_ENABLED", "true").lower() == "true"
+)
+MULTI_QUERY_MAX: Final[int] = int(os.getenv("MULTI_QUERY_MAX", "4"))
+
+# Cross-encoder re-ranking: the top CROSS_ENCODER_CANDIDATES chunks are
+# re-scored as (query, chunk) pairs in one batch. A request whose batch
+# exceeds the budget keeps its dense / hybrid order.
+CROSS_ENCODER_ENABLED: Final[bool] = os.getenv("CROSS_ENCODER_ENABLED", "false").lower() == "true"
+CROSS_ENCODER_MODEL: Final[str] = os.getenv(
+    "CROSS_ENCODER_MODEL", "cross-encoder/ms-marco-MiniLM-L-6-v2"
+)
+CROSS_ENCODER_CANDIDATES: Final[int] = int(os.getenv("CROSS_ENCODER_CANDIDATES", "40"))
+CROSS_ENCODER_BUDGET_MS: Final[float] = float(os.getenv("CROSS_ENCODER_BUDGET_MS", "250"))
+# Memoized (query, chunk) scores (0 disables)
+CROSS_ENCODER_CACHE_SIZE: Final[int] = int(os.getenv("CROSS_ENCODER_CACHE_SIZE", "20000"))
+
+# Filtered retrieval (act / category / year): subsets up to this many chunks
+# are scored directly; larger ones are searched in FAISS with an ID selector
+FILTER_SCAN_MAX: Final[int] = int(os.getenv("FILTER_SCAN_MAX", "4096"))
+# Infer act (and act year) filters from the query text ("under the POCSO Act")
+QUERY_ANALYSIS_ENABLED: Final[bool] = os.getenv("QUERY_ANALYSIS_ENABLED", "true").lower() == "true"
+
+# Startup warm-up: the index, metadata and embedding model load concurrently,
+# then these queries run through retrieval before the worker reports ready
+WARMUP_ENABLED: Final[bool] = os.getenv("WARMUP_ENABLED", "true").lower() == "true"
+WARMUP_QUERIES: Final[tuple[str, ...]] = (
+    "punishment for murder",
+    "how to file an FIR for theft",
+    "bail in a non-bailable offence",
+)
+
+# Hot reload: seconds between checks of manifest.json for a rebuilt index
+# (0 disables polling; POST /admin/reload still triggers a reload)
+INDEX_RELOAD_POLL_SECONDS: Final[float] = float(os.getenv("INDEX_RELOAD_POLL_SECONDS", "30"))
+
+# =============================================================================
+# ANSWER CACHE
+# =============================================================================
+
+# Semantic answer cache: a question whose embedding is at least
+# ANSWER_CACHE_THRESHOLD cosine-similar to a cached one (with the same
+# section numbers / years) gets the cached answer without an LLM call.
+# Entries are dropped when the legal index version changes.
+ANSWER_CACHE_ENABLED: Final[bool] = os.getenv("ANSWER_CACHE_ENABLED", "true").lower() == "true"
+ANSWER_CACHE_THRESHOLD: Final[float] = float(os.getenv("ANSWER_CACHE_THRESHOLD", "0.95"))
+ANSWER_CACHE_SIZE: Final[int] = int(os.getenv("ANSWER_CACHE_SIZE", "2048"))
+ANSWER_CACHE_TTL: Final[float] = float(os.getenv("ANSWER_CACHE_TTL", "86400"))  # 24 hours
+
+# Persistent response cache: /ask and /ask/stream responses keyed on the
+# normalized question, LLM model and index version, in a SQLite (WAL) file
+# shared by all workers on the host and kept across restarts
+PERSISTENT_CACHE_ENABLED: Final[bool] = (
+    os.getenv("PERSISTENT_CACHE_ENABLED", "true").lower() == "true"
+)
+PERSISTENT_CACHE_PATH: Final[Path] = Path(
+    os.getenv("PERSISTENT_CACHE_PATH", str(BASE_DIR / "data" / "cache" / "answers.sqlite3"))
+)
+PERSISTENT_CACHE_MAX_MB: Final[float] = float(os.getenv("PERSISTENT_CACHE_MAX_MB", "256"))
+PERSISTENT_CACHE_TTL: Final[float] = float(os.getenv("PERSISTENT_CACHE_TTL", "604800"))  # 7 days
+
+# =============================================================================
+# WORKER POOLS
+# =============================================================================
+
+# Bounded thread pools for blocking work (see executors.py). Submissions
+# beyond threads + queue are rejected immediately instead of queueing.
+# "cpu": embedding / search / re-ranking; "io": blocking file and disk access
+CPU_POOL_WORKERS: Final[int] = int(os.getenv("CPU_POOL_WORKERS", str(min(8, os.cpu_count() or 4))))
+CPU_POOL_QUEUE: Final[int] = int(os.getenv("CPU_POOL_QUEUE", "64"))
+IO_POOL_WORKERS: Final[int] = int(os.getenv("IO_POOL_WORKERS", "16"))
+IO_POOL_QUEUE: Final[int] = int(os.getenv("IO_POOL_QUEUE", "256"))
+
 # =============================================================================
 # SERVER SETTINGS
 # =============================================================================
@@ -95,6 +256,10 @@ LOG_FORMAT: Final[str] = "%(asctime)s | %(levelname)-8s | %(name)s | %(message)s
 _keys_str = os.getenv("API_SECRET_KEYS", "nyay-sathi-local-dev-key")
 API_SECRET_KEYS: Final[list[str]] = [k.strip() for k in _keys_str.split(",") if k.strip()]
 
+# Bearer tokens for /admin endpoints (index reload) and /metrics; unset disables them
+_admin_keys_str = os.getenv("ADMIN_API_KEYS", "")
+ADMIN_API_KEYS: Final[list[str]] = [k.strip() for k in _admin_keys_str.split(",") if k.strip()]
+
 # Rate limit (requests per minute per IP)
 RATE_LIMIT_PER_MINUTE: Final[int] = int(os.getenv("RATE_LIMIT_PER_MINUTE", "60"))
 
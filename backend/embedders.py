@@ -0,0 +1,170 @@
+"""
+Embedding backends for Nyay Sathi.
+
+Both backends produce L2-normalized vectors for the same MiniLM model,
+so either can query the same FAISS index: "torch" runs
+sentence-transformers, "onnx" runs the int8 export written by
+scripts/export_onnx_embedder.py without torch.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Optional, Protocol
+
+import numpy as np
+
+# File names inside an exported ONNX model directory
+ONNX_MODEL_FILE = "model_quantized.onnx"
+ONNX_TOKENIZER_FILE = "tokenizer.json"
+
+EMBEDDING_BACKENDS = ("torch", "onnx")
+
+
+class Embedder(Protocol):
+    """Common interface of all embedding backends."""
+
+    name: str
+    dimension: int
+
+    def encode(
+        self,
+        texts: list[str],
+        batch_size: int = 32,
+        show_progress_bar: bool = False,
+    ) -> np.ndarray:
+        """Encode texts into an (n, dimension) array of normalized float32 vectors."""
+        ...
+
+
+class SentenceTransformerEmbedder:
+    """Embedder backed by sentence-transformers / PyTorch."""
+
+    name = "torch"
+
+    def __init__(self, model_name: str, device: Optional[str] = None):
+        from sentence_transformers import SentenceTransformer
+
+        self.model = SentenceTransformer(model_name, device=device)
+        self.dimension = self.model.get_sentence_embedding_dimension()
+
+    def encode(
+        self,
+        texts: list[str],
+        batch_size: int = 32,
+        show_progress_bar: bool = False,
+    ) -> np.ndarray:
+        return self.model.encode(
+            texts,
+            batch_size=batch_size,
+            show_progress_bar=show_progress_bar,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+        ).astype("float32")
+
+
+class OnnxEmbedder:
+    """
+    Embedder backed by ONNX Runtime.
+
+    Reproduces the sentence-transformers pipeline for MiniLM: tokenize,
+    run the transformer, mean-pool over the attention mask, L2-normalize.
+    """
+
+    name = "onnx"
+
+    def __init__(
+        self,
+        model_dir: Path,
+        max_length: int = 256,
+        num_threads: Optional[int] = None,
+    ):
+        import onnxruntime as ort
+        from tokenizers import Tokenizer
+
+        model_path = Path(model_dir) / ONNX_MODEL_FILE
+        tokenizer_path = Path(model_dir) / ONNX_TOKENIZER_FILE
+        if not model_path.exists() or not tokenizer_path.exists():
+            raise FileNotFoundError(
+                f"ONNX embedder not found in {model_dir} "
+                f"(run scripts/export_onnx_embedder.py)"
+            )
+
+        self.tokenizer = Tokenizer.from_file(str(tokenizer_path))
+        self.tokenizer.enable_truncation(max_length=max_length)
+        self.tokenizer.enable_padding()
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        options.intra_op_num_threads = num_threads or os.cpu_count() or 1
+        self.session = ort.InferenceSession(
+            str(model_path), options, providers=["CPUExecutionProvider"]
+        )
+        self._input_names = {i.name for i in self.session.get_inputs()}
+        self.dimension = self.session.get_outputs()[0].shape[-1]
+
+    def _encode_batch(self, texts: list[str]) -> np.ndarray:
+        encodings = self.tokenizer.encode_batch(texts)
+        input_ids = np.array([e.ids for e in encodings], dtype=np.int64)
+        attention_mask = np.array([e.attention_mask for e in encodings], dtype=np.int64)
+
+        feeds = {"input_ids": input_ids, "attention_mask": attention_mask}
+        if "token_type_ids" in self._input_names:
+            feeds["token_type_ids"] = np.zeros_like(input_ids)
+
+        token_embeddings = self.session.run(None, feeds)[0]
+
+        # Mean pooling over real (non-padding) tokens
+        mask = attention_mask[..., None].astype(np.float32)
+        summed = (token_embeddings * mask).sum(axis=1)
+        pooled = summed / np.clip(mask.sum(axis=1), 1e-9, None)
+
+        norms = np.linalg.norm(pooled, axis=1, keepdims=True)
+        return (pooled / np.clip(norms, 1e-12, None)).astype("float32")
+
+    def encode(
+        self,
+        texts: list[str],
+        batch_size: int = 32,
+        show_progress_bar: bool = False,
+    ) -> np.ndarray:
+        if not texts:
+            return np.empty((0, self.dimension), dtype="float32")
+
+        batches = [
+            self._encode_batch(texts[start:start + batch_size])
+            for start in range(0, len(texts), max(batch_size, 1))
+        ]
+        return np.vstack(batches)
+
+
+def create_embedder(
+    backend: str,
+    model_name: str,
+    device: Optional[str] = None,
+    onnx_model_dir: Optional[Path] = None,
+) -> Embedder:
+    """
+    Build an embedder for the given backend.
+
+    Args:
+        backend: "torch" or "onnx".
+        model_name: sentence-transformers model name (torch backend).
+        device: Torch device, or None to auto-detect (torch backend).
+        onnx_model_dir: Directory holding the exported int8 model (onnx backend).
+
+    Raises:
+        ValueError: If the backend is unknown or misconfigured.
+    """
+    if backend == "torch":
+        return SentenceTransformerEmbedder(model_name, device=device)
+
+    if backend == "onnx":
+        if onnx_model_dir is None:
+            raise ValueError("onnx backend requires onnx_model_dir")
+        return OnnxEmbedder(onnx_model_dir)
+
+    raise ValueError(
+        f"Unknown embedding backend: {backend!r} (expected one of {EMBEDDING_BACKENDS})"
+    )
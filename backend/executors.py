@@ -0,0 +1,170 @@
+"""
+Bounded thread pools for Nyay Sathi.
+
+Blocking work is kept off the event loop in named pools, one per
+workload class, instead of the loop's default executor:
+
+- "cpu": embedding, FAISS / BM25 search and re-ranking (rag_engine).
+- "io":  blocking file and disk access (index loading, on-disk caches).
+
+Each pool caps queued plus running tasks. A submission beyond the cap
+fails immediately with ExecutorSaturated instead of waiting in an
+unbounded queue, so overload shows up as rejections and a measurable
+queue depth rather than as silent tail latency.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, TypeVar
+
+import metrics
+from config import CPU_POOL_QUEUE, CPU_POOL_WORKERS, IO_POOL_QUEUE, IO_POOL_WORKERS
+from logger import app_logger as logger
+
+R = TypeVar("R")
+
+
+class ExecutorSaturated(RuntimeError):
+    """Raised when a pool already holds its maximum of queued tasks."""
+
+
+class BoundedExecutor:
+    """
+    Thread pool with a bounded queue and utilization metrics.
+
+    Args:
+        name: Pool name, used for thread and metric names.
+        max_workers: Threads running tasks.
+        max_queue: Tasks allowed to wait for a thread; submissions beyond
+            max_workers + max_queue are rejected.
+    """
+
+    def __init__(self, name: str, max_workers: int, max_queue: int):
+        self.name = name
+        self.max_workers = max(1, max_workers)
+        self.max_queue = max(0, max_queue)
+
+        self._pool = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix=f"{name}-pool"
+        )
+        self._slots = threading.BoundedSemaphore(self.max_workers + self.max_queue)
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._active = 0
+
+        self._queue_depth = metrics.gauge(f"{name}_pool_queue_depth", "Tasks waiting for a thread")
+        self._active_gauge = metrics.gauge(f"{name}_pool_active", "Tasks running")
+        self._utilization = metrics.gauge(f"{name}_pool_utilization", "Running tasks / threads")
+        self._wait = metrics.histogram(f"{name}_pool_wait_ms", "Time tasks waited for a thread")
+        self._run_time = metrics.histogram(f"{name}_pool_run_ms", "Time tasks ran")
+        self._rejected = metrics.counter(
+            f"{name}_pool_rejected", "Tasks rejected because the pool was full"
+        )
+
+    def _update_gauges(self) -> None:
+        self._queue_depth.set(self._queued)
+        self._active_gauge.set(self._active)
+        self._utilization.set(round(self._active / self.max_workers, 3))
+
+    def submit(self, fn: Callable[..., R], *args, **kwargs) -> "Future[R]":
+        """
+        Schedule fn(*args, **kwargs) on the pool.
+
+        Raises:
+            ExecutorSaturated: If the pool's queue is full.
+        """
+        if not self._slots.acquire(blocking=False):
+            self._rejected.inc()
+            raise ExecutorSaturated(
+                f"{self.name} pool is saturated ({self.max_queue} tasks queued)"
+            )
+
+        enqueued = time.perf_counter()
+        with self._lock:
+            self._queued += 1
+            self._update_gauges()
+        started_at: list[float] = []
+
+        def run() -> R:
+            started = time.perf_counter()
+            self._wait.observe((started - enqueued) * 1000)
+            with self._lock:
+                self._queued -= 1
+                self._active += 1
+                self._update_gauges()
+                started_at.append(started)
+            return fn(*args, **kwargs)
+
+        def release(_: Future) -> None:
+            # Runs however the task ends, including cancellation while still
+            # queued (run() never starts then) and shutdown(cancel_futures=True)
+            with self._lock:
+                if started_at:
+                    self._run_time.observe((time.perf_counter() - started_at[0]) * 1000)
+                    self._active -= 1
+                else:
+                    self._queued -= 1
+                self._update_gauges()
+            self._slots.release()
+
+        try:
+            future = self._pool.submit(run)
+        except RuntimeError:
+            # Pool shut down: give the slot back
+            with self._lock:
+                self._queued -= 1
+                self._update_gauges()
+            self._slots.release()
+            raise
+        future.add_done_callback(release)
+        return future
+
+    async def run(self, fn: Callable[..., R], *args, **kwargs) -> R:
+        """
+        Await fn(*args, **kwargs) on the pool from the event loop.
+
+        Raises:
+            ExecutorSaturated: If the pool's queue is full.
+        """
+        return await asyncio.wrap_future(self.submit(fn, *args, **kwargs))
+
+    def shutdown(self) -> None:
+        """Stop accepting tasks and drop the ones still queued."""
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+# =============================================================================
+# NAMED POOLS
+# =============================================================================
+
+_POOL_SIZES: dict[str, tuple[int, int]] = {
+    "cpu": (CPU_POOL_WORKERS, CPU_POOL_QUEUE),
+    "io": (IO_POOL_WORKERS, IO_POOL_QUEUE),
+}
+
+_pools: dict[str, BoundedExecutor] = {}
+_pools_lock = threading.Lock()
+
+
+def get_executor(name: str) -> BoundedExecutor:
+    """Get (creating on first use) the named pool: "cpu" or "io"."""
+    pool = _pools.get(name)
+    if pool is not None:
+        return pool
+
+    with _pools_lock:
+        if name not in _pools:
+            max_workers, max_queue = _POOL_SIZES[name]
+            _pools[name] = BoundedExecutor(name, max_workers, max_queue)
+            logger.debug(f"Started {name} pool ({max_workers} threads, queue {max_queue})")
+        return _pools[name]
+
+
+def shutdown_executors() -> None:
+    """Shut down every named pool."""
+    with _pools_lock:
+        for pool in _pools.values():
+            pool.shutdown()
+        _pools.clear()
@@ -0,0 +1,117 @@
+"""
+Metadata filters for retrieval (act, category, year).
+
+FilterIndex precomputes one bitset per act, category and year from the
+chunk metadata. A filter is resolved by AND-ing the bitsets of its
+fields, which gives both the sorted chunk ids that pass (for scoring a
+small subset directly) and a packed bitmap for faiss.IDSelectorBitmap
+(for pushing a large subset down into the FAISS search).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Iterable, Mapping, Optional
+
+import numpy as np
+
+from statutes import ACT_ALIASES, act_key
+
+
+@dataclass(frozen=True)
+class SearchFilter:
+    """Restricts retrieval to chunks of one act, category and/or year."""
+    act: Optional[str] = None
+    category: Optional[str] = None
+    year: Optional[int] = None
+
+    @classmethod
+    def from_dict(cls, values: Optional[Mapping[str, Any]]) -> Optional["SearchFilter"]:
+        """
+        Build a filter from tool / API arguments.
+
+        Returns:
+            The filter, or None if no field is set.
+        """
+        if not values:
+            return None
+        year = values.get("year")
+        search_filter = cls(
+            act=(values.get("act") or None),
+            category=(values.get("category") or None),
+            year=int(year) if year not in (None, "") else None,
+        )
+        return None if search_filter == cls() else search_filter
+
+
+@dataclass(frozen=True)
+class FilterMatch:
+    """Chunks that pass a filter."""
+    ids: np.ndarray
+    bitmap: np.ndarray
+
+    def __len__(self) -> int:
+        return int(self.ids.size)
+
+    def __contains__(self, chunk_id: int) -> bool:
+        return bool(self.bitmap[chunk_id >> 3] >> (chunk_id & 7) & 1)
+
+    def __or__(self, other: "FilterMatch") -> "FilterMatch":
+        """Chunks passing either filter."""
+        return FilterMatch(ids=np.union1d(self.ids, other.ids), bitmap=self.bitmap | other.bitmap)
+
+
+class FilterIndex:
+    """Per-value bitsets over chunk ids for act, category and year."""
+
+    def __init__(self, records: Iterable[Mapping]):
+        acts: dict[str, list[int]] = {}
+        categories: dict[str, list[int]] = {}
+        years: dict[int, list[int]] = {}
+
+        n = 0
+        for chunk_id, record in enumerate(records):
+            n = chunk_id + 1
+            acts.setdefault(act_key(record.get("act_name", "")), []).append(chunk_id)
+            categories.setdefault(str(record.get("category", "")).casefold(), []).append(chunk_id)
+            if record.get("act_year"):
+                years.setdefault(int(record["act_year"]), []).append(chunk_id)
+
+        self.n = n
+        self._acts = {key: self._mask(ids) for key, ids in acts.items()}
+        self._categories = {key: self._mask(ids) for key, ids in categories.items()}
+        self._years = {key: self._mask(ids) for key, ids in years.items()}
+
+    def _mask(self, ids: list[int]) -> np.ndarray:
+        mask = np.zeros(self.n, dtype=bool)
+        mask[ids] = True
+        return mask
+
+    def _act_mask(self, act: str) -> np.ndarray:
+        """Acts matching a name or alias ("IT Act", "Bharatiya Nyaya Sanhita, 2023")."""
+        key = ACT_ALIASES.get(act.strip().lower(), act_key(act))
+        if key in self._acts:
+            return self._acts[key]
+
+        # Partial names ("nyaya sanhita") match every act whose key contains them
+        mask = np.zeros(self.n, dtype=bool)
+        padded = f" {key} "
+        for name, act_mask in self._acts.items():
+            if key and padded in f" {name} ":
+                mask |= act_mask
+        return mask
+
+    def resolve(self, search_filter: SearchFilter) -> FilterMatch:
+        """Chunk ids and packed bitmap for the chunks passing a filter."""
+        mask = np.ones(self.n, dtype=bool)
+        if search_filter.act:
+            mask &= self._act_mask(search_filter.act)
+        if search_filter.category:
+            mask &= self._categories.get(search_filter.category.casefold(), False)
+        if search_filter.year is not None:
+            mask &= self._years.get(search_filter.year, False)
+
+        return FilterMatch(
+            ids=np.flatnonzero(mask).astype(np.int64),
+            bitmap=np.packbits(mask, bitorder="little"),
+        )
@@ -0,0 +1,190 @@
+"""
+Lexical (BM25) retrieval and rank fusion for Nyay Sathi.
+
+Legal queries lean on exact tokens ("498A", "Section 420", "FIR") that
+dense MiniLM embeddings handle poorly. BM25Index keeps precomputed BM25
+term weights in a compressed sparse column matrix, so scoring a query is
+a gather over the postings of its terms plus one np.bincount.
+"""
+
+from __future__ import annotations
+
+import re
+from collections import Counter
+from pathlib import Path
+from typing import Iterable, Optional
+
+import numpy as np
+from scipy import sparse
+
+_TOKEN_RE = re.compile(r"[0-9a-z]+")
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase alphanumeric tokens; keeps section numbers like "498a" intact."""
+    return _TOKEN_RE.findall(text.casefold())
+
+
+class BM25Index:
+    """
+    BM25 index over a fixed document collection.
+
+    Args:
+        weights: (n_docs, n_terms) CSC matrix of precomputed BM25 weights.
+        vocabulary: Term -> column mapping.
+    """
+
+    def __init__(self, weights: sparse.csc_matrix, vocabulary: dict[str, int]):
+        self.weights = weights.tocsc()
+        self.vocabulary = vocabulary
+        self.n_docs = self.weights.shape[0]
+
+    @classmethod
+    def build(cls, texts: Iterable[str], k1: float = 1.5, b: float = 0.75) -> "BM25Index":
+        """
+        Build the index from document texts.
+
+        Args:
+            texts: Document texts, in index order.
+            k1: Term-frequency saturation.
+            b: Length normalization strength.
+        """
+        vocabulary: dict[str, int] = {}
+        rows: list[int] = []
+        cols: list[int] = []
+        counts: list[int] = []
+        doc_lengths: list[int] = []
+
+        for doc_id, text in enumerate(texts):
+            tokens = tokenize(text)
+            doc_lengths.append(len(tokens))
+            for term, tf in Counter(tokens).items():
+                rows.append(doc_id)
+                cols.append(vocabulary.setdefault(term, len(vocabulary)))
+                counts.append(tf)
+
+        n_docs = len(doc_lengths)
+        tf = sparse.csr_matrix(
+            (np.asarray(counts, dtype=np.float32), (rows, cols)),
+            shape=(n_docs, len(vocabulary)),
+        )
+
+        lengths = np.asarray(doc_lengths, dtype=np.float32)
+        avg_length = float(lengths.mean()) if n_docs else 0.0
+        df = np.bincount(tf.indices, minlength=len(vocabulary)).astype(np.float32)
+        idf = np.log1p((n_docs - df + 0.5) / (df + 0.5))
+
+        # BM25 term weight, computed once per (doc, term) posting
+        tf_values = tf.data
+        row_of_value = np.repeat(np.arange(n_docs), np.diff(tf.indptr))
+        norm = k1 * (1 - b + b * lengths[row_of_value] / max(avg_length, 1e-9))
+        tf.data = (idf[tf.indices] * tf_values * (k1 + 1) / (tf_values + norm)).astype(np.float32)
+
+        return cls(tf.tocsc(), vocabulary)
+
+    def save(self, path: Path) -> None:
+        """Save as a compressed .npz (CSC arrays + vocabulary)."""
+        terms = np.empty(len(self.vocabulary), dtype=object)
+        for term, col in self.vocabulary.items():
+            terms[col] = term
+        np.savez_compressed(
+            path,
+            data=self.weights.data,
+            indices=self.weights.indices,
+            indptr=self.weights.indptr,
+            shape=np.asarray(self.weights.shape),
+            terms=terms.astype(str),
+        )
+
+    @classmethod
+    def load(cls, path: Path) -> "BM25Index":
+        """Load an index written by save()."""
+        with np.load(path, allow_pickle=False) as f:
+            weights = sparse.csc_matrix(
+                (f["data"], f["indices"], f["indptr"]), shape=tuple(f["shape"])
+            )
+            vocabulary = {str(term): col for col, term in enumerate(f["terms"])}
+        return cls(weights, vocabulary)
+
+    def score(self, query: str) -> np.ndarray:
+        """BM25 score of every document for the query (zeros when no term matches)."""
+        cols = sorted({self.vocabulary[t] for t in tokenize(query) if t in self.vocabulary})
+        if not cols:
+            return np.zeros(self.n_docs, dtype=np.float32)
+
+        indptr = self.weights.indptr
+        spans = [np.arange(indptr[c], indptr[c + 1]) for c in cols]
+        postings = np.concatenate(spans)
+        return np.bincount(
+            self.weights.indices[postings],
+            weights=self.weights.data[postings],
+            minlength=self.n_docs,
+        ).astype(np.float32)
+
+    def search(
+        self,
+        query: str,
+        top_n: int,
+        ids: Optional[np.ndarray] = None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Top documents for a query.
+
+        Args:
+            query: Query text.
+            top_n: Maximum number of documents.
+            ids: Optional document ids to restrict the search to.
+
+        Returns:
+            Tuple of (doc ids, scores), best first; only documents with a
+            positive score are returned.
+        """
+        scores = self.score(query)
+        if ids is not None:
+            allowed = np.zeros_like(scores)
+            allowed[ids] = scores[ids]
+            scores = allowed
+        candidates = np.flatnonzero(scores)
+        if candidates.size > top_n:
+            part = np.argpartition(-scores[candidates], top_n - 1)[:top_n]
+            candidates = candidates[part]
+        order = np.argsort(-scores[candidates], kind="stable")
+        ids = candidates[order]
+        return ids, scores[ids]
+
+
+def reciprocal_rank_fusion(
+    rankings: list[np.ndarray], k: int = 60
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Fuse ranked id lists with reciprocal-rank fusion.
+
+    Each list contributes 1 / (k + rank) to every id it contains (rank
+    starts at 1); ids missing from a list get nothing from it.
+
+    Args:
+        rankings: Id arrays, each ordered best first. Negative ids are ignored.
+        k: RRF damping constant.
+
+    Returns:
+        Tuple of (ids, fused scores), best first.
+    """
+    ids_parts = []
+    score_parts = []
+    for ranking in rankings:
+        ranking = np.asarray(ranking)
+        valid = ranking >= 0
+        ranks = np.arange(1, ranking.size + 1)[valid]
+        ids_parts.append(ranking[valid])
+        score_parts.append(1.0 / (k + ranks))
+
+    if not ids_parts or not any(p.size for p in ids_parts):
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64)
+
+    all_ids = np.concatenate(ids_parts).astype(np.int64)
+    all_scores = np.concatenate(score_parts)
+    unique_ids, inverse = np.unique(all_ids, return_inverse=True)
+    fused = np.bincount(inverse, weights=all_scores)
+
+    order = np.argsort(-fused, kind="stable")
+    return unique_ids[order], fused[order]
@@ -0,0 +1,84 @@
+"""
+Shared async LLM client for Nyay Sathi.
+
+A single AsyncGroq client with a pooled keep-alive HTTP connection is
+created in the application lifespan and reused by every agent request,
+so LLM round-trips never block the event loop.
+"""
+
+from typing import Optional
+
+import httpx
+from groq import AsyncGroq, DefaultAsyncHttpxClient
+
+from config import (
+    GROQ_API_KEY,
+    LLM_KEEPALIVE_EXPIRY,
+    LLM_MAX_CONNECTIONS,
+    LLM_MAX_KEEPALIVE_CONNECTIONS,
+    LLM_MAX_RETRIES,
+    LLM_TIMEOUT,
+)
+from logger import app_logger as logger
+
+_client: Optional[AsyncGroq] = None
+
+
+def init_llm_client() -> Optional[AsyncGroq]:
+    """
+    Create the process-wide async LLM client.
+
+    Safe to call more than once; an existing client is reused.
+
+    Returns:
+        The client, or None if GROQ_API_KEY is not configured.
+    """
+    global _client
+
+    if _client is not None:
+        return _client
+
+    if not GROQ_API_KEY:
+        logger.warning("GROQ_API_KEY not set - LLM client disabled")
+        return None
+
+    http_client = DefaultAsyncHttpxClient(
+        limits=httpx.Limits(
+            max_connections=LLM_MAX_CONNECTIONS,
+            max_keepalive_connections=LLM_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=LLM_KEEPALIVE_EXPIRY,
+        ),
+        timeout=LLM_TIMEOUT,
+    )
+    _client = AsyncGroq(
+        api_key=GROQ_API_KEY,
+        http_client=http_client,
+        max_retries=LLM_MAX_RETRIES,
+    )
+    logger.info(
+        f"Async LLM client initialized "
+        f"(pool: {LLM_MAX_CONNECTIONS} connections, {LLM_MAX_KEEPALIVE_CONNECTIONS} keep-alive)"
+    )
+    return _client
+
+
+def get_llm_client() -> Optional[AsyncGroq]:
+    """
+    Return the shared async LLM client.
+
+    Falls back to lazy creation when the lifespan hook did not run
+    (e.g. when the agent is driven directly from a script).
+    """
+    if _client is None:
+        return init_llm_client()
+    return _client
+
+
+async def close_llm_client() -> None:
+    """Close the shared client and release its pooled connections."""
+    global _client
+
+    if _client is not None:
+        await _client.close()
+        _client = None
+        logger.info("Async LLM client closed")
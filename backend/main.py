@@ -15,19 +15,34 @@ Features:
 import asyncio
 import json
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator, List, Optional
+from typing import Any, AsyncGenerator, List, Optional
 
 from fastapi import Depends, FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
 
-from auth import verify_api_key
-from config import CORS_ORIGINS, RATE_LIMIT_PER_MINUTE
+import metrics
+from answer_store import PersistentAnswerCache, cache_key
+from auth import verify_admin_key, verify_api_key
+from config import (
+    CORS_ORIGINS,
+    DEVICE,
+    GROQ_MODEL,
+    INDEX_RELOAD_POLL_SECONDS,
+    PERSISTENT_CACHE_ENABLED,
+    PERSISTENT_CACHE_MAX_MB,
+    PERSISTENT_CACHE_PATH,
+    PERSISTENT_CACHE_TTL,
+    RATE_LIMIT_PER_MINUTE,
+    WARMUP_ENABLED,
+)
+from executors import ExecutorSaturated, get_executor, shutdown_executors
+from llm_client import close_llm_client, init_llm_client
 from logger import app_logger as logger
-from rag_engine import initialize_rag
+from rag_engine import get_index_version, initialize_rag, reload_index, warmup_rag
 from rate_limiter import RateLimitMiddleware
-from sanitizer import validate_query
+from sanitizer import canonicalize_query, validate_query
 
 
 # =============================================================================
@@ -61,6 +76,7 @@ class AskResponse(BaseModel):
     answer: str
     tokens_in: int = 0
     tokens_out: int = 0
+    cached: bool = False  # served from the answer cache without an LLM call
     local_sources: List[LocalSource]
     web_sources: List[WebSource]
     disclaimer: str = "This information is for educational purposes only and does not constitute legal advice."
@@ -73,6 +89,24 @@ class HealthResponse(BaseModel):
     version: str
     vectors_loaded: int
     device: str
+    index_version: Optional[str] = None
+
+
+class ReadinessResponse(BaseModel):
+    """Readiness check response."""
+    status: str  # "starting" | "ready" | "failed"
+    vectors_loaded: int
+    startup_seconds: Optional[float] = None
+    detail: Optional[str] = None
+
+
+class ReloadResponse(BaseModel):
+    """Index reload result."""
+    status: str  # "reloaded" | "unchanged" | "rejected"
+    previous: str
+    version: str
+    vectors: int
+    seconds: float
 
 
 class ErrorResponse(BaseModel):
@@ -85,26 +119,151 @@ class ErrorResponse(BaseModel):
 # LIFECYCLE
 # =============================================================================
 
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    """Application lifecycle manager."""
-    # Startup
-    logger.info("Starting Nyay Sathi Backend v2.0...")
+async def _warm_up(app: FastAPI) -> None:
+    """
+    Load the RAG artifacts and embedder, then run warm-up queries.
+
+    Runs in the background so liveness (/health) answers immediately;
+    readiness (/ready) turns green only once the worker is hot.
+    """
+    loop = asyncio.get_running_loop()
+    started = loop.time()
     try:
-        from config import DEVICE
-        vector_count = initialize_rag()
+        vector_count = await get_executor("io").run(initialize_rag, load_embedder=True)
         app.state.vectors_loaded = vector_count
         app.state.device = DEVICE
-        logger.info(f"RAG system ready with {vector_count} vectors on {DEVICE}")
+        if WARMUP_ENABLED:
+            await get_executor("cpu").run(warmup_rag)
+        app.state.readiness = "ready"
+        app.state.startup_seconds = round(loop.time() - started, 2)
+        logger.info(
+            f"RAG system ready with {vector_count} vectors on {DEVICE} "
+            f"({app.state.startup_seconds}s)"
+        )
     except Exception as e:
         logger.error(f"Failed to initialize RAG: {e}")
         app.state.vectors_loaded = 0
         app.state.device = "unavailable"
+        app.state.readiness = "failed"
+        app.state.startup_error = str(e)
+
+
+async def _watch_index(app: FastAPI) -> None:
+    """
+    Poll manifest.json and hot-reload the index when it has been rebuilt.
+
+    The build script writes the manifest last, so a changed manifest means
+    a complete new version. Each worker process polls on its own, which
+    also reloads the workers an /admin/reload request did not reach.
+    """
+    while True:
+        await asyncio.sleep(INDEX_RELOAD_POLL_SECONDS)
+        if getattr(app.state, "readiness", "starting") != "ready":
+            continue
+        try:
+            result = await get_executor("io").run(reload_index)
+        except Exception as e:
+            logger.warning(f"Index reload failed: {e}")
+            continue
+        if result["status"] == "reloaded":
+            app.state.vectors_loaded = result["vectors"]
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application lifecycle manager."""
+    # Startup
+    logger.info("Starting Nyay Sathi Backend v2.0...")
+    app.state.readiness = "starting"
+    app.state.vectors_loaded = 0
+    app.state.device = DEVICE
+    warm_up = asyncio.create_task(_warm_up(app))
+    watcher = asyncio.create_task(_watch_index(app)) if INDEX_RELOAD_POLL_SECONDS > 0 else None
+
+    # Shared async LLM client (pooled keep-alive connections)
+    init_llm_client()
+
+    # Response cache shared by all workers on this host
+    app.state.answer_store = None
+    if PERSISTENT_CACHE_ENABLED:
+        try:
+            app.state.answer_store = PersistentAnswerCache(
+                PERSISTENT_CACHE_PATH,
+                max_bytes=int(PERSISTENT_CACHE_MAX_MB * 1024 * 1024),
+                ttl=PERSISTENT_CACHE_TTL,
+            )
+            logger.info(f"Persistent answer cache at {PERSISTENT_CACHE_PATH}")
+        except Exception as e:
+            logger.warning(f"Persistent answer cache unavailable: {e}")
 
     yield
 
     # Shutdown
     logger.info("Shutting down Nyay Sathi Backend...")
+    warm_up.cancel()
+    if watcher is not None:
+        watcher.cancel()
+    await close_llm_client()
+    shutdown_executors()
+
+
+def require_ready(request: Request) -> None:
+    """
+    Reject questions while the worker is still warming up.
+
+    A worker whose startup failed keeps answering (web search and
+    fallback answers still work); /ready reports it as not ready.
+    """
+    if getattr(request.app.state, "readiness", "starting") == "starting":
+        raise HTTPException(
+            status_code=503,
+            detail="Service is warming up, retry shortly",
+            headers={"Retry-After": "5"},
+        )
+
+
+# =============================================================================
+# PERSISTENT ANSWER CACHE
+# =============================================================================
+
+# Only answers grounded in tool results are stored
+_CACHEABLE_MODES = ("grounded", "hybrid")
+# Stream events saved for replay (status / thinking updates are not)
+_REPLAYED_EVENTS = ("tool_start", "tool_result", "sources", "answer")
+
+
+def _response_key(kind: str, question: str) -> Optional[str]:
+    """
+    Persistent cache key of a response: endpoint kind, normalized
+    question, LLM model and index version (None before the index loads).
+    """
+    version = get_index_version()
+    if not version:
+        return None
+    return cache_key(kind, canonicalize_query(question), GROQ_MODEL, version)
+
+
+async def _load_response(app: FastAPI, key: Optional[str]) -> Optional[Any]:
+    """Cached response for key, or None; cache errors count as misses."""
+    store = getattr(app.state, "answer_store", None)
+    if store is None or key is None:
+        return None
+    try:
+        return await get_executor("io").run(store.get, key)
+    except Exception as e:
+        logger.warning(f"Answer cache read failed: {e}")
+        return None
+
+
+async def _save_response(app: FastAPI, key: Optional[str], value: Any) -> None:
+    """Store a response; failures are logged and otherwise ignored."""
+    store = getattr(app.state, "answer_store", None)
+    if store is None or key is None:
+        return
+    try:
+        await get_executor("io").run(store.set, key, value)
+    except Exception as e:
+        logger.warning(f"Answer cache write failed: {e}")
 
 
 # =============================================================================
@@ -144,6 +303,17 @@ async def http_exception_handler(request: Request, exc: HTTPException):
     return JSONResponse(
         status_code=exc.status_code,
         content={"error": exc.detail},
+        headers=exc.headers,
+    )
+
+
+@app.exception_handler(ExecutorSaturated)
+async def saturated_exception_handler(request: Request, exc: ExecutorSaturated):
+    logger.warning(f"Rejected {request.url.path}: {exc}")
+    return JSONResponse(
+        status_code=503,
+        content={"error": "Server is busy, retry shortly"},
+        headers={"Retry-After": "2"},
     )
 
 
@@ -160,6 +330,7 @@ def health_check(request: Request) -> HealthResponse:
         version="2.0.0",
         vectors_loaded=getattr(request.app.state, "vectors_loaded", 0),
         device=getattr(request.app.state, "device", "unknown"),
+        index_version=get_index_version() or None,
     )
 
 
@@ -172,9 +343,30 @@ def detailed_health(request: Request) -> HealthResponse:
         version="2.0.0",
         vectors_loaded=getattr(request.app.state, "vectors_loaded", 0),
         device=getattr(request.app.state, "device", "unknown"),
+        index_version=get_index_version() or None,
     )
 
 
+@app.get("/ready", response_model=ReadinessResponse)
+def readiness_check(request: Request) -> JSONResponse:
+    """Readiness check: 200 once the index and models are loaded and warm (public)."""
+    state = request.app.state
+    readiness = getattr(state, "readiness", "starting")
+    body = ReadinessResponse(
+        status=readiness,
+        vectors_loaded=getattr(state, "vectors_loaded", 0),
+        startup_seconds=getattr(state, "startup_seconds", None),
+        detail=getattr(state, "startup_error", None),
+    )
+    return JSONResponse(status_code=200 if readiness == "ready" else 503, content=body.model_dump())
+
+
+@app.get("/metrics")
+def get_metrics(_token: str = Depends(verify_admin_key)) -> dict:
+    """In-process performance metrics (admin key; 404 when ADMIN_API_KEYS is unset)."""
+    return metrics.snapshot()
+
+
 # =============================================================================
 # PROTECTED ENDPOINTS
 # =============================================================================
@@ -182,12 +374,16 @@ def detailed_health(request: Request) -> HealthResponse:
 @app.post("/ask", response_model=AskResponse)
 async def ask_question(
     request: AskRequest,
+    http_request: Request,
     _token: str = Depends(verify_api_key),
+    _ready: None = Depends(require_ready),
 ) -> AskResponse:
     """
     Answer a legal question using RAG.
 
-    Requires Bearer token authentication.
+    Requires Bearer token authentication. A question already answered
+    for the current model and index is served from the persistent
+    answer cache ("cached": true) without any further work.
 
     Args:
         request: The question request.
@@ -195,12 +391,18 @@ async def ask_question(
     Returns:
         Answer with sources and confidence level.
     """
-    # Validate and sanitize input
+    # Validate and sanitize input before anything is served, cached or not
     is_valid, sanitized_query, error = validate_query(request.question)
 
     if not is_valid:
         raise HTTPException(status_code=400, detail=error)
 
+    key = _response_key("ask", sanitized_query)
+    cached = await _load_response(http_request.app, key)
+    if cached is not None:
+        logger.info("Response served from persistent cache")
+        return AskResponse(**{**cached, "cached": True, "tokens_in": 0, "tokens_out": 0})
+
     logger.info(f"Processing query: {sanitized_query[:50]}...")
 
     # Process query through agentic pipeline
@@ -246,21 +448,27 @@ async def ask_question(
 
     logger.info(f"Response: mode={mode}, tools={[t['name'] for t in result.get('tools_used', [])]}")
 
-    return AskResponse(
+    response = AskResponse(
         mode=mode,
         confidence=confidence_str,
         answer=result.get("answer", "No answer"),
         tokens_in=result.get("tokens_in", 0),
         tokens_out=result.get("tokens_out", 0),
+        cached=result.get("cached", False),
         local_sources=local_sources,
         web_sources=web_sources,
     )
+    if mode in _CACHEABLE_MODES:
+        await _save_response(http_request.app, key, response.model_dump())
+    return response
 
 
 @app.post("/ask/stream")
 async def ask_question_stream(
     request: AskRequest,
+    http_request: Request,
     _token: str = Depends(verify_api_key),
+    _ready: None = Depends(require_ready),
 ):
     """
     Stream answer with real-time status updates using Server-Sent Events.
@@ -268,14 +476,34 @@ async def ask_question_stream(
     Events:
     - status: Progress updates (thinking, searching, etc.)
     - tool: Tool execution details
-    - answer: Final answer
+    - answer_delta: Answer text as the model generates it
+    - answer_reset: Discard the answer_delta text received so far
+    - answer: Final answer ("cached": true when replayed from the answer cache)
     - sources: Source information
     - done: Completion signal
+
+    A question already answered for the current model and index replays
+    the saved tool, sources and answer events from the persistent cache,
+    with the whole answer sent as one answer_delta before the answer.
     """
-    # Validate and sanitize input
+    # Validate and sanitize input before anything is served, cached or not
     is_valid, sanitized_query, error = validate_query(request.question)
     if not is_valid:
         raise HTTPException(status_code=400, detail=error)
+
+    key = _response_key("stream", sanitized_query)
+    cached = await _load_response(http_request.app, key)
+    if cached is not None:
+        logger.info("[Stream] Replaying response from persistent cache")
+        return StreamingResponse(
+            _replay_events(cached),
+            media_type="text/event-stream",
+            headers={
+                "Cache-Control": "no-cache",
+                "Connection": "keep-alive",
+                "X-Accel-Buffering": "no",
+            }
+        )
     
     logger.info(f"[Stream] Processing: {sanitized_query[:50]}...")
     
@@ -283,12 +511,20 @@ async def ask_question_stream(
         """Generate SSE events."""
         from agent import run_agent_streaming
         
+        # Tool, sources and answer events are saved for replay
+        replay = []
         try:
             async for event in run_agent_streaming(sanitized_query):
                 event_type = event.get("type", "status")
+                if event_type in _REPLAYED_EVENTS:
+                    replay.append(event)
                 data = json.dumps(event, ensure_ascii=False)
                 yield f"event: {event_type}\ndata: {data}\n\n"
             
+            final = replay[-1] if replay else {}
+            if final.get("type") == "answer" and final.get("mode") in _CACHEABLE_MODES:
+                await _save_response(http_request.app, key, replay)
+
             yield f"event: done\ndata: {{}}\n\n"
             
         except Exception as e:
@@ -306,6 +542,51 @@ async def ask_question_stream(
     )
 
 
+@app.post("/admin/reload", response_model=ReloadResponse)
+async def admin_reload_index(
+    request: Request,
+    force: bool = False,
+    _token: str = Depends(verify_admin_key),
+) -> ReloadResponse:
+    """
+    Load, validate and atomically swap in a rebuilt index.
+
+    Requires an admin Bearer token (ADMIN_API_KEYS). Queries keep being
+    served during the reload; in-flight ones finish on the old version.
+    Only the worker process that receives the request reloads here, the
+    others pick the new version up through manifest polling.
+
+    Args:
+        force: Reload even if the index version looks unchanged.
+    """
+    if getattr(request.app.state, "readiness", "starting") != "ready":
+        raise HTTPException(status_code=409, detail="Index is not loaded yet")
+
+    try:
+        result = await get_executor("io").run(reload_index, force)
+    except ExecutorSaturated:
+        raise
+    except (FileNotFoundError, RuntimeError) as e:
+        raise HTTPException(status_code=409, detail=f"Reload rejected: {e}")
+
+    request.app.state.vectors_loaded = result["vectors"]
+    return ReloadResponse(**result)
+
+
+async def _replay_events(events: list[dict]) -> AsyncGenerator[str, None]:
+    """SSE stream of a cached response."""
+    status = {"type": "status", "message": "Found a saved answer", "icon": "⚡"}
+    yield f"event: status\ndata: {json.dumps(status, ensure_ascii=False)}\n\n"
+    for event in events:
+        if event["type"] == "answer":
+            # Clients that render the answer from deltas get it in one piece
+            delta = {"type": "answer_delta", "text": event["text"]}
+            yield f"event: answer_delta\ndata: {json.dumps(delta, ensure_ascii=False)}\n\n"
+            event = {**event, "cached": True, "tokens_in": 0, "tokens_out": 0}
+        yield f"event: {event['type']}\ndata: {json.dumps(event, ensure_ascii=False)}\n\n"
+    yield "event: done\ndata: {}\n\n"
+
+
 @app.get("/sources")
 async def list_sources(_token: str = Depends(verify_api_key)) -> dict:
     """
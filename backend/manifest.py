@@ -0,0 +1,111 @@
+"""
+Index artifact manifest for Nyay Sathi.
+
+The build script records the size and SHA-256 of every artifact the API
+loads (FAISS index, metadata store, BM25 index) in manifest.json next to
+them. At startup the API can check the files it is about to memory-map
+against that manifest, so a truncated copy or a half-finished rebuild is
+caught before any worker serves queries from it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+MANIFEST_FILE = "manifest.json"
+MANIFEST_VERSION = 1
+
+
+def file_sha256(path: Path, chunk_size: int = 1 << 20) -> str:
+    """SHA-256 hex digest of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(chunk_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _expand(paths: Iterable[Path]) -> list[Path]:
+    """Files under the given paths (directories are walked recursively)."""
+    files = []
+    for path in paths:
+        path = Path(path)
+        if path.is_dir():
+            files.extend(sorted(p for p in path.rglob("*") if p.is_file()))
+        elif path.exists():
+            files.append(path)
+    return files
+
+
+def write_manifest(root: Path, paths: Iterable[Path], **info: Any) -> dict:
+    """
+    Write manifest.json for artifacts under root.
+
+    Args:
+        root: Directory the manifest is written to; file keys are relative to it.
+        paths: Artifact files or directories to record.
+        **info: Extra top-level fields (e.g. embedding model, vector count).
+
+    Returns:
+        The manifest that was written.
+    """
+    root = Path(root)
+    manifest: dict[str, Any] = {
+        "version": MANIFEST_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        **info,
+        "files": {},
+    }
+    for path in _expand(paths):
+        manifest["files"][path.relative_to(root).as_posix()] = {
+            "size": path.stat().st_size,
+            "sha256": file_sha256(path),
+        }
+
+    # Written aside and renamed: servers polling the manifest never read half of it
+    path = root / MANIFEST_FILE
+    tmp = path.with_name(f".{MANIFEST_FILE}.tmp")
+    tmp.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    os.replace(tmp, path)
+    return manifest
+
+
+def load_manifest(root: Path) -> Optional[dict]:
+    """Read manifest.json from root (None if there is none)."""
+    path = Path(root) / MANIFEST_FILE
+    if not path.exists():
+        return None
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def verify_manifest(root: Path, manifest: dict, checksum: bool = False) -> list[str]:
+    """
+    Check artifacts under root against a manifest.
+
+    Args:
+        root: Directory the manifest's file keys are relative to.
+        manifest: Manifest from load_manifest().
+        checksum: Also compare SHA-256 digests (reads every byte);
+            otherwise only sizes are compared.
+
+    Returns:
+        Human-readable problems, empty when every file matches.
+    """
+    problems = []
+    for name, expected in manifest.get("files", {}).items():
+        path = Path(root) / name
+        if not path.exists():
+            problems.append(f"{name}: missing")
+            continue
+        size = path.stat().st_size
+        if size != expected["size"]:
+            problems.append(f"{name}: size {size} != {expected['size']}")
+            continue
+        if checksum and file_sha256(path) != expected["sha256"]:
+            problems.append(f"{name}: sha256 mismatch")
+    return problems
@@ -0,0 +1,305 @@
+"""
+Columnar, memory-mapped chunk metadata for Nyay Sathi.
+
+The store is a directory of flat column files (schema.json plus one set
+of .bin / .npy / .zst files per field) that every worker maps read-only,
+so the OS page cache holds one shared copy. Rows are read lazily through
+ChunkRecord, which decodes a field only when it is accessed; zstd fields
+(the chunk text) decompress only the block holding the requested row.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from collections import OrderedDict
+from collections.abc import Iterator, Mapping
+from pathlib import Path
+from typing import Any, Optional, Sequence
+
+import numpy as np
+
+SCHEMA_FILE = "schema.json"
+SCHEMA_VERSION = 1
+
+# Low-cardinality fields stored as codes into a value table
+INTERNED_FIELDS = ("act_name", "category")
+# Integer fields stored as fixed-width columns
+INT_FIELDS = ("act_year",)
+# String fields that may be stored zstd-compressed
+COMPRESSIBLE_FIELDS = ("text",)
+
+
+def _write_compressed(
+    path: Path, field: str, encoded: list[bytes], block_rows: int, level: int
+) -> None:
+    """Write a string field as independently decompressible zstd blocks."""
+    import zstandard
+
+    compressor = zstandard.ZstdCompressor(level=level)
+    frames = [
+        compressor.compress(b"".join(encoded[start:start + block_rows]))
+        for start in range(0, len(encoded), block_rows)
+    ]
+    blocks = np.zeros(len(frames) + 1, dtype=np.int64)
+    np.cumsum([len(f) for f in frames], out=blocks[1:])
+    (path / f"{field}.zst").write_bytes(b"".join(frames))
+    np.save(path / f"{field}.blocks.npy", blocks)
+
+
+def write_metadata_store(
+    records: Sequence[Mapping[str, Any]],
+    path: Path,
+    compression: Optional[str] = None,
+    block_rows: int = 32,
+    level: int = 9,
+) -> None:
+    """
+    Write chunk records as a columnar store.
+
+    Args:
+        records: Chunk metadata records, in index order.
+        path: Output directory (created if needed; a previous store there
+            is replaced).
+        compression: "zstd" to compress COMPRESSIBLE_FIELDS, or None.
+        block_rows: Rows per compressed block; a read decompresses one block.
+        level: zstd compression level.
+    """
+    if compression not in (None, "none", "zstd"):
+        raise ValueError(f"Unknown metadata compression: {compression!r}")
+    path = Path(path)
+    path.mkdir(parents=True, exist_ok=True)
+    # Drop files of a previous store (e.g. text.bin when switching to zstd);
+    # unlinking leaves any reader's existing mappings intact
+    for old in path.iterdir():
+        if old.is_file() and (old.name == SCHEMA_FILE or old.suffix in (".bin", ".npy", ".zst")):
+            old.unlink()
+
+    fields: list[str] = []
+    for record in records:
+        for key in record:
+            if key not in fields:
+                fields.append(key)
+
+    schema: dict[str, Any] = {
+        "version": SCHEMA_VERSION,
+        "count": len(records),
+        "fields": {},
+    }
+
+    for field in fields:
+        values = [record.get(field) for record in records]
+
+        if field in INT_FIELDS:
+            column = np.array([int(v or 0) for v in values], dtype=np.int64)
+            np.save(path / f"{field}.npy", column)
+            schema["fields"][field] = {"kind": "int"}
+
+        elif field in INTERNED_FIELDS:
+            table: dict[str, int] = {}
+            codes = [table.setdefault("" if v is None else str(v), len(table)) for v in values]
+            dtype = np.uint16 if len(table) <= np.iinfo(np.uint16).max else np.uint32
+            np.save(path / f"{field}.codes.npy", np.asarray(codes, dtype=dtype))
+            schema["fields"][field] = {"kind": "interned", "values": list(table)}
+
+        else:
+            encoded = [("" if v is None else str(v)).encode("utf-8") for v in values]
+            offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+            np.cumsum([len(b) for b in encoded], out=offsets[1:])
+            np.save(path / f"{field}.offsets.npy", offsets)
+            if compression == "zstd" and field in COMPRESSIBLE_FIELDS:
+                _write_compressed(path, field, encoded, block_rows, level)
+                schema["fields"][field] = {"kind": "zstd", "block_rows": block_rows}
+            else:
+                (path / f"{field}.bin").write_bytes(b"".join(encoded))
+                schema["fields"][field] = {"kind": "string"}
+
+    (path / SCHEMA_FILE).write_text(
+        json.dumps(schema, ensure_ascii=False, indent=2), encoding="utf-8"
+    )
+
+
+class MetadataStore:
+    """
+    Read-only, memory-mapped view of a columnar metadata store.
+
+    Supports len() and integer indexing like the list of dicts it replaces.
+
+    Args:
+        path: Store directory.
+        block_cache: Decompressed blocks of compressed fields kept in memory.
+    """
+
+    def __init__(self, path: Path, block_cache: int = 64):
+        self.path = Path(path)
+        schema = json.loads((self.path / SCHEMA_FILE).read_text(encoding="utf-8"))
+        if schema.get("version") != SCHEMA_VERSION:
+            raise ValueError(f"Unsupported metadata store version: {schema.get('version')}")
+
+        self._count: int = schema["count"]
+        self._kinds: dict[str, str] = {}
+        self._tables: dict[str, list[str]] = {}
+        self._columns: dict[str, np.ndarray] = {}
+        self._blobs: dict[str, Any] = {}
+        self._block_index: dict[str, np.ndarray] = {}
+        self._block_rows: dict[str, int] = {}
+
+        self._block_cache: OrderedDict[tuple[str, int], bytes] = OrderedDict()
+        self._block_cache_size = max(1, block_cache)
+        self._block_lock = threading.Lock()
+        self._local = threading.local()
+
+        for field, spec in schema["fields"].items():
+            kind = spec["kind"]
+            self._kinds[field] = kind
+            if kind == "int":
+                self._columns[field] = np.load(self.path / f"{field}.npy", mmap_mode="r")
+            elif kind == "interned":
+                self._tables[field] = spec["values"]
+                self._columns[field] = np.load(self.path / f"{field}.codes.npy", mmap_mode="r")
+            else:
+                self._columns[field] = np.load(self.path / f"{field}.offsets.npy", mmap_mode="r")
+                if kind == "zstd":
+                    self._block_rows[field] = spec["block_rows"]
+                    self._block_index[field] = np.load(
+                        self.path / f"{field}.blocks.npy", mmap_mode="r"
+                    )
+                blob_path = self.path / (f"{field}.zst" if kind == "zstd" else f"{field}.bin")
+                # np.memmap cannot map an empty file
+                self._blobs[field] = (
+                    np.memmap(blob_path, dtype=np.uint8, mode="r")
+                    if blob_path.stat().st_size else b""
+                )
+
+    @classmethod
+    def exists(cls, path: Path) -> bool:
+        """Whether a store has been written at path."""
+        return (Path(path) / SCHEMA_FILE).exists()
+
+    @property
+    def fields(self) -> tuple[str, ...]:
+        return tuple(self._kinds)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, idx: int) -> "ChunkRecord":
+        idx = int(idx)
+        if idx < 0:
+            idx += self._count
+        if not 0 <= idx < self._count:
+            raise IndexError(f"metadata index {idx} out of range")
+        return ChunkRecord(self, idx)
+
+    def __iter__(self) -> Iterator["ChunkRecord"]:
+        for idx in range(self._count):
+            yield ChunkRecord(self, idx)
+
+    def _decompressor(self):
+        # zstd decompression contexts are not thread-safe; keep one per thread
+        decompressor = getattr(self._local, "decompressor", None)
+        if decompressor is None:
+            import zstandard
+
+            decompressor = self._local.decompressor = zstandard.ZstdDecompressor()
+        return decompressor
+
+    def _block(self, field: str, block: int) -> bytes:
+        """Decompressed rows of one block of a compressed field."""
+        key = (field, block)
+        with self._block_lock:
+            data = self._block_cache.get(key)
+            if data is not None:
+                self._block_cache.move_to_end(key)
+                return data
+
+        frames = self._block_index[field]
+        frame = bytes(self._blobs[field][int(frames[block]):int(frames[block + 1])])
+        data = self._decompressor().decompress(frame)
+
+        with self._block_lock:
+            self._block_cache[key] = data
+            while len(self._block_cache) > self._block_cache_size:
+                self._block_cache.popitem(last=False)
+        return data
+
+    def get_field(self, idx: int, field: str) -> Any:
+        """Decode one field of one row."""
+        kind = self._kinds[field]
+        column = self._columns[field]
+        if kind == "int":
+            return int(column[idx])
+        if kind == "interned":
+            return self._tables[field][int(column[idx])]
+        start, end = int(column[idx]), int(column[idx + 1])
+        if kind == "zstd":
+            block_start = (idx // self._block_rows[field]) * self._block_rows[field]
+            base = int(column[block_start])
+            block = self._block(field, idx // self._block_rows[field])
+            return block[start - base:end - base].decode("utf-8")
+        return bytes(self._blobs[field][start:end]).decode("utf-8")
+
+    def column(self, field: str) -> list[Any]:
+        """Decode a whole field (for building side indexes at load time)."""
+        kind = self._kinds[field]
+        if kind == "interned":
+            table = self._tables[field]
+            return [table[int(c)] for c in self._columns[field]]
+        return [self.get_field(idx, field) for idx in range(self._count)]
+
+
+class ChunkRecord(Mapping):
+    """
+    Lazy mapping view of one metadata row.
+
+    Fields are decoded from the store on access. Values assigned with
+    item assignment (e.g. "score") are kept on the view itself and
+    shadow stored fields, so results can be annotated without copying
+    the row.
+    """
+
+    __slots__ = ("_store", "_idx", "_extra")
+
+    def __init__(self, store: MetadataStore, idx: int, extra: Optional[dict[str, Any]] = None):
+        self._store = store
+        self._idx = idx
+        self._extra: dict[str, Any] = extra or {}
+
+    @property
+    def row(self) -> int:
+        """Position of this record in the index."""
+        return self._idx
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._extra:
+            return self._extra[key]
+        if key in self._store._kinds:
+            return self._store.get_field(self._idx, key)
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._extra[key] = value
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._extra or key in self._store._kinds
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._store.fields
+        for key in self._extra:
+            if key not in self._store._kinds:
+                yield key
+
+    def __len__(self) -> int:
+        return len(set(self._store.fields) | set(self._extra))
+
+    def copy(self) -> "ChunkRecord":
+        """A new view of the same row with its own annotations."""
+        return ChunkRecord(self._store, self._idx, dict(self._extra))
+
+    def to_dict(self) -> dict[str, Any]:
+        """Materialize every field into a plain dict."""
+        return dict(self.items())
+
+    def __repr__(self) -> str:
+        return f"ChunkRecord(row={self._idx}, {self._extra!r})"
+
@@ -0,0 +1,152 @@
+"""
+Lightweight in-process metrics for Nyay Sathi.
+
+Counters, gauges and histograms are registered by name and exposed as a
+JSON snapshot on the /metrics endpoint. All metrics are thread-safe so
+they can be updated from executor and worker threads.
+"""
+
+import threading
+from collections import deque
+from typing import Union
+
+import numpy as np
+
+
+class Counter:
+    """Monotonically increasing value."""
+
+    def __init__(self, name: str, description: str = ""):
+        self.name = name
+        self.description = description
+        self._value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self._value += amount
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+    def snapshot(self) -> dict:
+        return {"type": "counter", "description": self.description, "value": self._value}
+
+
+class Gauge:
+    """Value that can go up and down."""
+
+    def __init__(self, name: str, description: str = ""):
+        self.name = name
+        self.description = description
+        self._value = 0.0
+        self._lock = threading.Lock()
+
+    def set(self, value: float) -> None:
+        with self._lock:
+            self._value = value
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self._value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self._value -= amount
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+    def snapshot(self) -> dict:
+        return {"type": "gauge", "description": self.description, "value": self._value}
+
+
+class Histogram:
+    """
+    Distribution of observed values.
+
+    Keeps lifetime count/sum plus a sliding window of recent observations
+    from which percentiles are computed.
+    """
+
+    def __init__(self, name: str, description: str = "", window: int = 1024):
+        self.name = name
+        self.description = description
+        self._count = 0
+        self._sum = 0.0
+        self._window: deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        with self._lock:
+            self._count += 1
+            self._sum += value
+            self._window.append(value)
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            recent = np.fromiter(self._window, dtype=np.float64)
+            count, total = self._count, self._sum
+
+        result = {
+            "type": "histogram",
+            "description": self.description,
+            "count": count,
+            "sum": round(total, 3),
+            "mean": round(total / count, 3) if count else 0.0,
+        }
+        if recent.size:
+            p50, p95, p99 = np.percentile(recent, [50, 95, 99])
+            result.update({
+                "min": round(float(recent.min()), 3),
+                "max": round(float(recent.max()), 3),
+                "p50": round(float(p50), 3),
+                "p95": round(float(p95), 3),
+                "p99": round(float(p99), 3),
+            })
+        return result
+
+
+Metric = Union[Counter, Gauge, Histogram]
+
+_registry: dict[str, Metric] = {}
+_registry_lock = threading.Lock()
+
+
+def _get_or_create(cls: type, name: str, description: str) -> Metric:
+    with _registry_lock:
+        metric = _registry.get(name)
+        if metric is None:
+            metric = cls(name, description)
+            _registry[name] = metric
+        elif not isinstance(metric, cls):
+            raise TypeError(f"Metric {name!r} already registered as {type(metric).__name__}")
+        return metric
+
+
+def counter(name: str, description: str = "") -> Counter:
+    """Get or create a counter."""
+    return _get_or_create(Counter, name, description)
+
+
+def gauge(name: str, description: str = "") -> Gauge:
+    """Get or create a gauge."""
+    return _get_or_create(Gauge, name, description)
+
+
+def histogram(name: str, description: str = "") -> Histogram:
+    """Get or create a histogram."""
+    return _get_or_create(Histogram, name, description)
+
+
+def snapshot() -> dict[str, dict]:
+    """Return a JSON-serializable view of all registered metrics."""
+    with _registry_lock:
+        metrics = list(_registry.values())
+    return {m.name: m.snapshot() for m in sorted(metrics, key=lambda m: m.name)}
@@ -0,0 +1,159 @@
+"""
+Query analysis for Nyay Sathi.
+
+Infers retrieval filters from the question text: "under the POCSO Act",
+"as per BNSS" or "the Bharatiya Nyaya Sanhita, 2023" all name an act
+without the caller passing a filter. Act names, abbreviations,
+categories and years are compiled into one Aho-Corasick automaton, so a
+query is scanned once regardless of how many names are known.
+"""
+
+from __future__ import annotations
+
+import re
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Generic, Iterator, Mapping, TypeVar
+
+from statutes import ACT_ALIASES, act_key
+
+T = TypeVar("T")
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+class AhoCorasick(Generic[T]):
+    """
+    Multi-pattern matcher over lowercase text.
+
+    Args:
+        patterns: Pattern -> value reported when it matches.
+    """
+
+    def __init__(self, patterns: Mapping[str, T]):
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[list[tuple[int, T]]] = [[]]
+
+        for pattern, value in patterns.items():
+            state = 0
+            for ch in pattern:
+                if ch not in self._goto[state]:
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                    self._goto[state][ch] = len(self._goto) - 1
+                state = self._goto[state][ch]
+            self._out[state].append((len(pattern), value))
+
+        # Breadth-first failure links; each state also reports the
+        # patterns of its failure state (shorter suffixes)
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, child in self._goto[state].items():
+                queue.append(child)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(ch, 0)
+                self._out[child].extend(self._out[self._fail[child]])
+
+    def finditer(self, text: str) -> Iterator[tuple[int, int, T]]:
+        """Yield (start, end, value) for every pattern occurrence in text."""
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(ch, 0)
+            for length, value in self._out[state]:
+                yield i - length + 1, i + 1, value
+
+
+@dataclass
+class QueryAnalysis:
+    """Acts, categories and years named in a query."""
+    acts: list[str] = field(default_factory=list)
+    categories: list[str] = field(default_factory=list)
+    years: list[int] = field(default_factory=list)
+
+    @property
+    def filters(self) -> dict[str, Any]:
+        """
+        Retrieval filters implied by the query.
+
+        Only an unambiguous act name becomes a filter: a question comparing
+        two acts is not narrowed to either of them. A year narrows it further
+        only alongside that act ("Companies Act, 2013"); a bare year or
+        category ("murder in 2023", "criminal law") says what the question
+        is about, not which acts answer it, and would hide the right ones.
+        """
+        filters: dict[str, Any] = {}
+        if len(self.acts) == 1:
+            filters["act"] = self.acts[0]
+            if len(self.years) == 1:
+                filters["year"] = self.years[0]
+        return filters
+
+
+class QueryAnalyzer:
+    """
+    Finds act names, abbreviations, categories and years in queries.
+
+    Args:
+        acts: acts_metadata.json contents: title -> {"act_name", "year", "category"}.
+    """
+
+    def __init__(self, acts: Mapping[str, Mapping[str, Any]]):
+        patterns: dict[str, tuple[str, Any]] = {}
+        # Years each act was enacted in (several for re-enacted acts)
+        self._act_years: dict[str, set[int]] = {}
+
+        for title, meta in acts.items():
+            key = act_key(meta.get("act_name") or title)
+            patterns[key] = ("act", key)
+            patterns[act_key(title)] = ("act", key)
+            if meta.get("category"):
+                patterns[meta["category"].lower()] = ("category", meta["category"])
+            if meta.get("year"):
+                patterns[str(meta["year"])] = ("year", int(meta["year"]))
+                self._act_years.setdefault(key, set()).add(int(meta["year"]))
+
+        for alias, key in ACT_ALIASES.items():
+            patterns.setdefault(alias, ("act", key))
+
+        self._matcher: AhoCorasick[tuple[str, Any]] = AhoCorasick(
+            {pattern: value for pattern, value in patterns.items() if pattern}
+        )
+
+    def analyze(self, query: str) -> QueryAnalysis:
+        """Scan a query once and collect the acts, categories and years it names."""
+        text = _WHITESPACE_RE.sub(" ", query.lower())
+
+        # Whole-word matches only ("bns" must not match inside "bnss"),
+        # keeping the longest of any overlapping matches
+        matches = [
+            (start, end, value)
+            for start, end, value in self._matcher.finditer(text)
+            if (start == 0 or not text[start - 1].isalnum())
+            and (end == len(text) or not text[end].isalnum())
+        ]
+        matches.sort(key=lambda m: (m[0], m[0] - m[1]))
+
+        analysis = QueryAnalysis()
+        found_by_kind = {
+            "act": analysis.acts, "category": analysis.categories, "year": analysis.years,
+        }
+        covered_until = 0
+        for start, end, (kind, value) in matches:
+            if start < covered_until:
+                continue
+            covered_until = end
+            found = found_by_kind[kind]
+            if value not in found:
+                found.append(value)
+
+        # Only years of a named act ("IPC ... in 2023" is not the 1860 act)
+        act_years = set().union(*(self._act_years.get(act, set()) for act in analysis.acts))
+        analysis.years = [year for year in analysis.years if year in act_years]
+        return analysis
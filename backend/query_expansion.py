@@ -0,0 +1,132 @@
+"""
+Local query expansion for Nyay Sathi.
+
+The 2023 criminal laws replaced the IPC, CrPC and Evidence Act, so the
+same offence is asked about under either name. expand_query() rewrites a
+question to the counterpart act without an LLM call: "Section 302 IPC"
+-> "section 103 bharatiya nyaya sanhita", "theft under IPC" -> "theft
+under bharatiya nyaya sanhita".
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Optional
+
+from statutes import ACT_ALIASES, act_key, parse_statute_references, section_key
+
+# Old act key <-> new act key
+ACT_SUCCESSORS: dict[str, str] = {
+    "indian penal code": "bharatiya nyaya sanhita",
+    "code of criminal procedure": "bharatiya nagarik suraksha sanhita",
+    "indian evidence act": "bharatiya sakshya adhiniyam",
+}
+ACT_COUNTERPARTS: dict[str, str] = {
+    **ACT_SUCCESSORS,
+    **{new: old for old, new in ACT_SUCCESSORS.items()},
+}
+
+# Well-known (old act, section) -> (new act, section) equivalents
+_IPC, _BNS = "indian penal code", "bharatiya nyaya sanhita"
+_CRPC, _BNSS = "code of criminal procedure", "bharatiya nagarik suraksha sanhita"
+_IEA, _BSA = "indian evidence act", "bharatiya sakshya adhiniyam"
+
+SECTION_SUCCESSORS: dict[tuple[str, str], tuple[str, str]] = {
+    # Offences against the body
+    (_IPC, "299"): (_BNS, "100"),
+    (_IPC, "300"): (_BNS, "101"),
+    (_IPC, "302"): (_BNS, "103"),
+    (_IPC, "304b"): (_BNS, "80"),
+    (_IPC, "307"): (_BNS, "109"),
+    (_IPC, "323"): (_BNS, "115"),
+    (_IPC, "354"): (_BNS, "74"),
+    (_IPC, "376"): (_BNS, "64"),
+    (_IPC, "498a"): (_BNS, "85"),
+    (_IPC, "506"): (_BNS, "351"),
+    # Property offences
+    (_IPC, "378"): (_BNS, "303"),
+    (_IPC, "379"): (_BNS, "303"),
+    (_IPC, "406"): (_BNS, "316"),
+    (_IPC, "415"): (_BNS, "318"),
+    (_IPC, "420"): (_BNS, "318"),
+    # Conspiracy and defamation
+    (_IPC, "120b"): (_BNS, "61"),
+    (_IPC, "499"): (_BNS, "356"),
+    (_IPC, "500"): (_BNS, "356"),
+    # Procedure
+    (_CRPC, "41"): (_BNSS, "35"),
+    (_CRPC, "125"): (_BNSS, "144"),
+    (_CRPC, "154"): (_BNSS, "173"),
+    (_CRPC, "161"): (_BNSS, "180"),
+    (_CRPC, "164"): (_BNSS, "183"),
+    (_CRPC, "436"): (_BNSS, "478"),
+    (_CRPC, "437"): (_BNSS, "480"),
+    (_CRPC, "438"): (_BNSS, "482"),
+    (_CRPC, "439"): (_BNSS, "483"),
+    (_CRPC, "482"): (_BNSS, "528"),
+    # Evidence
+    (_IEA, "32"): (_BSA, "26"),
+    (_IEA, "45"): (_BSA, "39"),
+    (_IEA, "65b"): (_BSA, "63"),
+}
+SECTION_COUNTERPARTS: dict[tuple[str, str], tuple[str, str]] = dict(SECTION_SUCCESSORS)
+for _old, _new in SECTION_SUCCESSORS.items():
+    # Several old sections merged into one new one; the first listed wins
+    SECTION_COUNTERPARTS.setdefault(_new, _old)
+
+# Every alias of an act that has a counterpart, longest first ("bnss" before "bns")
+_SWAPPABLE_ALIASES = sorted(
+    (alias for alias, key in ACT_ALIASES.items() if key in ACT_COUNTERPARTS),
+    key=len,
+    reverse=True,
+)
+_SWAPPABLE_RE = re.compile(
+    r"(?<![0-9a-z])(?:" + "|".join(re.escape(a) for a in _SWAPPABLE_ALIASES) + r")(?![0-9a-z])",
+    re.IGNORECASE,
+)
+
+# "section 302", "s. 420", "u/s 138"
+_SECTION_MENTION_RE = re.compile(r"(?<![0-9a-z])(?:section|sec\.?|s\.|u/s\.?)\s*\d", re.IGNORECASE)
+
+
+def _swap_acts(query: str) -> str:
+    """Replace every old / new act name in the query by its counterpart."""
+    return _SWAPPABLE_RE.sub(
+        lambda m: ACT_COUNTERPARTS[ACT_ALIASES[re.sub(r"\s+", " ", m.group(0).lower())]],
+        query,
+    )
+
+
+def counterpart_act(act: str) -> Optional[str]:
+    """Old / new counterpart of an act name or alias ("IPC" -> "bharatiya nyaya sanhita")."""
+    key = ACT_ALIASES.get(re.sub(r"\s+", " ", act.strip().lower()), act_key(act))
+    return ACT_COUNTERPARTS.get(key)
+
+
+def expand_query(query: str, max_variants: int = 3) -> list[str]:
+    """
+    Counterpart phrasings of a query under the old / new criminal laws.
+
+    Args:
+        query: The user's question.
+        max_variants: Maximum number of variants returned.
+
+    Returns:
+        Variants, not including the query itself (empty if the query
+        names no act with a counterpart).
+    """
+    variants = []
+    refs = parse_statute_references(query)
+    if refs:
+        # Rewriting only the act name would point at an unrelated section
+        for ref in sorted(refs, key=lambda r: (r.act, r.section)):
+            counterpart = SECTION_COUNTERPARTS.get((ref.act, section_key(ref.section)))
+            if counterpart is not None:
+                act, section = counterpart
+                variants.append(f"section {section} {act}")
+    elif not _SECTION_MENTION_RE.search(query):
+        swapped = _swap_acts(query)
+        if swapped != query:
+            variants.append(swapped)
+
+    return variants[:max_variants]
@@ -14,10 +14,18 @@ Features:
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import json
 import os
 import pickle
+import threading
+import time
+from collections import defaultdict
 from concurrent.futures import ThreadPoolExecutor
-from typing import Any, Optional
+from contextlib import contextmanager
+from dataclasses import replace
+from pathlib import Path
+from typing import Any, Iterator, Mapping, NamedTuple, Optional, Sequence
 
 # Force environment before torch import
 os.environ["TOKENIZERS_PARALLELISM"] = "false"
@@ -26,18 +34,66 @@ import faiss
 import numpy as np
 from groq import Groq
 
+import metrics
+from batcher import MicroBatcher
+from cache import LRUCache
 from config import (
     FAISS_INDEX_PATH,
     FAISS_META_PATH,
+    FAISS_META_STORE_PATH,
+    BM25_PATH,
+    MANIFEST_PATH,
+    FAISS_MMAP,
+    INDEX_VERIFY,
+    FAISS_SEARCH_PARAMS,
+    RERANK_VECTORS_PATH,
+    RERANK_OVERFETCH,
     EMBEDDING_MODEL,
+    EMBEDDING_BACKEND,
+    ONNX_MODEL_DIR,
     GROQ_MODEL,
     GROQ_API_KEY,
     TOP_K,
     CONFIDENCE_THRESHOLD,
     DEVICE,
     WEB_SEARCH_ENABLED,
+    EMBED_BATCH_ENABLED,
+    EMBED_BATCH_MAX_SIZE,
+    EMBED_BATCH_MAX_WAIT_MS,
+    QUERY_CACHE_SIZE,
+    QUERY_CACHE_TTL,
+    RESULT_CACHE_SIZE,
+    RESULT_CACHE_MAX_MB,
+    RESULT_CACHE_TTL,
+    HYBRID_SEARCH_ENABLED,
+    HYBRID_CANDIDATES,
+    RRF_K,
+    STATUTE_FAST_PATH_ENABLED,
+    FILTER_SCAN_MAX,
+    ACTS_METADATA_PATH,
+    QUERY_ANALYSIS_ENABLED,
+    SECTION_GROUPING_ENABLED,
+    SECTION_GROUP_OVERFETCH,
+    CROSS_ENCODER_ENABLED,
+    CROSS_ENCODER_MODEL,
+    CROSS_ENCODER_CANDIDATES,
+    CROSS_ENCODER_BUDGET_MS,
+    CROSS_ENCODER_CACHE_SIZE,
+    WARMUP_QUERIES,
+    QUERY_EXPANSION_ENABLED,
+    MULTI_QUERY_MAX,
 )
+from embedders import Embedder, create_embedder
+from filters import FilterIndex, FilterMatch, SearchFilter
+from lexical import BM25Index, reciprocal_rank_fusion
+from manifest import file_sha256, load_manifest, verify_manifest
+from metadata_store import MetadataStore
+from query_analysis import QueryAnalyzer
+from query_expansion import counterpart_act, expand_query
+from reranker import CrossEncoderReranker
 from logger import rag_logger as logger
+from sanitizer import canonicalize_query
+from statutes import StatuteIndex, parse_statute_reference
 
 
 # =============================================================================
@@ -45,47 +101,420 @@ from logger import rag_logger as logger
 # =============================================================================
 
 _index: Optional[faiss.Index] = None
-_metadata: Optional[list[dict]] = None
-_embedder: Any = None
+_index_version: str = ""
+_metadata: Optional[Sequence[Mapping]] = None
+_rerank_vectors: Optional[np.ndarray] = None
+_bm25: Optional[BM25Index] = None
+_statute_index: Optional[StatuteIndex] = None
+_filter_index: Optional[FilterIndex] = None
+_query_analyzer: Optional[QueryAnalyzer] = None
+_parent_chunks: dict[str, list[int]] = {}
+_embedder: Optional[Embedder] = None
+_reranker: Optional[CrossEncoderReranker] = None
 _client: Optional[Groq] = None
-_executor: Optional[ThreadPoolExecutor] = None
+_batcher: Optional[MicroBatcher] = None
+_query_cache: LRUCache[str, np.ndarray] = LRUCache(
+    "query_vector", QUERY_CACHE_SIZE, QUERY_CACHE_TTL
+)
+
+
+class _ReadWriteLock:
+    """
+    Many readers or one writer, with writer preference.
+
+    Queries hold the read lock while they use the index globals; a reload
+    takes the write lock only to swap them. A waiting writer stops new
+    readers from entering, so it is not starved by a steady query stream.
+    Not reentrant: a reader must not take the read lock again.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._readers = 0
+        self._writing = False
+        self._writers_waiting = 0
+
+    @contextmanager
+    def read(self) -> Iterator[None]:
+        with self._cond:
+            while self._writing or self._writers_waiting:
+                self._cond.wait()
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._readers -= 1
+                if self._readers == 0:
+                    self._cond.notify_all()
+
+    @contextmanager
+    def write(self) -> Iterator[None]:
+        with self._cond:
+            self._writers_waiting += 1
+            try:
+                while self._writing or self._readers:
+                    self._cond.wait()
+            finally:
+                self._writers_waiting -= 1
+            self._writing = True
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._writing = False
+                self._cond.notify_all()
+
+
+# Guards the index globals below against a hot reload swapping them mid-query
+_state_lock = _ReadWriteLock()
+_reload_lock = threading.Lock()
+# Fingerprint of the last version that failed validation (not retried unless forced)
+_rejected_version: str = ""
+
+
+class _Hits(NamedTuple):
+    """
+    Ranked chunk hits in compact form.
+
+    This is what the result cache stores: records are rebuilt from the
+    metadata by id, so an entry costs a few small arrays rather than
+    copies of every chunk's text.
+    """
+    ids: np.ndarray
+    scores: np.ndarray
+    fusion: Optional[np.ndarray] = None
+    rerank: Optional[np.ndarray] = None
+    exact: bool = False
+
+    @property
+    def nbytes(self) -> int:
+        return sum(a.nbytes for a in self if isinstance(a, np.ndarray))
+
+    def head(self, k: int) -> "_Hits":
+        return _Hits(*(a[:k] if isinstance(a, np.ndarray) else a for a in self))
+
+
+_result_cache: LRUCache[tuple, _Hits] = LRUCache(
+    "retrieval_result",
+    RESULT_CACHE_SIZE,
+    RESULT_CACHE_TTL,
+    max_bytes=int(RESULT_CACHE_MAX_MB * 1024 * 1024),
+    # Arrays plus a rough allowance for the tuple and its key
+    sizeof=lambda hits: hits.nbytes + 512,
+)
+
+_lexical_latency = metrics.histogram("lexical_search_ms", "BM25 scoring + fusion time per query")
+_query_variants = metrics.histogram("query_variants", "Phrasings searched together per retrieval")
+_statute_hits = metrics.counter(
+    "statute_fast_path_hits", "Queries answered from the exact statute index"
+)
+_reloads = metrics.counter("index_reloads", "Index versions swapped in without a restart")
+_reload_failures = metrics.counter(
+    "index_reload_failures", "Index reloads rejected by validation or loading errors"
+)
 
 
 # =============================================================================
 # INITIALIZATION
 # =============================================================================
 
-def initialize_rag() -> int:
+def _verify_artifacts(manifest: Optional[dict]) -> None:
+    """
+    Check index artifacts against manifest.json (see INDEX_VERIFY).
+
+    Raises:
+        RuntimeError: If a file is missing or does not match the manifest.
+    """
+    if INDEX_VERIFY == "off":
+        return
+
+    if manifest is None:
+        logger.warning(f"No manifest at {MANIFEST_PATH} - skipping index verification")
+        return
+
+    checksum = INDEX_VERIFY == "checksum"
+    started = time.perf_counter()
+    problems = verify_manifest(MANIFEST_PATH.parent, manifest, checksum=checksum)
+    if problems:
+        raise RuntimeError("Index artifacts do not match manifest: " + "; ".join(problems))
+
+    logger.info(
+        f"Verified {len(manifest['files'])} index files against manifest "
+        f"({'sha256' if checksum else 'size'}, {time.perf_counter() - started:.2f}s)"
+    )
+
+
+def _index_fingerprint(manifest: Optional[dict]) -> str:
+    """
+    Short version id of the loaded index artifacts.
+
+    Derived from the manifest's file digests, or from the sizes and
+    modification times of the artifacts when there is no manifest.
+    """
+    digest = hashlib.sha256()
+    if manifest is not None:
+        digest.update(json.dumps(manifest.get("files", {}), sort_keys=True).encode())
+    else:
+        for path in (
+            FAISS_INDEX_PATH,
+            FAISS_META_STORE_PATH,
+            FAISS_META_PATH,
+            BM25_PATH,
+            RERANK_VECTORS_PATH,
+        ):
+            if path.exists():
+                stat = path.stat()
+                digest.update(f"{path.name}:{stat.st_size}:{stat.st_mtime_ns};".encode())
+    return digest.hexdigest()[:12]
+
+
+def _read_index(path: Path) -> faiss.Index:
+    """
+    Read the FAISS index, memory-mapped read-only when FAISS_MMAP is set.
+
+    A mapped index lives in the OS page cache instead of the worker heap,
+    so every worker process shares one copy. Falls back to a regular read
+    when this FAISS build or index type cannot be mapped.
+    """
+    if FAISS_MMAP:
+        # IO_FLAG_MMAP_IFC maps flat codes zero-copy (FAISS >= 1.11);
+        # IO_FLAG_MMAP only maps IVF inverted lists
+        mmap_flag = getattr(faiss, "IO_FLAG_MMAP_IFC", None)
+        if mmap_flag is None:
+            mmap_flag = faiss.IO_FLAG_MMAP
+            logger.warning(
+                "This FAISS build cannot map flat index codes (needs FAISS >= 1.11): "
+                "each worker keeps a private copy of the index, run a single worker"
+            )
+        try:
+            index = faiss.read_index(str(path), mmap_flag | faiss.IO_FLAG_READ_ONLY)
+            logger.debug(f"Memory-mapped FAISS index {path}")
+            return index
+        except RuntimeError as e:
+            logger.warning(f"Could not memory-map FAISS index ({e}) - reading into memory")
+
+    return faiss.read_index(str(path))
+
+
+def _apply_search_params(index: faiss.Index, manifest: Optional[dict]) -> None:
+    """
+    Apply FAISS search parameters (nprobe / efSearch).
+
+    FAISS_SEARCH_PARAMS wins over the auto-tuned value in the manifest;
+    exact (flat) indexes have nothing to set.
+    """
+    params = FAISS_SEARCH_PARAMS or (manifest or {}).get("search_params", "")
+    if not params:
+        return
+    faiss.ParameterSpace().set_index_parameters(index, params)
+    logger.info(f"FAISS search parameters: {params}")
+
+
+def _rerank_vectors_listed(manifest: Optional[dict]) -> bool:
+    """
+    Whether the float16 re-rank vectors on disk belong to this manifest.
+
+    The build writes them before the manifest that lists them, so a file
+    the manifest does not list, or whose SHA-256 differs, comes from
+    another (possibly unfinished) build and must not be paired with this
+    index.
+    """
+    if manifest is None or not RERANK_VECTORS_PATH.exists():
+        return False
+    name = RERANK_VECTORS_PATH.relative_to(MANIFEST_PATH.parent).as_posix()
+    expected = manifest.get("files", {}).get(name)
+    if expected is None:
+        logger.warning(f"{RERANK_VECTORS_PATH} is not listed in the manifest - ignoring it")
+        return False
+    if file_sha256(RERANK_VECTORS_PATH) != expected["sha256"]:
+        logger.warning(f"{RERANK_VECTORS_PATH} does not match the manifest - ignoring it")
+        return False
+    return True
+
+
+def _load_index(manifest: Optional[dict]) -> tuple[faiss.Index, Optional[np.ndarray]]:
+    """Read the FAISS index and, for compressed indexes, the float16 re-rank vectors."""
+    index = _read_index(FAISS_INDEX_PATH)
+    _apply_search_params(index, manifest)
+
+    # Compressed indexes come with float16 vectors for exact re-ranking
+    rerank_vectors = None
+    if _rerank_vectors_listed(manifest):
+        rerank_vectors = np.load(RERANK_VECTORS_PATH, mmap_mode="r")
+        logger.info(f"Re-ranking {RERANK_OVERFETCH}x over-fetched candidates with float16 vectors")
+    return index, rerank_vectors
+
+
+def _load_metadata() -> tuple[Sequence[Mapping], StatuteIndex, dict[str, list[int]], FilterIndex]:
+    """Load chunk metadata and build the statute, section and filter indexes over it."""
+    # Memory-mapped columnar store, or legacy pickle
+    if MetadataStore.exists(FAISS_META_STORE_PATH):
+        metadata = MetadataStore(FAISS_META_STORE_PATH)
+        logger.debug(f"Mapped {len(metadata)} metadata records from {FAISS_META_STORE_PATH}")
+    else:
+        with open(FAISS_META_PATH, "rb") as f:
+            metadata = pickle.load(f)
+        logger.warning(f"Loaded {len(metadata)} metadata records from legacy pickle")
+
+    # Exact statute reference index
+    statute_index = StatuteIndex(metadata)
+    logger.debug(f"Statute index built with {len(statute_index)} (act, section) keys")
+
+    # Map each section to its chunks, in order, for section grouping
+    parent_ids = (
+        metadata.column("parent_id") if isinstance(metadata, MetadataStore)
+        else [record.get("parent_id") for record in metadata]
+    )
+    parent_chunks: dict[str, list[int]] = defaultdict(list)
+    for chunk_id, parent_id in enumerate(parent_ids):
+        if parent_id:
+            parent_chunks[parent_id].append(chunk_id)
+
+    # Act / category / year bitsets for filtered retrieval
+    return metadata, statute_index, dict(parent_chunks), FilterIndex(metadata)
+
+
+def _load_bm25() -> Optional[BM25Index]:
+    """Load the BM25 index for hybrid search, if enabled and built."""
+    if HYBRID_SEARCH_ENABLED and BM25_PATH.exists():
+        bm25 = BM25Index.load(BM25_PATH)
+        logger.info(f"Loaded BM25 index ({len(bm25.vocabulary)} terms)")
+        return bm25
+    logger.info("BM25 index not loaded - dense-only retrieval")
+    return None
+
+
+def _load_query_analyzer() -> Optional[QueryAnalyzer]:
+    """Compile act names / abbreviations / years for filter inference."""
+    if QUERY_ANALYSIS_ENABLED and ACTS_METADATA_PATH.exists():
+        with open(ACTS_METADATA_PATH, "r", encoding="utf-8") as f:
+            return QueryAnalyzer(json.load(f))
+    logger.info("Query analysis disabled - filters are not inferred")
+    return None
+
+
+class _Artifacts(NamedTuple):
+    """One loaded version of the index and everything derived from it."""
+    index: faiss.Index
+    rerank_vectors: Optional[np.ndarray]
+    metadata: Sequence[Mapping]
+    statute_index: StatuteIndex
+    parent_chunks: dict[str, list[int]]
+    filter_index: FilterIndex
+    bm25: Optional[BM25Index]
+    query_analyzer: Optional[QueryAnalyzer]
+
+
+def _check_artifact_files() -> None:
+    """
+    Raises:
+        FileNotFoundError: If the index or its metadata is missing.
+    """
+    if not FAISS_INDEX_PATH.exists():
+        raise FileNotFoundError(f"FAISS index not found: {FAISS_INDEX_PATH}")
+
+    if not MetadataStore.exists(FAISS_META_STORE_PATH) and not FAISS_META_PATH.exists():
+        raise FileNotFoundError(f"FAISS metadata not found: {FAISS_META_STORE_PATH}")
+
+
+def _load_artifacts(manifest: Optional[dict], load_embedder: bool = False) -> _Artifacts:
+    """
+    Load the index artifacts concurrently; FAISS, numpy and model loading
+    release the GIL for their I/O.
+
+    Args:
+        manifest: The manifest the artifacts were verified against.
+        load_embedder: Also load the embedding model in parallel.
+    """
+    with ThreadPoolExecutor(max_workers=5, thread_name_prefix="rag-init") as pool:
+        index_future = pool.submit(_load_index, manifest)
+        metadata_future = pool.submit(_load_metadata)
+        bm25_future = pool.submit(_load_bm25)
+        analyzer_future = pool.submit(_load_query_analyzer)
+        embedder_future = pool.submit(_get_embedder) if load_embedder else None
+
+        index, rerank_vectors = index_future.result()
+        metadata, statute_index, parent_chunks, filter_index = metadata_future.result()
+        artifacts = _Artifacts(
+            index,
+            rerank_vectors,
+            metadata,
+            statute_index,
+            parent_chunks,
+            filter_index,
+            bm25_future.result(),
+            analyzer_future.result(),
+        )
+        if embedder_future is not None:
+            embedder_future.result()
+
+    return artifacts
+
+
+def _install(artifacts: _Artifacts, version: str) -> None:
+    """Make a loaded index version the one queries see (caller holds the write lock)."""
+    global _index, _index_version, _metadata, _rerank_vectors
+    global _bm25, _statute_index, _filter_index, _query_analyzer
+    global _parent_chunks
+
+    _index = artifacts.index
+    _rerank_vectors = artifacts.rerank_vectors
+    _metadata = artifacts.metadata
+    _statute_index = artifacts.statute_index
+    _parent_chunks = artifacts.parent_chunks
+    _filter_index = artifacts.filter_index
+    _bm25 = artifacts.bm25
+    _query_analyzer = artifacts.query_analyzer
+    _index_version = version
+
+
+def initialize_rag(load_embedder: bool = False) -> int:
     """
     Initialize the RAG system.
 
-    Loads FAISS index and metadata. Embedding model is loaded lazily on first query.
+    Loads FAISS index, metadata and (if present) the BM25 index, and
+    builds the (act, section) statute index and the metadata filter
+    bitsets from the metadata. The artifacts are loaded concurrently.
+
+    Args:
+        load_embedder: Also load the embedding model alongside the index;
+            otherwise it is loaded lazily on the first query.
 
     Returns:
         Number of vectors in the index.
 
     Raises:
         FileNotFoundError: If required files are missing.
+        RuntimeError: If the files do not match manifest.json.
     """
-    global _index, _metadata, _client, _executor
+    global _reranker, _client
 
     logger.info(f"Initializing RAG system (device: {DEVICE})...")
     logger.debug(f"FAISS path: {FAISS_INDEX_PATH}")
-
-    if not FAISS_INDEX_PATH.exists():
-        raise FileNotFoundError(f"FAISS index not found: {FAISS_INDEX_PATH}")
-
-    if not FAISS_META_PATH.exists():
-        raise FileNotFoundError(f"FAISS metadata not found: {FAISS_META_PATH}")
-
-    # Load FAISS index
-    _index = faiss.read_index(str(FAISS_INDEX_PATH))
-    logger.info(f"Loaded FAISS index with {_index.ntotal} vectors")
-
-    # Load metadata
-    with open(FAISS_META_PATH, "rb") as f:
-        _metadata = pickle.load(f)
-    logger.debug(f"Loaded {len(_metadata)} metadata records")
+    started = time.perf_counter()
+
+    _check_artifact_files()
+    manifest = load_manifest(MANIFEST_PATH.parent)
+    _verify_artifacts(manifest)
+
+    artifacts = _load_artifacts(manifest, load_embedder)
+    with _state_lock.write():
+        _install(artifacts, _index_fingerprint(manifest))
+    logger.info(f"Loaded FAISS index with {_index.ntotal} vectors (version {_index_version})")
+
+    # Cross-encoder re-ranking (model loads on its worker thread on first use)
+    if CROSS_ENCODER_ENABLED and _reranker is None:
+        _reranker = CrossEncoderReranker(
+            CROSS_ENCODER_MODEL,
+            device=DEVICE,
+            cache_size=CROSS_ENCODER_CACHE_SIZE,
+            cache_ttl=QUERY_CACHE_TTL,
+        )
+        logger.info(
+            f"Cross-encoder re-ranking of top {CROSS_ENCODER_CANDIDATES} "
+            f"({CROSS_ENCODER_MODEL}, {CROSS_ENCODER_BUDGET_MS:.0f}ms budget)"
+        )
 
     # Initialize Groq client
     if GROQ_API_KEY:
@@ -94,13 +523,36 @@ def initialize_rag() -> int:
     else:
         logger.warning("GROQ_API_KEY not set - LLM explanations disabled")
 
-    # Initialize thread pool for parallel operations
-    _executor = ThreadPoolExecutor(max_workers=4)
-    logger.debug("Thread pool initialized")
-
+    logger.info(f"RAG initialized in {time.perf_counter() - started:.2f}s")
     return _index.ntotal
 
 
+def warmup_rag(queries: Sequence[str] = WARMUP_QUERIES) -> float:
+    """
+    Exercise the query path end to end before serving traffic.
+
+    Each query is embedded, searched (dense + BM25) and, when enabled,
+    re-ranked by the cross-encoder without a time budget. This pulls the
+    models, the index pages and the metadata pages in, and starts the
+    batcher and re-ranker threads. The result cache is bypassed.
+
+    Returns:
+        Seconds the warm-up took.
+    """
+    started = time.perf_counter()
+    fetch_k = TOP_K * SECTION_GROUP_OVERFETCH
+    with _state_lock.read():
+        search_k = max(fetch_k, CROSS_ENCODER_CANDIDATES if _reranker else 0)
+        for query in queries:
+            hits = _search_chunks(query, search_k, None)
+            _cross_encode(query, hits, budget_ms=0)
+            _group_by_section(_build_results(hits), TOP_K)
+
+    elapsed = time.perf_counter() - started
+    logger.info(f"Warm-up: {len(queries)} queries in {elapsed:.2f}s")
+    return elapsed
+
+
 def get_vectors_count() -> int:
     """Return the number of vectors in the index."""
     if _index is None:
@@ -108,67 +560,780 @@ def get_vectors_count() -> int:
     return _index.ntotal
 
 
-def _get_embedder():
+def get_index_version() -> str:
+    """Return the version id of the loaded index (empty before initialization)."""
+    return _index_version
+
+
+def embed_query(query: str) -> np.ndarray:
+    """Normalized float32 embedding of one query (served from the query cache when possible)."""
+    return _encode_queries([query])[0]
+
+
+def _get_embedder() -> Embedder:
     """
     Lazy-load the embedding model.
 
-    Uses the configured device (GPU if available).
+    Uses the configured backend (EMBEDDING_BACKEND) and, for torch,
+    the configured device (GPU if available).
     """
     global _embedder
 
     if _embedder is None:
-        logger.info(f"Loading embedding model on {DEVICE}...")
-        from sentence_transformers import SentenceTransformer
-
-        _embedder = SentenceTransformer(EMBEDDING_MODEL, device=DEVICE)
-        logger.info(f"Embedding model loaded on {DEVICE}")
+        logger.info(f"Loading {EMBEDDING_BACKEND} embedding model on {DEVICE}...")
+        _embedder = create_embedder(
+            EMBEDDING_BACKEND,
+            EMBEDDING_MODEL,
+            device=DEVICE,
+            onnx_model_dir=ONNX_MODEL_DIR,
+        )
+        logger.info(f"Embedding model loaded ({_embedder.name}, dim={_embedder.dimension})")
 
     return _embedder
 
 
 # =============================================================================
-# RETRIEVAL
+# INDEX RELOAD
 # =============================================================================
 
-def retrieve_sections(query: str, top_k: int = TOP_K) -> list[dict]:
+def _validate_artifacts(artifacts: _Artifacts, manifest: Optional[dict]) -> None:
     """
-    Retrieve relevant legal sections for a query.
+    Sanity-check a newly loaded index version before it serves queries.
+
+    Raises:
+        RuntimeError: If the artifacts are inconsistent with each other or
+            with the running embedding model.
+    """
+    index = artifacts.index
+    # A build that produced no vectors would answer every query with nothing
+    if index.ntotal == 0:
+        raise RuntimeError("Index is empty")
+    if index.ntotal != len(artifacts.metadata):
+        raise RuntimeError(
+            f"Index has {index.ntotal} vectors but metadata has "
+            f"{len(artifacts.metadata)} records"
+        )
+
+    rerank_vectors = artifacts.rerank_vectors
+    if rerank_vectors is not None and rerank_vectors.shape != (index.ntotal, index.d):
+        raise RuntimeError(
+            f"Re-rank vectors have shape {rerank_vectors.shape}, "
+            f"expected {(index.ntotal, index.d)}"
+        )
+
+    # Queries keep being embedded by the model this worker has loaded
+    built_with = (manifest or {}).get("embedding_model")
+    if built_with and built_with != EMBEDDING_MODEL:
+        raise RuntimeError(
+            f"Index was built with {built_with}, but this server embeds with {EMBEDDING_MODEL}"
+        )
+    if _embedder is not None and index.d != _embedder.dimension:
+        raise RuntimeError(
+            f"Index dimension {index.d} does not match the embedding model "
+            f"({_embedder.dimension})"
+        )
+
+    # One probe search must run and return ids inside the index
+    probe = np.zeros((1, index.d), dtype=np.float32)
+    probe[0, 0] = 1.0
+    _, ids = index.search(probe, min(5, index.ntotal))
+    if ((ids < -1) | (ids >= index.ntotal)).any():
+        raise RuntimeError(f"Probe search returned ids outside the index: {ids[0].tolist()}")
+
+
+def reload_index(force: bool = False) -> dict[str, Any]:
+    """
+    Swap in a rebuilt index without restarting the worker.
+
+    The new version is loaded, verified against its manifest and
+    validated while queries keep running on the current one. The globals
+    are then swapped under the write lock: in-flight queries finish on
+    the old version, later ones see the new one, and no query ever sees
+    a mix of the two. On any failure the current version stays active.
 
     Args:
-        query: The user's question.
-        top_k: Number of results to retrieve.
+        force: Reload even if the manifest fingerprint has not changed or
+            this version was rejected before.
 
     Returns:
-        List of matching sections with scores.
+        {"status": "reloaded" | "unchanged" | "rejected", "previous",
+        "version", "vectors", "seconds"}; "rejected" means this version
+        already failed validation and was skipped.
+
+    Raises:
+        FileNotFoundError: If required files are missing.
+        RuntimeError: If the new version fails verification or validation.
     """
-    if _index is None or _metadata is None:
-        logger.error("RAG not initialized")
-        return []
+    global _rejected_version
+
+    with _reload_lock:
+        started = time.perf_counter()
+        manifest = load_manifest(MANIFEST_PATH.parent)
+        version = _index_fingerprint(manifest)
+        previous = _index_version
+        if version in (previous, _rejected_version) and not force:
+            return {
+                "status": "unchanged" if version == previous else "rejected",
+                "previous": previous,
+                "version": version,
+                "vectors": get_vectors_count(),
+                "seconds": 0.0,
+            }
+
+        logger.info(f"Reloading index: {previous or 'none'} -> {version}")
+        try:
+            _check_artifact_files()
+            _verify_artifacts(manifest)
+            artifacts = _load_artifacts(manifest)
+            _validate_artifacts(artifacts, manifest)
+        except Exception as e:
+            _rejected_version = version
+            _reload_failures.inc()
+            logger.error(f"Index reload rejected, keeping version {previous}: {e}")
+            raise
+
+        with _state_lock.write():
+            _install(artifacts, version)
+        # Entries of the old version can no longer be hit; free their memory
+        _result_cache.clear()
+        _reloads.inc()
+
+        elapsed = time.perf_counter() - started
+        logger.info(
+            f"Index version {version} active ({artifacts.index.ntotal} vectors, {elapsed:.2f}s)"
+        )
+        return {
+            "status": "reloaded",
+            "previous": previous,
+            "version": version,
+            "vectors": artifacts.index.ntotal,
+            "seconds": round(elapsed, 3),
+        }
+
+
+# =============================================================================
+# RETRIEVAL
+# =============================================================================
+
+def _encode_queries(queries: list[str]) -> np.ndarray:
+    """
+    Encode queries into normalized float32 vectors.
+
+    Vectors are served from the query cache where possible; the remaining
+    distinct queries are encoded together in one padded batch.
+    """
+    keys = [canonicalize_query(q) for q in queries]
+    vectors: dict[str, np.ndarray] = {}
+    missing: dict[str, str] = {}
+
+    for key, query in zip(keys, queries):
+        if key in vectors or key in missing:
+            continue
+        cached = _query_cache.get(key)
+        if cached is not None:
+            vectors[key] = cached
+        else:
+            missing[key] = query
+
+    if missing:
+        embedder = _get_embedder()
+        encoded = embedder.encode(list(missing.values()), batch_size=len(missing))
+        for key, vec in zip(missing, encoded):
+            vec.setflags(write=False)
+            vectors[key] = vec
+            _query_cache.set(key, vec)
+
+    return np.stack([vectors[key] for key in keys])
+
+
+def _search_index(
+    query_vecs: np.ndarray,
+    k: int,
+    params: Optional[faiss.SearchParameters] = None,
+) -> list[tuple[np.ndarray, np.ndarray]]:
+    """
+    Search the index for a block of query vectors.
+
+    With a compressed index, over-fetches and re-ranks each row exactly.
+
+    Returns:
+        One (scores, ids) pair per query row, best first.
+    """
+    if _rerank_vectors is None:
+        scores, indices = _index.search(query_vecs, k, params=params)
+        return list(zip(scores, indices))
+
+    _, candidates = _index.search(query_vecs, k * RERANK_OVERFETCH, params=params)
+    return [_rerank(query_vec, row, k) for query_vec, row in zip(query_vecs, candidates)]
+
 
-    embedder = _get_embedder()
+def _selector_params(selector: faiss.IDSelector) -> faiss.SearchParameters:
+    """Search parameters carrying an ID selector, keeping the tuned nprobe / efSearch."""
+    ivf = faiss.try_extract_index_ivf(_index)
+    if ivf is not None:
+        return faiss.SearchParametersIVF(sel=selector, nprobe=ivf.nprobe)
+    base = faiss.downcast_index(_index)
+    if hasattr(base, "hnsw"):
+        return faiss.SearchParametersHNSW(sel=selector, efSearch=base.hnsw.efSearch)
+    return faiss.SearchParameters(sel=selector)
 
-    # Encode query
-    query_vec = embedder.encode(
-        [query],
-        convert_to_numpy=True,
-        normalize_embeddings=True,
-    ).astype("float32")
 
-    # Search
-    scores, indices = _index.search(query_vec, top_k)
+def _filtered_search(
+    query_vec: np.ndarray, top_k: int, match: FilterMatch
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Top chunks among those passing a filter.
+
+    Small subsets are scored directly, which touches only their vectors;
+    larger ones are pushed down into FAISS as an ID bitmap selector.
+    """
+    if len(match) == 0:
+        return np.empty(0, dtype=np.float32), np.empty(0, dtype=np.int64)
+
+    if len(match) <= FILTER_SCAN_MAX:
+        scores = _exact_scores(query_vec, match.ids)
+        order = np.argsort(-scores, kind="stable")[:top_k]
+        return scores[order], match.ids[order]
+
+    selector = faiss.IDSelectorBitmap(_index.ntotal, faiss.swig_ptr(match.bitmap))
+    return _search_index(query_vec[None, :], top_k, params=_selector_params(selector))[0]
+
+
+def _search_batch(
+    requests: list[tuple[str, int, Optional[FilterMatch]]],
+) -> list[tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """
+    Embed and search several (query, top_k, filter) requests at once.
+
+    All queries go through one encode call; unfiltered ones share one
+    multi-row index.search. Each request gets back its own
+    (query_vec, scores, indices) row cut to its top_k.
+    """
+    query_vecs = _encode_queries([query for query, _, _ in requests])
+    results: list[Optional[tuple[np.ndarray, np.ndarray, np.ndarray]]] = [None] * len(requests)
+
+    plain = [row for row, (_, _, match) in enumerate(requests) if match is None]
+    if plain:
+        max_k = max(requests[row][1] for row in plain)
+        for row, (scores, indices) in zip(plain, _search_index(query_vecs[plain], max_k)):
+            top_k = requests[row][1]
+            results[row] = (query_vecs[row], scores[:top_k], indices[:top_k])
+
+    for row, (_, top_k, match) in enumerate(requests):
+        if match is not None:
+            scores, indices = _filtered_search(query_vecs[row], top_k, match)
+            results[row] = (query_vecs[row], scores, indices)
+
+    return results
+
+
+def _rerank(
+    query_vec: np.ndarray, candidates: np.ndarray, top_k: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Re-rank candidate ids by exact inner product with the float16 vectors.
+
+    Returns:
+        Tuple of (scores, ids) for the best top_k candidates.
+    """
+    ids = candidates[candidates >= 0]
+    scores = _exact_scores(query_vec, ids)
+    order = np.argsort(-scores, kind="stable")[:top_k]
+    return scores[order], ids[order]
+
+
+def _get_batcher() -> MicroBatcher:
+    """Lazy-create the query micro-batcher."""
+    global _batcher
+
+    if _batcher is None:
+        _batcher = MicroBatcher(
+            "embed",
+            _search_batch,
+            max_batch_size=EMBED_BATCH_MAX_SIZE,
+            max_wait_ms=EMBED_BATCH_MAX_WAIT_MS,
+        )
+    return _batcher
+
+
+def _dense_search(
+    query: str,
+    top_k: int,
+    match: Optional[FilterMatch] = None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Search one query, coalescing with concurrent callers when batching is on."""
+    if EMBED_BATCH_ENABLED:
+        return _get_batcher().submit((query, top_k, match))
+    return _search_batch([(query, top_k, match)])[0]
+
+
+def _dense_search_many(
+    requests: list[tuple[str, int, Optional[FilterMatch]]],
+) -> list[tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """Search several queries together: one encode, one index.search for the unfiltered ones."""
+    if EMBED_BATCH_ENABLED:
+        return _get_batcher().submit_many(requests)
+    return _search_batch(requests)
+
+
+def _exact_scores(query_vec: np.ndarray, ids: np.ndarray) -> np.ndarray:
+    """Cosine scores of stored vectors against the query (zeros if not reconstructable)."""
+    if ids.size == 0:
+        return np.empty(0, dtype=np.float32)
+    if _rerank_vectors is not None:
+        return _rerank_vectors[ids].astype(np.float32) @ query_vec
+    try:
+        vectors = _index.reconstruct_batch(ids.astype(np.int64))
+    except RuntimeError:
+        return np.zeros(ids.size, dtype=np.float32)
+    return vectors @ query_vec
+
+
+def _hybrid_rank(
+    query: str,
+    query_vec: np.ndarray,
+    dense_scores: np.ndarray,
+    dense_ids: np.ndarray,
+    top_k: int,
+    match: Optional[FilterMatch] = None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Fuse dense and BM25 rankings with reciprocal-rank fusion.
+
+    With a filter, BM25 only ranks the chunks that pass it.
+
+    Returns:
+        Tuple of (ids, cosine scores, fused scores) for the top_k fused hits.
+    """
+    started = time.perf_counter()
+
+    lexical_ids, _ = _bm25.search(
+        query, HYBRID_CANDIDATES, ids=None if match is None else match.ids
+    )
+    fused_ids, fused_scores = reciprocal_rank_fusion([dense_ids, lexical_ids], k=RRF_K)
+    fused_ids, fused_scores = fused_ids[:top_k], fused_scores[:top_k]
 
+    # Report cosine similarity as the score; lexical-only hits get theirs computed exactly
+    dense_lookup = {int(i): float(s) for i, s in zip(dense_ids, dense_scores) if i >= 0}
+    cosine = np.array([dense_lookup.get(int(i), np.nan) for i in fused_ids], dtype=np.float32)
+    missing = np.isnan(cosine)
+    if missing.any():
+        cosine[missing] = _exact_scores(query_vec, fused_ids[missing])
+
+    _lexical_latency.observe((time.perf_counter() - started) * 1000)
+    return fused_ids, cosine, fused_scores
+
+
+def _build_results(hits: _Hits) -> list[dict]:
+    """Attach metadata to ranked hits."""
     results = []
-    for score, idx in zip(scores[0], indices[0]):
+    for rank, (score, idx) in enumerate(zip(hits.scores, hits.ids)):
         if idx == -1 or idx >= len(_metadata):
             continue
         record = _metadata[idx].copy()
         record["score"] = float(score)
+        if hits.fusion is not None:
+            record["fusion_score"] = round(float(hits.fusion[rank]), 6)
+        if hits.rerank is not None:
+            record["rerank_score"] = round(float(hits.rerank[rank]), 4)
+        if hits.exact:
+            record["match"] = "exact_reference"
         results.append(record)
+    return results
+
+
+_MIN_OVERLAP = 12
+
+
+def _stitch_texts(texts: list[str]) -> str:
+    """
+    Join consecutive chunk texts, dropping the overlap between neighbours.
+
+    Chunks repeat the last sentences of their predecessor, so each chunk
+    is joined at the longest suffix of the text so far that it starts with
+    (at least _MIN_OVERLAP characters, so a shared word is not an overlap).
+    """
+    stitched = texts[0]
+    for text in texts[1:]:
+        head = text[:_MIN_OVERLAP]
+        # The overlap cannot be longer than the chunk itself
+        pos = stitched.find(head, max(0, len(stitched) - len(text)))
+        while pos != -1 and not text.startswith(stitched[pos:]):
+            pos = stitched.find(head, pos + 1)
+        stitched = stitched[:pos] + text if pos != -1 else f"{stitched} {text}"
+    return stitched
+
+
+def _group_by_section(results: list[dict], top_k: int) -> list[dict]:
+    """
+    Collapse chunk hits into distinct sections.
+
+    Each section (parent_id) is ranked by its best chunk and returned once,
+    carrying the de-overlapped text of all of its chunks.
+    """
+    sections = []
+    seen = set()
+    for record in results:
+        parent_id = record.get("parent_id") or record.get("chunk_id")
+        if parent_id in seen:
+            continue
+        seen.add(parent_id)
+
+        chunk_ids = _parent_chunks.get(parent_id, [])
+        if len(chunk_ids) > 1:
+            record["text"] = _stitch_texts([_metadata[i]["text"] for i in chunk_ids])
+            record["chunk_count"] = len(chunk_ids)
+        sections.append(record)
+        if len(sections) == top_k:
+            break
+    return sections
+
+
+def _statute_lookup(query: str, top_k: int, match: Optional[FilterMatch]) -> Optional[_Hits]:
+    """Chunks of the section an exact statute reference names, if any."""
+    if not STATUTE_FAST_PATH_ENABLED or _statute_index is None or _metadata is None:
+        return None
+
+    ref = parse_statute_reference(query)
+    if ref is None:
+        return None
+
+    ids = _statute_index.lookup(ref)
+    if match is not None:
+        ids = [i for i in ids if i in match]
+    ids = ids[:top_k]
+    if not ids:
+        return None
+
+    _statute_hits.inc()
+    logger.debug(f"Exact statute match: {ref.act} s.{ref.section} -> {len(ids)} chunks")
+    return _Hits(np.asarray(ids, dtype=np.int64), np.ones(len(ids), dtype=np.float32), exact=True)
+
+
+def lookup_statute(
+    query: str,
+    top_k: int = TOP_K,
+    match: Optional[FilterMatch] = None,
+    group_sections: bool = SECTION_GROUPING_ENABLED,
+) -> list[dict]:
+    """
+    Answer an exact statute reference ("Section 302 IPC") from the hash index.
+
+    Does not touch the embedder or FAISS. Hits get a perfect score of 1.0.
+
+    Args:
+        query: The user's question.
+        top_k: Maximum number of chunks (or sections) to return.
+        match: Optional filter the chunks must pass.
+        group_sections: Merge the chunks of each section into one result.
+
+    Returns:
+        Chunks of the referenced section, or an empty list if the query is
+        not an unambiguous reference to an indexed section.
+    """
+    with _state_lock.read():
+        hits = _statute_lookup(query, top_k, match)
+        if hits is None:
+            return []
+
+        results = _build_results(hits)
+        if group_sections:
+            results = _group_by_section(results, top_k)
+        return results
+
+
+def infer_filters(query: str) -> Optional[dict[str, Any]]:
+    """
+    Infer act (and act year) filters from the query text.
+
+    "punishment under the POCSO Act" -> {"act": "protection of children
+    from sexual offences act"}. Fields the corpus has no chunks for are
+    dropped, so an inferred filter never empties a search.
+
+    Returns:
+        The filters, or None if the query names nothing usable.
+    """
+    with _state_lock.read():
+        if _query_analyzer is None or _filter_index is None:
+            return None
+
+        filters = _query_analyzer.analyze(query).filters
+        filters = {
+            key: value for key, value in filters.items()
+            if len(_filter_index.resolve(SearchFilter(**{key: value})))
+        }
+        if not filters or len(_filter_index.resolve(SearchFilter(**filters))) == 0:
+            return None
+        return filters
+
+
+def _search_chunks(query: str, top_k: int, match: Optional[FilterMatch]) -> _Hits:
+    """Dense-only or hybrid chunk search, depending on whether BM25 is loaded."""
+    if _bm25 is None:
+        _, scores, indices = _dense_search(query, top_k, match)
+        found = indices >= 0
+        return _Hits(indices[found], scores[found])
+
+    # Over-fetch dense candidates so fusion has room to promote lexical hits
+    query_vec, scores, indices = _dense_search(query, max(top_k, HYBRID_CANDIDATES), match)
+    ids, cosine, fused = _hybrid_rank(query, query_vec, scores, indices, top_k, match)
+    return _Hits(ids, cosine, fused)
+
+
+def _cross_encode(query: str, hits: _Hits, budget_ms: float = CROSS_ENCODER_BUDGET_MS) -> _Hits:
+    """
+    Re-order hits by cross-encoder relevance.
+
+    If scoring exceeds budget_ms (0 waits indefinitely) the hits come
+    back in their original order, without rerank scores.
+    """
+    if _reranker is None or hits.ids.size < 2:
+        return hits
+
+    records = [_metadata[i] for i in hits.ids]
+    scores = _reranker.score(
+        query,
+        canonicalize_query(query),
+        # Chunk ids are only stable within one index version
+        [(_index_version, record.get("chunk_id")) for record in records],
+        [record.get("text", "") for record in records],
+        budget_ms,
+    )
+    if scores is None:
+        return hits
+
+    order = np.argsort(-scores, kind="stable")
+    fusion = None if hits.fusion is None else hits.fusion[order]
+    return _Hits(hits.ids[order], hits.scores[order], fusion, scores[order])
+
+
+def _search_multi(queries: list[str], top_k: int, match: Optional[FilterMatch]) -> _Hits:
+    """
+    Search several phrasings of one question and fuse them.
+
+    The queries are embedded in one batch and searched with one
+    index.search call on the stacked matrix; every query's dense (and
+    BM25) ranking then takes part in one reciprocal-rank fusion. Each hit
+    reports its best cosine score over the queries.
+    """
+    dense_k = max(top_k, HYBRID_CANDIDATES) if _bm25 is not None else top_k
+    rows = _dense_search_many([(query, dense_k, match) for query in queries])
+
+    started = time.perf_counter()
+    rankings = []
+    best_cosine: dict[int, float] = {}
+    for query, (_, scores, indices) in zip(queries, rows):
+        found = indices >= 0
+        rankings.append(indices[found])
+        for i, score in zip(indices[found].tolist(), scores[found].tolist()):
+            best_cosine[i] = max(best_cosine.get(i, score), score)
+        if _bm25 is not None:
+            lexical_ids, _ = _bm25.search(
+                query, HYBRID_CANDIDATES, ids=None if match is None else match.ids
+            )
+            rankings.append(lexical_ids)
+
+    ids, fused = reciprocal_rank_fusion(rankings, k=RRF_K)
+    ids, fused = ids[:top_k], fused[:top_k]
+
+    # Lexical-only hits get their best cosine computed exactly
+    cosine = np.array([best_cosine.get(int(i), np.nan) for i in ids], dtype=np.float32)
+    missing = np.isnan(cosine)
+    if missing.any():
+        cosine[missing] = np.max(
+            [_exact_scores(query_vec, ids[missing]) for query_vec, _, _ in rows], axis=0
+        )
+
+    if _bm25 is not None:
+        _lexical_latency.observe((time.perf_counter() - started) * 1000)
+    return _Hits(ids, cosine, fused)
+
+
+def _rank_chunks(queries: list[str], top_k: int, match: Optional[FilterMatch]) -> _Hits:
+    """
+    Statute fast path, else chunk search (cross-encoder re-ranked when enabled).
+
+    The first query is the user's question; any further ones are
+    alternative phrasings searched together with it.
+    """
+    lookups = (_statute_lookup(query, top_k, match) for query in queries)
+    exact = [hits for hits in lookups if hits is not None]
+    if exact:
+        ids = list(dict.fromkeys(int(i) for hits in exact for i in hits.ids))[:top_k]
+        return _Hits(
+            np.asarray(ids, dtype=np.int64), np.ones(len(ids), dtype=np.float32), exact=True
+        )
+
+    # The cross-encoder picks from a wider candidate pool
+    pool_k = max(top_k, CROSS_ENCODER_CANDIDATES) if _reranker is not None else top_k
+    if len(queries) == 1:
+        candidates = _search_chunks(queries[0], pool_k, match)
+    else:
+        candidates = _search_multi(queries, pool_k, match)
+
+    if _reranker is None:
+        return candidates
+    return _cross_encode(queries[0], candidates).head(top_k)
+
+
+def query_variants(queries: Sequence[str], expand: bool = QUERY_EXPANSION_ENABLED) -> list[str]:
+    """
+    Distinct phrasings to search for one question.
+
+    Each given query is followed by its local expansions (old <-> new act
+    names and sections), up to MULTI_QUERY_MAX phrasings in total.
+    """
+    variants = []
+    seen = set()
+    for query in queries:
+        for variant in [query, *(expand_query(query) if expand else [])]:
+            key = canonicalize_query(variant)
+            if key and key not in seen:
+                seen.add(key)
+                variants.append(variant)
+    return variants[:max(1, MULTI_QUERY_MAX)]
+
+
+def _retrieve(
+    queries: list[str],
+    top_k: int,
+    filters: Optional[Mapping[str, Any]],
+    group_sections: bool,
+    counterpart_acts: bool = False,
+) -> list[dict]:
+    """
+    Rank (or fetch from the result cache), then materialize and group.
+
+    Runs under the read lock, so a hot reload cannot swap the index
+    between ranking and reading the metadata.
+    """
+    with _state_lock.read():
+        return _retrieve_locked(queries, top_k, filters, group_sections, counterpart_acts)
+
+
+def _resolve_filter(search_filter: SearchFilter, counterpart_acts: bool) -> FilterMatch:
+    """
+    Chunks passing a filter; with counterpart_acts, an old / new criminal
+    law act also admits its counterpart (of any year), so the expanded
+    phrasings of the question can find the counterpart's sections.
+    """
+    match = _filter_index.resolve(search_filter)
+    counterpart = None
+    if counterpart_acts and search_filter.act:
+        counterpart = counterpart_act(search_filter.act)
+    if counterpart is not None:
+        match = match | _filter_index.resolve(replace(search_filter, act=counterpart, year=None))
+    return match
+
+
+def _retrieve_locked(
+    queries: list[str],
+    top_k: int,
+    filters: Optional[Mapping[str, Any]],
+    group_sections: bool,
+    counterpart_acts: bool = False,
+) -> list[dict]:
+    if _index is None or _metadata is None:
+        logger.error("RAG not initialized")
+        return []
+    if not queries:
+        return []
+
+    search_filter = SearchFilter.from_dict(filters)
+
+    # Neighbouring chunks of one section collapse into one result
+    fetch_k = top_k * SECTION_GROUP_OVERFETCH if group_sections else top_k
+
+    cache_key = (
+        tuple(canonicalize_query(q) for q in queries),
+        fetch_k,
+        search_filter,
+        counterpart_acts,
+        _index_version,
+    )
+    hits = _result_cache.get(cache_key)
+    if hits is None:
+        match = None
+        if search_filter is not None and _filter_index is not None:
+            match = _resolve_filter(search_filter, counterpart_acts)
+            logger.debug(f"Filter {search_filter} matches {len(match)} chunks")
+            if len(match) == 0:
+                return []
+
+        _query_variants.observe(len(queries))
+        hits = _rank_chunks(queries, fetch_k, match)
+        # A re-ranking that ran out of budget is not cached, so the next
+        # identical query still gets the cross-encoder order
+        if _reranker is None or hits.exact or hits.rerank is not None:
+            _result_cache.set(cache_key, hits)
+
+    results = _build_results(hits)
+    if group_sections:
+        results = _group_by_section(results, top_k)
 
     logger.debug(f"Retrieved {len(results)} sections (top score: {results[0]['score']:.3f})" if results else "No results")
     return results
 
 
+def retrieve_sections(
+    query: str,
+    top_k: int = TOP_K,
+    filters: Optional[Mapping[str, Any]] = None,
+    group_sections: bool = SECTION_GROUPING_ENABLED,
+) -> list[dict]:
+    """
+    Retrieve relevant legal sections for a query.
+
+    Ranked hits are cached per (query, top_k, filters) and index version.
+
+    Args:
+        query: The user's question.
+        top_k: Number of results to retrieve.
+        filters: Optional {"act", "category", "year"} restriction, e.g.
+            {"act": "IT Act"}; only chunks matching every given field are
+            searched.
+        group_sections: Return top_k distinct sections, each with the
+            stitched text of all its chunks, instead of top_k chunks.
+
+    Returns:
+        List of matching sections with scores.
+    """
+    return _retrieve([query], top_k, filters, group_sections)
+
+
+def retrieve_multi(
+    queries: Sequence[str],
+    top_k: int = TOP_K,
+    filters: Optional[Mapping[str, Any]] = None,
+    group_sections: bool = SECTION_GROUPING_ENABLED,
+    expand: bool = QUERY_EXPANSION_ENABLED,
+) -> list[dict]:
+    """
+    Retrieve sections for several phrasings of one question at once.
+
+    All phrasings are embedded in one batch, searched with one FAISS call
+    and merged with reciprocal-rank fusion, so extra recall costs about
+    one search rather than several sequential tool calls.
+
+    Args:
+        queries: The question first, then optional sub-queries / rewrites.
+        top_k: Number of results to retrieve.
+        filters: Optional {"act", "category", "year"} restriction. When
+            expansion adds counterpart phrasings, an act filter also
+            admits the counterpart act, or they could never match.
+        group_sections: Return top_k distinct sections instead of chunks.
+        expand: Add old <-> new act variants ("IPC 420" -> "BNS 318").
+
+    Returns:
+        List of matching sections with scores.
+    """
+    variants = query_variants(queries, expand)
+    if len(variants) > 1:
+        logger.debug(f"Searching {len(variants)} phrasings: {variants}")
+    expanded = expand and len(variants) > len(query_variants(queries, expand=False))
+    return _retrieve(variants, top_k, filters, group_sections, counterpart_acts=expanded)
+
+
 # Alias for agent.py
 retrieve = retrieve_sections
 
@@ -0,0 +1,190 @@
+"""
+Cross-encoder re-ranking for Nyay Sathi retrieval.
+
+A cross-encoder reads the query and a chunk together and scores their
+relevance far more precisely than the cosine between two independently
+computed embeddings. It is too slow to run over the corpus, so
+rag_engine over-fetches a few dozen dense / hybrid candidates and only
+those are re-scored, in one batch.
+
+Scoring runs on a dedicated worker thread under a per-request time
+budget: a request that would exceed it gets None back and keeps its
+dense order, while the batch still completes in the background and
+fills the pair-score cache for the next identical query. At most
+max_queue batches wait behind the running one; beyond that a request
+is turned away at once, like a timeout, so sustained overload cannot
+grow an unbounded backlog of batches nobody is waiting for.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Hashable, Optional, Sequence
+
+import numpy as np
+
+import metrics
+from cache import LRUCache
+from executors import BoundedExecutor, ExecutorSaturated
+from logger import rag_logger as logger
+
+
+class CrossEncoderReranker:
+    """
+    Scores (query, chunk) pairs with a sentence-transformers CrossEncoder.
+
+    The model is loaded lazily by the worker thread on first use.
+
+    Args:
+        model_name: Hugging Face cross-encoder model name.
+        device: Torch device for the model ("cpu", "cuda", ...).
+        max_length: Maximum tokens per (query, chunk) pair.
+        cache_size: Pair scores memoized (0 disables the cache).
+        cache_ttl: Seconds a memoized score stays valid, or None.
+        max_queue: Batches allowed to wait for the worker.
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        device: Optional[str] = None,
+        max_length: int = 512,
+        cache_size: int = 20000,
+        cache_ttl: Optional[float] = None,
+        max_queue: int = 1,
+    ):
+        self.model_name = model_name
+        self.device = device
+        self.max_length = max_length
+
+        self._model = None
+        self._load_lock = threading.Lock()
+        # One worker: batches never compete with each other for the CPU.
+        # The bounded queue turns a backlog into immediate rejections
+        self._executor = BoundedExecutor("rerank", max_workers=1, max_queue=max_queue)
+        self._cache: LRUCache[tuple[str, Hashable], float] = LRUCache(
+            "rerank_pair", cache_size, cache_ttl
+        )
+
+        self._latency = metrics.histogram(
+            "rerank_latency_ms",
+            "Time a request spent in cross-encoder re-ranking (cache + batch wait)",
+        )
+        self._batch_size = metrics.histogram(
+            "rerank_batch_size", "Pairs scored by the cross-encoder per batch"
+        )
+        self._timeouts = metrics.counter(
+            "rerank_timeouts", "Re-rankings that exceeded the time budget"
+        )
+        self._errors = metrics.counter("rerank_errors", "Re-rankings that failed")
+
+    def _get_model(self):
+        """Lazy-load the cross-encoder."""
+        if self._model is None:
+            with self._load_lock:
+                if self._model is None:
+                    from sentence_transformers import CrossEncoder
+
+                    logger.info(f"Loading cross-encoder {self.model_name}...")
+                    self._model = CrossEncoder(
+                        self.model_name, device=self.device, max_length=self.max_length
+                    )
+                    logger.info("Cross-encoder loaded")
+        return self._model
+
+    def _predict(
+        self, query: str, keys: list[tuple[str, Hashable]], texts: list[str]
+    ) -> np.ndarray:
+        """Score pairs in one batch and memoize the scores."""
+        model = self._get_model()
+        scores = np.asarray(
+            model.predict(
+                [(query, text) for text in texts],
+                batch_size=len(texts),
+                show_progress_bar=False,
+            ),
+            dtype=np.float32,
+        )
+        self._batch_size.observe(len(texts))
+        for key, score in zip(keys, scores):
+            self._cache.set(key, float(score))
+        return scores
+
+    def score(
+        self,
+        query: str,
+        cache_key: str,
+        chunk_keys: Sequence[Hashable],
+        texts: Sequence[str],
+        budget_ms: float,
+    ) -> Optional[np.ndarray]:
+        """
+        Relevance scores for candidate chunks, higher is better.
+
+        Args:
+            query: The query as the model should read it.
+            cache_key: Canonical form of the query for the pair-score cache.
+            chunk_keys: Stable identifier of each candidate chunk.
+            texts: Text of each candidate chunk.
+            budget_ms: Time allowed for scoring the uncached pairs
+                (0 or less waits indefinitely).
+
+        Returns:
+            One score per candidate, or None if the budget ran out or the
+            model failed (callers keep their original order).
+        """
+        started = time.perf_counter()
+        try:
+            return self._score(query, cache_key, chunk_keys, texts, budget_ms)
+        finally:
+            self._latency.observe((time.perf_counter() - started) * 1000)
+
+    def _score(
+        self,
+        query: str,
+        cache_key: str,
+        chunk_keys: Sequence[Hashable],
+        texts: Sequence[str],
+        budget_ms: float,
+    ) -> Optional[np.ndarray]:
+        scores = np.empty(len(texts), dtype=np.float32)
+        missing = []
+        for i, chunk_key in enumerate(chunk_keys):
+            cached = self._cache.get((cache_key, chunk_key))
+            if cached is None:
+                missing.append(i)
+            else:
+                scores[i] = cached
+        if not missing:
+            return scores
+
+        try:
+            future = self._executor.submit(
+                self._predict,
+                query,
+                [(cache_key, chunk_keys[i]) for i in missing],
+                [texts[i] for i in missing],
+            )
+        except ExecutorSaturated:
+            self._timeouts.inc()
+            logger.warning(f"Re-ranker busy - keeping dense order for {len(missing)} pairs")
+            return None
+        try:
+            scores[missing] = future.result(timeout=budget_ms / 1000 if budget_ms > 0 else None)
+        except FutureTimeoutError:
+            self._timeouts.inc()
+            logger.warning(
+                f"Re-ranking {len(missing)} pairs exceeded {budget_ms:.0f}ms - keeping dense order"
+            )
+            return None
+        except Exception as e:
+            self._errors.inc()
+            logger.error(f"Re-ranking failed: {e}")
+            return None
+        return scores
+
+    def shutdown(self) -> None:
+        """Stop the worker thread without waiting for queued batches."""
+        self._executor.shutdown()
@@ -6,6 +6,7 @@ Protects against prompt injection, XSS, and malicious content.
 
 import html
 import re
+import unicodedata
 from typing import Optional
 
 from logger import app_logger as logger
@@ -59,6 +60,33 @@ def sanitize_user_input(text: str, max_length: int = 2000) -> str:
     return text.strip()
 
 
+_NON_WORD = re.compile(r"[\W_]+", re.UNICODE)
+
+
+def canonicalize_query(text: str) -> str:
+    """
+    Reduce a query to a canonical form for cache keys.
+
+    Undoes the HTML escaping applied by sanitize_user_input, folds Unicode
+    compatibility forms and case, and collapses punctuation and whitespace,
+    so "What is Section 302?" and "what is section 302" share one key.
+
+    Args:
+        text: Raw or sanitized query.
+
+    Returns:
+        Canonical query string.
+    """
+    if not text:
+        return ""
+
+    text = html.unescape(text)
+    text = unicodedata.normalize("NFKC", text).casefold()
+    text = _NON_WORD.sub(" ", text)
+
+    return " ".join(text.split())
+
+
 def detect_prompt_injection(text: str) -> bool:
     """
     Detect potential prompt injection attempts.
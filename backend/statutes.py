@@ -0,0 +1,173 @@
+"""
+Statute reference parsing for Nyay Sathi.
+
+Recognizes literal lookups such as "Section 302 IPC", "BNS 103" or
+"s. 65B Evidence Act" and resolves them through a (act, section) -> chunk
+ids hash index, so exact references skip the embedder and FAISS.
+"""
+
+from __future__ import annotations
+
+import re
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Iterable, Mapping, Optional
+
+# Alias (lowercase, as typed by users) -> canonical act key (see act_key()).
+ACT_ALIASES: dict[str, str] = {
+    # Criminal law (old)
+    "ipc": "indian penal code",
+    "i.p.c.": "indian penal code",
+    "indian penal code": "indian penal code",
+    "penal code": "indian penal code",
+    "crpc": "code of criminal procedure",
+    "cr.p.c.": "code of criminal procedure",
+    "code of criminal procedure": "code of criminal procedure",
+    "criminal procedure code": "code of criminal procedure",
+    "iea": "indian evidence act",
+    "evidence act": "indian evidence act",
+    "indian evidence act": "indian evidence act",
+    # Criminal law (new, 2023)
+    "bns": "bharatiya nyaya sanhita",
+    "bharatiya nyaya sanhita": "bharatiya nyaya sanhita",
+    "bnss": "bharatiya nagarik suraksha sanhita",
+    "bharatiya nagarik suraksha sanhita": "bharatiya nagarik suraksha sanhita",
+    "bsa": "bharatiya sakshya adhiniyam",
+    "bharatiya sakshya adhiniyam": "bharatiya sakshya adhiniyam",
+    # Civil and special laws
+    "cpc": "code of civil procedure",
+    "code of civil procedure": "code of civil procedure",
+    "contract act": "indian contract act",
+    "indian contract act": "indian contract act",
+    "it act": "information technology act",
+    "information technology act": "information technology act",
+    "companies act": "companies act",
+    "pocso": "protection of children from sexual offences act",
+    "pocso act": "protection of children from sexual offences act",
+    "ndps": "narcotic drugs and psychotropic substances act",
+    "ndps act": "narcotic drugs and psychotropic substances act",
+    "rti": "right to information act",
+    "rti act": "right to information act",
+    "right to information act": "right to information act",
+    "hindu marriage act": "hindu marriage act",
+    "hma": "hindu marriage act",
+    "dowry prohibition act": "dowry prohibition act",
+    "consumer protection act": "consumer protection act",
+    "motor vehicles act": "motor vehicles act",
+    "mv act": "motor vehicles act",
+    "negotiable instruments act": "negotiable instruments act",
+    "ni act": "negotiable instruments act",
+}
+
+_YEAR_RE = re.compile(r"\b(1[6-9]|20)\d{2}\b")
+_NON_WORD_RE = re.compile(r"[^0-9a-z]+")
+
+
+def act_key(name: str) -> str:
+    """
+    Canonical key for an act name.
+
+    "India Code: Bharatiya Nyaya Sanhita, 2023" and "the Bharatiya Nyaya
+    Sanhita" both become "bharatiya nyaya sanhita".
+    """
+    name = name.lower()
+    if name.startswith("india code:"):
+        name = name[len("india code:"):]
+    name = _YEAR_RE.sub(" ", name)
+    name = _NON_WORD_RE.sub(" ", name).strip()
+    if name.startswith("the "):
+        name = name[4:]
+    return name
+
+
+def section_key(section: str) -> str:
+    """Canonical key for a section number ("65 B" / "65B" -> "65b")."""
+    return re.sub(r"\s+", "", str(section)).lower()
+
+
+@dataclass(frozen=True)
+class StatuteReference:
+    """A resolved reference to one section of one act."""
+    act: str
+    section: str
+
+
+def _alias_pattern(aliases: Iterable[str]) -> str:
+    # Longest aliases first so "bnss" wins over "bns"
+    escaped = [re.escape(a) for a in sorted(set(aliases), key=len, reverse=True)]
+    return (
+        r"(?<![0-9a-z])(?:the\s+)?(?P<act>" + "|".join(escaped) + r")"
+        r"(?:\s*,?\s*(?:1[6-9]|20)\d{2})?(?![0-9a-z])"
+    )
+
+
+# A year right after an act name ("BNS, 2023") is not a section number
+_SECTION = r"(?!(?:1[6-9]|20)\d{2}(?![0-9a-z]))(?P<section>\d{1,4}[a-z]{0,2})(?![0-9a-z])"
+_SECTION_WORD = r"(?:section|sec\.?|s\.|u/s\.?|u/s)"
+
+_ACT = _alias_pattern(ACT_ALIASES)
+
+# "Section 302 IPC", "s. 65B of the Evidence Act", "u/s 420 of IPC"
+_SECTION_THEN_ACT = re.compile(
+    _SECTION_WORD + r"\s*" + _SECTION + r"\s*(?:,\s*)?(?:of\s+|under\s+|in\s+)?" + _ACT,
+    re.IGNORECASE,
+)
+# "IPC 302", "BNS section 103", "Evidence Act s. 65B"
+_ACT_THEN_SECTION = re.compile(
+    _ACT + r"\s*(?:,\s*)?(?:" + _SECTION_WORD + r"\s*)?" + _SECTION,
+    re.IGNORECASE,
+)
+# Any "section N", with or without an act
+_ANY_SECTION = re.compile(_SECTION_WORD + r"\s*" + _SECTION, re.IGNORECASE)
+
+
+def parse_statute_references(query: str) -> set[StatuteReference]:
+    """Find every (act, section) reference in a query."""
+    text = query.lower()
+    refs = set()
+    for pattern in (_SECTION_THEN_ACT, _ACT_THEN_SECTION):
+        for m in pattern.finditer(text):
+            act = ACT_ALIASES[re.sub(r"\s+", " ", m.group("act"))]
+            refs.add(StatuteReference(act=act, section=section_key(m.group("section"))))
+    return refs
+
+
+def parse_statute_reference(query: str) -> Optional[StatuteReference]:
+    """
+    Parse a query that refers to exactly one section of one act.
+
+    Returns:
+        The reference, or None if there is no reference, more than one, or
+        other section numbers are mentioned without an act
+        ("section 302 and section 304 IPC").
+    """
+    refs = parse_statute_references(query)
+    if len(refs) != 1:
+        return None
+
+    ref = next(iter(refs))
+    mentioned = {section_key(m.group("section")) for m in _ANY_SECTION.finditer(query.lower())}
+    if mentioned - {ref.section}:
+        return None
+    return ref
+
+
+class StatuteIndex:
+    """Hash index from (act key, section key) to chunk ids, in chunk order."""
+
+    def __init__(self, records: Iterable[Mapping]):
+        self._index: dict[tuple[str, str], list[int]] = defaultdict(list)
+        for chunk_id, record in enumerate(records):
+            section = record.get("section_number")
+            if not section:
+                continue
+            key = (act_key(record.get("act_name", "")), section_key(section))
+            self._index[key].append(chunk_id)
+        self._index = dict(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def lookup(self, ref: StatuteReference) -> list[int]:
+        """Chunk ids for a reference (empty if the section is not indexed)."""
+        return self._index.get((ref.act, ref.section), [])
@@ -4,9 +4,9 @@ Tool definitions for Nyay Sathi agentic system.
 Defines the tools that the LLM can call to answer queries.
 """
 
-from typing import Any, Callable
-from pydantic import BaseModel, Field
+from typing import Optional
 
+from pydantic import BaseModel, Field
 
 # =============================================================================
 # TOOL SCHEMAS
@@ -15,6 +15,16 @@ from pydantic import BaseModel, Field
 class RagSearchParams(BaseModel):
     """Parameters for RAG search tool."""
     query: str = Field(..., description="Legal question to search in the database")
+    queries: Optional[list[str]] = Field(
+        None, description="Alternative phrasings searched together with the query"
+    )
+    act: Optional[str] = Field(
+        None, description="Only search this act, e.g. 'IT Act', 'BNS', 'IPC'"
+    )
+    category: Optional[str] = Field(
+        None, description="Only search this category, e.g. 'Criminal Law'"
+    )
+    year: Optional[int] = Field(None, description="Only search acts enacted in this year")
 
 
 class WebSearchParams(BaseModel):
@@ -43,6 +53,29 @@ TOOLS = [
                     "query": {
                         "type": "string",
                         "description": "The legal question to search for"
+                    },
+                    "queries": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": (
+                            "Optional: up to 3 alternative phrasings of the same question "
+                            "(other legal terms, old/new act names), searched together in one call"
+                        )
+                    },
+                    "act": {
+                        "type": "string",
+                        "description": (
+                            "Optional: only search this act when the question names one, "
+                            "e.g. 'IT Act', 'BNS', 'IPC', 'CrPC'"
+                        )
+                    },
+                    "category": {
+                        "type": "string",
+                        "description": "Optional: only search this category, e.g. 'Criminal Law'"
+                    },
+                    "year": {
+                        "type": "integer",
+                        "description": "Optional: only search acts enacted in this year, e.g. 2023"
                     }
                 },
                 "required": ["query"]
@@ -100,6 +133,8 @@ CRITICAL RULES:
 
 TOOLS (use in this order):
 1. rag_search - MANDATORY for all legal questions. Search local database of Indian laws.
+   Set `act` when the question is about one named act (e.g. "IT Act", "BNS").
+   Put alternative phrasings in `queries` instead of calling rag_search again.
 2. web_search - ONLY if rag_search fails. Search gov.in websites.
 3. read_url - Read specific URLs from web_search results.
 
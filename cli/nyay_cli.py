@@ -8,6 +8,7 @@ Connects to the Nyay Sathi API (local or HuggingFace deployment).
 Features:
 - Claude Code-like streaming status updates
 - Live tool execution display
+- Answer text rendered token by token as the model writes it
 - Collapsible progress panels
 
 Usage:
@@ -168,14 +169,16 @@ class NyaySathiClient:
                 icon=data.get("icon", "🔧"),
                 message=data.get("message", "Running..."),
                 query=data.get("query", ""),
-                detail=data.get("detail", "")
+                detail=data.get("detail", ""),
+                call_id=data.get("call_id", "")
             )
         
         elif event_type == "tool_result":
             display.update_tool_result(
                 tool=data.get("tool", "unknown"),
                 status=data.get("status", "error"),
-                count=data.get("count", 0)
+                count=data.get("count", 0),
+                call_id=data.get("call_id", "")
             )
         
         elif event_type == "thinking":
@@ -187,6 +190,12 @@ class NyaySathiClient:
                 web=data.get("web", [])
             )
         
+        elif event_type == "answer_delta":
+            display.append_answer(data.get("text", ""))
+
+        elif event_type == "answer_reset":
+            display.reset_answer()
+
         elif event_type == "answer":
             display.set_answer(
                 text=data.get("text", ""),
@@ -61,6 +61,7 @@ class ToolStep:
     message: str
     query: str = ""
     detail: str = ""
+    call_id: str = ""
     status: str = "running"  # running, success, error
     count: int = 0
     collapsed: bool = False
@@ -74,6 +75,7 @@ class StreamingState:
     steps: List[ToolStep] = field(default_factory=list)
     is_thinking: bool = False
     thinking_message: str = ""
+    streamed_answer: str = ""  # answer_delta text received so far
     final_answer: str = ""
     mode: str = ""
     confidence: str = ""
@@ -167,7 +169,7 @@ class StreamingDisplay:
         elements = []
         
         # Current status (if not done)
-        if not self.state.done and not self.state.final_answer:
+        if not self.state.done and not self.state.final_answer and not self.state.streamed_answer:
             status_text = Text()
             status_text.append(f"{self.state.current_icon} ", style="bold")
             status_text.append(self.state.current_status, style="cyan")
@@ -189,6 +191,11 @@ class StreamingDisplay:
             elements.append(Text())  # Spacer
             elements.append(thinking)
         
+        # Answer as it streams in
+        if self.state.streamed_answer:
+            elements.append(Text())
+            elements.append(self._build_answer_tail(len(elements)))
+
         # Error
         if self.state.error:
             elements.append(Text())
@@ -196,6 +203,18 @@ class StreamingDisplay:
         
         return Group(*elements)
     
+    def _build_answer_tail(self, used_rows: int) -> Text:
+        """The streamed answer, cut to its last lines that fit on screen."""
+        answer = Text(self.state.streamed_answer)
+        answer.highlight_regex(r"\[\d+\]", "cyan")
+
+        # Tool panels take up to 3 rows each
+        budget = max(3, console.size.height - 3 * used_rows - 2)
+        lines = answer.wrap(console, console.width)
+        if len(lines) > budget:
+            answer = Text("\n").join(lines[-budget:])
+        return answer
+
     def start(self):
         """Start the live display."""
         self.live = Live(
@@ -214,10 +233,11 @@ class StreamingDisplay:
             self.live.update(self._build_display())
     
     def add_tool_start(self, tool: str, display_name: str, icon: str, message: str, 
-                       query: str = "", detail: str = ""):
+                       query: str = "", detail: str = "", call_id: str = ""):
         """Add a new tool step in running state."""
         step = ToolStep(
             tool=tool,
+            call_id=call_id,
             display_name=display_name,
             icon=icon,
             message=message,
@@ -230,10 +250,11 @@ class StreamingDisplay:
         if self.live:
             self.live.update(self._build_display())
     
-    def update_tool_result(self, tool: str, status: str, count: int = 0):
-        """Update a tool step with its result."""
+    def update_tool_result(self, tool: str, status: str, count: int = 0, call_id: str = ""):
+        """Update a tool step with its result (matched by call id when the server sends one)."""
         for step in reversed(self.state.steps):
-            if step.tool == tool and step.status == "running":
+            matches = step.call_id == call_id if call_id else step.tool == tool
+            if matches and step.status == "running":
                 step.status = status
                 step.count = count
                 break
@@ -247,6 +268,19 @@ class StreamingDisplay:
         if self.live:
             self.live.update(self._build_display())
     
+    def append_answer(self, text: str):
+        """Append streamed answer text."""
+        self.state.streamed_answer += text
+        self.state.is_thinking = False
+        if self.live:
+            self.live.update(self._build_display())
+
+    def reset_answer(self):
+        """Discard streamed text that turned out not to be the answer."""
+        self.state.streamed_answer = ""
+        if self.live:
+            self.live.update(self._build_display())
+
     def set_error(self, error: str):
         """Set error state."""
         self.state.error = error
@@ -315,25 +349,6 @@ def colorize_citations(text: str) -> str:
     return re.sub(r'\[(\d+)\]', r'[cyan][\1][/cyan]', text)
 
 
-def stream_text(text: str, delay: float = 0.003):
-    """Stream text with a typing effect."""
-    with Live(console=console, refresh_per_second=30, transient=False) as live:
-        display_text = Text()
-        words = text.split(" ")
-        
-        for i, word in enumerate(words):
-            # Check for citations to color
-            if re.match(r'\[\d+\]', word):
-                display_text.append(word + " ", style="cyan")
-            else:
-                display_text.append(word + " ")
-            
-            live.update(display_text)
-            time.sleep(delay)
-    
-    console.print()
-
-
 def print_answer(
     answer: str,
     mode: str,
@@ -342,17 +357,13 @@ def print_answer(
     web_sources: list,
     tokens_in: int = 0,
     tokens_out: int = 0,
-    stream: bool = True,
 ):
     """Print the answer with formatted output."""
     console.print()
     
-    # Print answer with colored citations and streaming
-    if stream:
-        stream_text(answer)
-    else:
-        console.print(colorize_citations(answer))
-        console.print()
+    # Print answer with colored citations
+    console.print(colorize_citations(answer))
+    console.print()
     
     # Sources section - only show sources that are actually cited in the answer
     import re
@@ -433,7 +444,6 @@ def print_streaming_result(display: StreamingDisplay):
         web_sources=state.web_sources,
         tokens_in=state.tokens_in,
         tokens_out=state.tokens_out,
-        stream=True,
     )
 
 
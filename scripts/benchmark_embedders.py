@@ -0,0 +1,124 @@
+"""
+Benchmark embedding backends.
+
+Compares the torch (sentence-transformers) and int8 ONNX Runtime
+backends on single-query encode latency (p50/p99), resident memory and
+cold-start time. Each backend runs in a fresh subprocess so memory and
+start-up numbers are not polluted by the other backend's imports.
+
+Usage:
+    python benchmark_embedders.py
+    python benchmark_embedders.py --backends onnx --queries 500
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from config import BACKEND_DIR, EMBEDDING_MODEL, ONNX_MODEL_DIR
+from utils import setup_logger
+
+logger = setup_logger(__name__)
+
+SAMPLE_QUERIES = [
+    "what is section 302",
+    "how to file an FIR",
+    "punishment for cheating under section 420 IPC",
+    "is defamation a cognizable offence",
+    "what does BNS 103 say about murder",
+    "bail provisions for non-bailable offences",
+    "rights of an arrested person",
+    "section 65B electronic evidence certificate",
+]
+
+
+def _rss_mb() -> float:
+    """Current resident set size of this process in MB."""
+    try:
+        with open("/proc/self/status", "r") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    import resource
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_worker(backend: str, model_name: str, n_queries: int) -> dict:
+    """Measure one backend inside the current (fresh) process."""
+    import numpy as np
+
+    sys.path.append(str(BACKEND_DIR))
+    rss_before = _rss_mb()
+
+    start = time.perf_counter()
+    from embedders import create_embedder
+    embedder = create_embedder(backend, model_name, device="cpu", onnx_model_dir=ONNX_MODEL_DIR)
+    embedder.encode([SAMPLE_QUERIES[0]])
+    cold_start = time.perf_counter() - start
+
+    latencies = []
+    for i in range(n_queries):
+        query = SAMPLE_QUERIES[i % len(SAMPLE_QUERIES)]
+        t0 = time.perf_counter()
+        embedder.encode([query])
+        latencies.append((time.perf_counter() - t0) * 1000)
+
+    p50, p99 = np.percentile(latencies, [50, 99])
+    return {
+        "backend": backend,
+        "cold_start_s": round(cold_start, 3),
+        "p50_ms": round(float(p50), 3),
+        "p99_ms": round(float(p99), 3),
+        "rss_mb": round(_rss_mb(), 1),
+        "rss_delta_mb": round(_rss_mb() - rss_before, 1),
+    }
+
+
+def run_backend(backend: str, model_name: str, n_queries: int) -> dict:
+    """Run the worker for one backend in a subprocess and parse its JSON output."""
+    cmd = [
+        sys.executable, str(Path(__file__).resolve()),
+        "--worker", backend, "--model", model_name, "--queries", str(n_queries),
+    ]
+    proc = subprocess.run(cmd, capture_output=True, text=True)
+    if proc.returncode != 0:
+        logger.error(f"{backend} benchmark failed:\n{proc.stderr.strip()}")
+        return {"backend": backend, "error": proc.stderr.strip().splitlines()[-1:]}
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    """Main entry point for the embedder benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark embedding backends")
+    parser.add_argument("--backends", nargs="+", default=["torch", "onnx"])
+    parser.add_argument("--model", default=EMBEDDING_MODEL)
+    parser.add_argument("--queries", type=int, default=200, help="Timed single-query encodes")
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(run_worker(args.worker, args.model, args.queries)))
+        return
+
+    results = [run_backend(b, args.model, args.queries) for b in args.backends]
+
+    header = f"{'backend':<8} {'cold start':>11} {'p50':>9} {'p99':>9} {'RSS':>9} {'RSS delta':>10}"
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        if "error" in r:
+            print(f"{r['backend']:<8} error: {' '.join(r['error'])}")
+            continue
+        print(
+            f"{r['backend']:<8} {r['cold_start_s']:>10.2f}s {r['p50_ms']:>7.2f}ms "
+            f"{r['p99_ms']:>7.2f}ms {r['rss_mb']:>7.0f}MB {r['rss_delta_mb']:>8.0f}MB"
+        )
+
+
+if __name__ == "__main__":
+    main()
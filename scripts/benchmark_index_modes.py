@@ -0,0 +1,156 @@
+"""
+Benchmark compressed vector storage modes.
+
+Builds a flat index in every storage mode (float32, fp16, sq8, pq,
+binary) from the corpus vectors and reports, for each one, the memory
+per vector, single-query latency (p50/p99) and recall@k against exact
+search: straight from the compressed index, and after over-fetching
+candidates and re-ranking them with the float16 side array the way
+rag_engine does.
+
+Vectors come from the float16 side array when it exists, otherwise from
+the current faiss.index.
+
+Usage:
+    python benchmark_index_modes.py
+    python benchmark_index_modes.py --modes sq8 pq --overfetch 8
+"""
+
+import argparse
+import time
+
+import faiss
+import numpy as np
+
+from build_faiss_index import (
+    STORAGE_MODES,
+    build_index,
+    load_tuning_queries,
+    resolve_index_factory,
+)
+from config import AUTOTUNE_QUERIES, FAISS_INDEX_FILE, RERANK_VECTORS_FILE
+from utils import setup_logger
+
+logger = setup_logger(__name__)
+
+
+def load_vectors() -> np.ndarray:
+    """Corpus vectors in index order, as float32."""
+    if RERANK_VECTORS_FILE.exists():
+        return np.load(RERANK_VECTORS_FILE).astype(np.float32)
+    index = faiss.read_index(str(FAISS_INDEX_FILE))
+    return index.reconstruct_n(0, index.ntotal)
+
+
+def _recall(
+    found: list[np.ndarray], queries: np.ndarray, vectors: np.ndarray, kth_scores: np.ndarray
+) -> float:
+    """
+    Mean recall@k, tie-aware.
+
+    The corpus has identical chunks under different acts, so a hit counts
+    when its exact score reaches the k-th exact score (within float16
+    error) rather than only when it is the same id exact search returned.
+    """
+    k = len(found[0])
+    hits = [
+        np.count_nonzero(vectors[ids[ids >= 0]] @ query >= kth - 1e-3) / k
+        for ids, query, kth in zip(found, queries, kth_scores)
+    ]
+    return float(np.mean(hits))
+
+
+def benchmark_mode(
+    storage: str,
+    vectors: np.ndarray,
+    queries: np.ndarray,
+    kth_scores: np.ndarray,
+    k: int,
+    overfetch: int,
+) -> dict:
+    """Build one storage mode and measure memory, latency and recall."""
+    factory = resolve_index_factory("flat", *vectors.shape, storage)
+    index = build_index(vectors, factory)
+    rerank_vectors = vectors.astype(np.float16)
+
+    # Code bytes per vector, plus the whole serialized index (which adds
+    # fixed costs such as the LSH rotation and PQ codebooks)
+    code_bytes = index.sa_code_size()
+    index_mb = len(faiss.serialize_index(index)) / 1e6
+    side_bytes = rerank_vectors.itemsize * vectors.shape[1]
+
+    direct_ids, reranked_ids = [], []
+    direct_ms, reranked_ms = [], []
+    for query in queries:
+        q = query[None, :]
+
+        t0 = time.perf_counter()
+        _, ids = index.search(q, k)
+        direct_ms.append((time.perf_counter() - t0) * 1000)
+        direct_ids.append(ids[0])
+
+        t0 = time.perf_counter()
+        _, candidates = index.search(q, k * overfetch)
+        candidates = candidates[0][candidates[0] >= 0]
+        scores = rerank_vectors[candidates].astype(np.float32) @ query
+        ids = candidates[np.argsort(-scores, kind="stable")[:k]]
+        reranked_ms.append((time.perf_counter() - t0) * 1000)
+        reranked_ids.append(ids)
+
+    return {
+        "storage": storage,
+        "factory": factory,
+        "bytes_per_vector": code_bytes,
+        "index_mb": index_mb,
+        "rerank_bytes_per_vector": side_bytes,
+        "p50_ms": float(np.percentile(direct_ms, 50)),
+        "p99_ms": float(np.percentile(direct_ms, 99)),
+        "recall": _recall(direct_ids, queries, vectors, kth_scores),
+        "rerank_p50_ms": float(np.percentile(reranked_ms, 50)),
+        "rerank_p99_ms": float(np.percentile(reranked_ms, 99)),
+        "rerank_recall": _recall(reranked_ids, queries, vectors, kth_scores),
+    }
+
+
+def main() -> None:
+    """Main entry point for the storage mode benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark compressed vector storage modes")
+    parser.add_argument("--modes", nargs="+", choices=STORAGE_MODES, default=list(STORAGE_MODES))
+    parser.add_argument("--k", type=int, default=5, help="Recall@k cut-off")
+    parser.add_argument(
+        "--overfetch", type=int, default=4, help="Candidates per result before re-ranking"
+    )
+    parser.add_argument("--queries", type=int, default=AUTOTUNE_QUERIES)
+    args = parser.parse_args()
+
+    vectors = load_vectors()
+    queries = load_tuning_queries(vectors, args.queries)
+
+    exact = faiss.IndexFlatIP(vectors.shape[1])
+    exact.add(vectors)
+    exact_scores, _ = exact.search(queries, args.k)
+
+    results = [
+        benchmark_mode(mode, vectors, queries, exact_scores[:, -1], args.k, args.overfetch)
+        for mode in args.modes
+    ]
+
+    print(f"\n{len(vectors)} vectors x {vectors.shape[1]} dims, {len(queries)} queries, "
+          f"recall@{args.k}, re-rank over-fetch {args.overfetch}x\n")
+    header = (
+        f"{'storage':<8} {'factory':<9} {'B/vec':>6} {'index':>7} {'+fp16':>6} "
+        f"{'p50':>8} {'recall':>7} {'rr p50':>8} {'rr p99':>8} {'rr recall':>9}"
+    )
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        print(
+            f"{r['storage']:<8} {r['factory']:<9} {r['bytes_per_vector']:>6} "
+            f"{r['index_mb']:>5.2f}MB "
+            f"{r['rerank_bytes_per_vector']:>6.0f} {r['p50_ms']:>6.3f}ms {r['recall']:>7.3f} "
+            f"{r['rerank_p50_ms']:>6.3f}ms {r['rerank_p99_ms']:>6.3f}ms {r['rerank_recall']:>9.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
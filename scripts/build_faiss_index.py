@@ -2,27 +2,68 @@
 Build FAISS index from chunked section data.
 
 This script generates embeddings for all chunks and builds a FAISS
-index for fast similarity search.
+index for fast similarity search, plus a BM25 index over the chunk
+texts for hybrid (lexical + dense) retrieval.
+
+The index type is chosen with --index-factory (flat, ivf, hnsw, ivfpq or
+any faiss.index_factory string) and the vector encoding with --storage
+(float32, fp16, sq8, pq, binary). Compressed encodings also write a
+float16 copy of the vectors that the API re-ranks candidates with.
+With --autotune the build sweeps
+nprobe / efSearch against exact search on held-out queries and records
+the fastest setting that meets the recall target in manifest.json; the
+API applies it when it loads the index.
+
+Usage:
+    python build_faiss_index.py                # embed chunks and build everything
+    python build_faiss_index.py --reuse-index  # keep faiss.index, rebuild side files
+    python build_faiss_index.py --index-factory hnsw --autotune
+    python build_faiss_index.py --storage sq8
 """
 
+import argparse
 import json
+import math
+import os
 import pickle
+import shutil
 import sys
+import time
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Iterator, Optional
 
 import faiss
 import numpy as np
-from sentence_transformers import SentenceTransformer
 
 from config import (
+    AUTOTUNE_K,
+    AUTOTUNE_QUERIES,
+    AUTOTUNE_RECALL_TARGET,
+    BACKEND_DIR,
+    BM25_FILE,
     CHUNKS_FILE,
+    EMBEDDING_BACKEND,
+    EMBEDDING_MODEL,
+    FAISS_INDEX_FACTORY,
     FAISS_INDEX_FILE,
     FAISS_META_FILE,
-    EMBEDDING_MODEL,
+    FAISS_META_STORE_DIR,
+    FAISS_STORAGE,
+    METADATA_COMPRESSION,
+    ONNX_MODEL_DIR,
+    PROCESSED_DIR,
+    RERANK_VECTORS_FILE,
     ensure_directories,
 )
 from utils import setup_logger
 
+sys.path.append(str(BACKEND_DIR))
+from embedders import create_embedder  # noqa: E402
+from lexical import BM25Index  # noqa: E402
+from manifest import MANIFEST_FILE, load_manifest, write_manifest  # noqa: E402
+from metadata_store import write_metadata_store  # noqa: E402
+
 logger = setup_logger(__name__)
 
 
@@ -47,6 +88,7 @@ def load_chunks() -> list[dict]:
 def generate_embeddings(
     texts: list[str],
     model_name: str = EMBEDDING_MODEL,
+    backend: str = EMBEDDING_BACKEND,
 ) -> np.ndarray:
     """
     Generate embeddings for texts.
@@ -54,65 +96,411 @@ def generate_embeddings(
     Args:
         texts: List of text strings.
         model_name: Name of the embedding model.
+        backend: Embedding backend ("torch" or "onnx").
 
     Returns:
-        Numpy array of embeddings.
+        Numpy array of normalized embeddings (for cosine similarity with IP index).
     """
-    logger.info(f"Loading model: {model_name}")
-    model = SentenceTransformer(model_name)
+    logger.info(f"Loading {backend} model: {model_name}")
+    model = create_embedder(backend, model_name, onnx_model_dir=ONNX_MODEL_DIR)
     
     logger.info("Generating embeddings...")
-    embeddings = model.encode(
-        texts,
-        show_progress_bar=True,
-        convert_to_numpy=True,
-        normalize_embeddings=True,  # For cosine similarity with IP index
-    )
+    embeddings = model.encode(texts, show_progress_bar=True)
     
     logger.info(f"Embeddings shape: {embeddings.shape}")
     return embeddings
 
 
-def build_index(embeddings: np.ndarray) -> faiss.Index:
+STORAGE_MODES = ("float32", "fp16", "sq8", "pq", "binary")
+
+
+def _storage_codec(storage: str, n_vectors: int, dimension: int) -> str:
+    """index_factory encoding for a vector storage mode."""
+    if storage == "float32":
+        return "Flat"
+    if storage == "fp16":
+        return "SQfp16"
+    if storage == "sq8":
+        return "SQ8"
+    if storage == "pq":
+        # 8-dimensional sub-quantizers; 4-bit codes until there is enough
+        # data to train 256 centroids per sub-quantizer
+        m = max(d for d in range(1, dimension // 8 + 1) if dimension % d == 0)
+        nbits = 8 if n_vectors >= 256 * 39 else 4
+        return f"PQ{m}x{nbits}"
+    if storage == "binary":
+        # Random rotation + per-bit thresholds, one bit per dimension
+        return "LSHrt"
+    raise ValueError(f"Unknown storage mode: {storage} (expected one of {STORAGE_MODES})")
+
+
+def resolve_index_factory(
+    name: str,
+    n_vectors: int,
+    dimension: int,
+    storage: str = "float32",
+) -> str:
+    """
+    Turn an index preset into a faiss.index_factory string.
+
+    Presets are sized to the corpus: IVF uses about 4 * sqrt(n) lists,
+    capped so every list gets the ~39 training points FAISS asks for.
+    The storage mode picks how vectors are encoded inside the preset.
+    Anything that is not a preset is returned unchanged.
+
+    Args:
+        name: "flat", "ivf", "hnsw", "ivfpq" or a factory string.
+        n_vectors: Number of vectors to index.
+        dimension: Vector dimension.
+        storage: One of STORAGE_MODES ("ivfpq" always uses "pq").
+    """
+    preset = name.strip().lower()
+    nlist = max(1, min(int(4 * math.sqrt(n_vectors)), n_vectors // 39))
+
+    if preset == "ivfpq":
+        preset, storage = "ivf", "pq"
+    if preset not in ("flat", "ivf", "hnsw"):
+        return name
+
+    codec = _storage_codec(storage, n_vectors, dimension)
+    if preset == "flat":
+        return codec
+    if storage == "binary":
+        raise ValueError("binary storage is only available with the flat preset")
+    if preset == "ivf":
+        return f"IVF{nlist},{codec}"
+    return "HNSW32" if storage == "float32" else f"HNSW32_{codec}"
+
+
+def build_index(embeddings: np.ndarray, factory: str = "Flat") -> faiss.Index:
     """
     Build FAISS index from embeddings.
 
     Args:
-        embeddings: Numpy array of embeddings.
+        embeddings: Numpy array of normalized embeddings.
+        factory: faiss.index_factory string (see resolve_index_factory()).
 
     Returns:
         FAISS index.
     """
     dimension = embeddings.shape[1]
     
-    # IndexFlatIP with normalized embeddings = Cosine Similarity
-    index = faiss.IndexFlatIP(dimension)
+    # Inner product on normalized embeddings = Cosine Similarity.
+    # LSH only supports Hamming distance, so its scores come from re-ranking.
+    metric = faiss.METRIC_L2 if factory.startswith("LSH") else faiss.METRIC_INNER_PRODUCT
+    index = faiss.index_factory(dimension, factory, metric)
+    if not index.is_trained:
+        logger.info(f"Training {factory} on {len(embeddings)} vectors")
+        index.train(embeddings)
     index.add(embeddings)
+
+    # IVF indexes need a direct map for reconstruct(), which the API uses
+    # to re-score hybrid search candidates
+    ivf = faiss.try_extract_index_ivf(index)
+    if ivf is not None:
+        ivf.make_direct_map()
     
-    logger.info(f"Index built with {index.ntotal} vectors")
+    logger.info(f"{factory} index built with {index.ntotal} vectors")
     return index
 
 
-def save_outputs(index: faiss.Index, chunks: list[dict]) -> None:
+def stores_exact_vectors(index: faiss.Index, embeddings: np.ndarray) -> bool:
+    """Whether the index returns the original float32 vectors (and exact scores)."""
+    sample = np.arange(min(len(embeddings), 256), dtype=np.int64)
+    try:
+        reconstructed = index.reconstruct_batch(sample)
+    except RuntimeError:
+        return False
+    return bool(np.allclose(reconstructed, embeddings[sample], atol=1e-6))
+
+
+@contextmanager
+def replacing(path: Path) -> Iterator[Path]:
+    """
+    Yield a temporary path next to path and move it into place on success.
+
+    Running API workers memory-map the artifacts and hot-reload them when
+    the manifest changes. Writing a new file and renaming it over the old
+    one leaves their mappings of the old file intact, where rewriting it
+    in place would change (or truncate) pages under them.
+
+    Args:
+        path: Final file or directory path.
+    """
+    tmp = path.with_name(f".{path.stem}.tmp{path.suffix}")
+    try:
+        yield tmp
+        if tmp.is_dir() and path.is_dir():
+            # A directory cannot be renamed over a non-empty one
+            old = path.with_name(f".{path.name}.old")
+            shutil.rmtree(old, ignore_errors=True)
+            path.rename(old)
+            tmp.rename(path)
+            shutil.rmtree(old)
+        else:
+            os.replace(tmp, path)
+    finally:
+        if tmp.is_dir():
+            shutil.rmtree(tmp)
+        else:
+            tmp.unlink(missing_ok=True)
+
+
+def save_rerank_vectors(embeddings: Optional[np.ndarray]) -> None:
+    """
+    Write (or remove) the float16 side array used for exact re-ranking.
+
+    Args:
+        embeddings: Vectors in index order, or None when the index stores
+            exact vectors and no side array is needed.
+    """
+    if embeddings is None:
+        RERANK_VECTORS_FILE.unlink(missing_ok=True)
+        return
+    logger.info(f"Saving float16 re-rank vectors to {RERANK_VECTORS_FILE}")
+    with replacing(RERANK_VECTORS_FILE) as tmp:
+        np.save(tmp, embeddings.astype(np.float16))
+
+
+def _tuning_grid(index: faiss.Index) -> Optional[tuple[str, list[int]]]:
+    """Search parameter and candidate values for an index (None if exact)."""
+    ivf = faiss.try_extract_index_ivf(index)
+    if ivf is not None:
+        values = [p for p in (1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024) if p < ivf.nlist]
+        return "nprobe", values + [ivf.nlist]
+
+    if hasattr(faiss.downcast_index(index), "hnsw"):
+        return "efSearch", [16, 24, 32, 48, 64, 96, 128, 192, 256, 384, 512]
+
+    return None
+
+
+def load_tuning_queries(
+    vectors: np.ndarray,
+    n_queries: int,
+    queries_file: Optional[Path] = None,
+) -> np.ndarray:
+    """
+    Query vectors for auto-tuning.
+
+    Encodes the questions in queries_file (one per line) when given.
+    Otherwise perturbs a random sample of chunk vectors, since real
+    queries land near a chunk rather than exactly on it.
+
+    Args:
+        vectors: Indexed (normalized) vectors.
+        n_queries: Number of sampled queries when no file is given.
+        queries_file: Optional text file of held-out questions.
+    """
+    if queries_file is not None:
+        lines = queries_file.read_text(encoding="utf-8").splitlines()
+        queries = [q.strip() for q in lines if q.strip()]
+        logger.info(f"Encoding {len(queries)} tuning queries from {queries_file}")
+        model = create_embedder(EMBEDDING_BACKEND, EMBEDDING_MODEL, onnx_model_dir=ONNX_MODEL_DIR)
+        return model.encode(queries)
+
+    rng = np.random.default_rng(0)
+    picks = rng.choice(len(vectors), size=min(n_queries, len(vectors)), replace=False)
+    noise = rng.standard_normal((len(picks), vectors.shape[1])).astype(np.float32)
+    queries = (vectors[picks] + 0.5 * noise / np.sqrt(vectors.shape[1])).astype(np.float32)
+    faiss.normalize_L2(queries)
+    return queries
+
+
+def autotune_search_params(
+    index: faiss.Index,
+    vectors: np.ndarray,
+    queries: np.ndarray,
+    k: int = AUTOTUNE_K,
+    recall_target: float = AUTOTUNE_RECALL_TARGET,
+) -> str:
+    """
+    Pick the fastest nprobe / efSearch meeting a recall@k target.
+
+    Recall is measured against exact inner-product search over the same
+    vectors. If no setting meets the target, the one with the highest
+    recall is used.
+
+    Args:
+        index: Built (approximate) index.
+        vectors: The vectors in the index, in id order.
+        queries: Held-out query vectors.
+        k: Neighbours compared per query.
+        recall_target: Minimum mean recall@k.
+
+    Returns:
+        Search parameters for faiss.ParameterSpace (e.g. "nprobe=8"),
+        or "" for exact indexes.
+    """
+    grid = _tuning_grid(index)
+    if grid is None:
+        logger.info("Exact index - no search parameters to tune")
+        return ""
+
+    name, values = grid
+    exact = faiss.IndexFlatIP(vectors.shape[1])
+    exact.add(vectors)
+    _, truth = exact.search(queries, k)
+
+    space = faiss.ParameterSpace()
+    best: Optional[tuple[str, float]] = None
+    # (recall, -latency, params): highest recall, then fastest
+    most_recall: tuple[float, float, str] = (-1.0, 0.0, "")
+
+    logger.info(f"Auto-tuning {name} on {len(queries)} queries (recall@{k} >= {recall_target})")
+    for value in values:
+        params = f"{name}={value}"
+        space.set_index_parameters(index, params)
+        index.search(queries[:1], k)
+
+        started = time.perf_counter()
+        _, found = index.search(queries, k)
+        latency_ms = (time.perf_counter() - started) * 1000 / len(queries)
+
+        recall = np.mean([len(set(f) & set(t)) / k for f, t in zip(found, truth)])
+        logger.info(f"  {params:<14} recall@{k}={recall:.3f}  {latency_ms:.4f} ms/query")
+
+        if recall >= recall_target and (best is None or latency_ms < best[1]):
+            best = (params, latency_ms)
+        most_recall = max(most_recall, (recall, -latency_ms, params))
+
+    if best is None:
+        logger.warning(f"No setting reached recall@{k} >= {recall_target}; using {most_recall[2]}")
+        return most_recall[2]
+
+    logger.info(f"Selected {best[0]}")
+    return best[0]
+
+
+def build_bm25(texts: list[str]) -> BM25Index:
+    """
+    Build the BM25 index over chunk texts.
+
+    Args:
+        texts: Chunk texts, in index order.
+
+    Returns:
+        BM25 index.
+    """
+    bm25 = BM25Index.build(texts)
+    logger.info(
+        f"BM25 index built: {len(bm25.vocabulary)} terms, "
+        f"{bm25.weights.nnz} postings"
+    )
+    return bm25
+
+
+def save_outputs(
+    index: faiss.Index,
+    chunks: list[dict],
+    bm25: BM25Index,
+    index_factory: str = "Flat",
+    search_params: str = "",
+    metadata_compression: str = METADATA_COMPRESSION,
+) -> None:
     """
-    Save FAISS index and metadata.
+    Save FAISS index, metadata and BM25 index, plus a manifest with
+    their sizes and checksums for the API's startup verification.
+
+    Every artifact is written aside and renamed into place, and the
+    manifest goes last, so a running API that polls the manifest only
+    ever hot-reloads a complete build.
 
     Args:
         index: FAISS index to save.
         chunks: Chunk metadata to save.
+        bm25: BM25 index to save.
+        index_factory: Factory string the index was built with.
+        search_params: Tuned search parameters the API applies at load.
+        metadata_compression: "zstd" or "none" for the chunk text column.
     """
     FAISS_INDEX_FILE.parent.mkdir(parents=True, exist_ok=True)
     
     logger.info(f"Saving index to {FAISS_INDEX_FILE}")
-    faiss.write_index(index, str(FAISS_INDEX_FILE))
+    with replacing(FAISS_INDEX_FILE) as tmp:
+        faiss.write_index(index, str(tmp))
     
     logger.info(f"Saving metadata to {FAISS_META_FILE}")
-    with open(FAISS_META_FILE, "wb") as f:
+    with replacing(FAISS_META_FILE) as tmp, open(tmp, "wb") as f:
         pickle.dump(chunks, f)
 
+    logger.info(
+        f"Saving columnar metadata store to {FAISS_META_STORE_DIR} (text: {metadata_compression})"
+    )
+    with replacing(FAISS_META_STORE_DIR) as tmp:
+        write_metadata_store(chunks, tmp, compression=metadata_compression)
+
+    logger.info(f"Saving BM25 index to {BM25_FILE}")
+    with replacing(BM25_FILE) as tmp:
+        bm25.save(tmp)
+
+    logger.info(f"Writing manifest to {PROCESSED_DIR / MANIFEST_FILE}")
+    write_manifest(
+        PROCESSED_DIR,
+        [FAISS_INDEX_FILE, FAISS_META_STORE_DIR, BM25_FILE, RERANK_VECTORS_FILE],
+        embedding_model=EMBEDDING_MODEL,
+        embedding_backend=EMBEDDING_BACKEND,
+        dimension=index.d,
+        ntotal=index.ntotal,
+        index_factory=index_factory,
+        search_params=search_params,
+    )
+
+
+def load_existing_index(expected: int) -> faiss.Index:
+    """
+    Load the current FAISS index for --reuse-index.
+
+    Args:
+        expected: Number of chunks the index must cover.
+    """
+    if not FAISS_INDEX_FILE.exists():
+        logger.error(f"No existing index to reuse: {FAISS_INDEX_FILE}")
+        sys.exit(1)
+
+    index = faiss.read_index(str(FAISS_INDEX_FILE))
+    if index.ntotal != expected:
+        logger.error(f"Existing index has {index.ntotal} vectors but there are {expected} chunks")
+        sys.exit(1)
+
+    logger.info(f"Reusing existing index with {index.ntotal} vectors")
+    return index
+
 
 def main() -> None:
     """Main entry point for building FAISS index."""
+    parser = argparse.ArgumentParser(description="Build FAISS index from chunked sections")
+    parser.add_argument(
+        "--reuse-index",
+        action="store_true",
+        help="Keep the existing faiss.index and only rebuild metadata and side indexes",
+    )
+    parser.add_argument(
+        "--index-factory",
+        default=FAISS_INDEX_FACTORY,
+        help="flat, ivf, hnsw, ivfpq or a faiss.index_factory string",
+    )
+    parser.add_argument(
+        "--storage",
+        choices=STORAGE_MODES,
+        default=FAISS_STORAGE,
+        help="Vector encoding for the index presets",
+    )
+    parser.add_argument(
+        "--autotune",
+        action="store_true",
+        help="Tune nprobe / efSearch for the recall target and store the result",
+    )
+    parser.add_argument(
+        "--text-compression",
+        choices=("zstd", "none"),
+        default=METADATA_COMPRESSION,
+        help="Storage of chunk text in the metadata store",
+    )
+    parser.add_argument("--recall-target", type=float, default=AUTOTUNE_RECALL_TARGET)
+    parser.add_argument("--tune-queries", type=Path, help="Held-out questions, one per line")
+    args = parser.parse_args()
+
     logger.info("Starting FAISS index build...")
     ensure_directories()
     
@@ -123,20 +511,51 @@ def main() -> None:
         return
     
     texts = [chunk.get("text", "") for chunk in chunks]
+    previous = load_manifest(PROCESSED_DIR) or {}
     
-    # Generate embeddings
-    embeddings = generate_embeddings(texts)
+    if args.reuse_index:
+        index = load_existing_index(len(chunks))
+        index_factory = previous.get("index_factory", "Flat")
+        search_params = previous.get("search_params", "")
+        embeddings = None
+        if args.autotune:
+            # Compressed indexes cannot give back the original vectors
+            embeddings = (
+                np.load(RERANK_VECTORS_FILE).astype(np.float32)
+                if RERANK_VECTORS_FILE.exists()
+                else index.reconstruct_n(0, index.ntotal)
+            )
+    else:
+        # Generate embeddings
+        embeddings = generate_embeddings(texts)
+
+        # Build index
+        index_factory = resolve_index_factory(args.index_factory, *embeddings.shape, args.storage)
+        index = build_index(embeddings, index_factory)
+        search_params = ""
+
+    if args.autotune:
+        queries = load_tuning_queries(embeddings, AUTOTUNE_QUERIES, args.tune_queries)
+        search_params = autotune_search_params(
+            index, embeddings, queries, recall_target=args.recall_target
+        )
     
-    # Build index
-    index = build_index(embeddings)
+    bm25 = build_bm25(texts)
     
-    # Save outputs
-    save_outputs(index, chunks)
+    # Save outputs (the re-rank vectors just before the manifest that lists them)
+    if not args.reuse_index:
+        save_rerank_vectors(None if stores_exact_vectors(index, embeddings) else embeddings)
+    save_outputs(index, chunks, bm25, index_factory, search_params, args.text_compression)
     
     logger.info("FAISS index build complete!")
     logger.info(f"  Index: {FAISS_INDEX_FILE}")
     logger.info(f"  Metadata: {FAISS_META_FILE}")
+    logger.info(f"  Metadata store: {FAISS_META_STORE_DIR}")
+    logger.info(f"  BM25: {BM25_FILE}")
+    if RERANK_VECTORS_FILE.exists():
+        logger.info(f"  Re-rank vectors: {RERANK_VECTORS_FILE}")
     logger.info(f"  Total vectors: {index.ntotal}")
+    logger.info(f"  Index type: {index_factory} {search_params}".rstrip())
 
 
 if __name__ == "__main__":
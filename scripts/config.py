@@ -16,6 +16,9 @@ from typing import Final
 # Project root (parent of scripts folder)
 BASE_DIR: Final[Path] = Path(__file__).resolve().parent.parent
 
+# Backend source (for modules shared with the API, e.g. embedders.py)
+BACKEND_DIR: Final[Path] = BASE_DIR / "backend"
+
 # Data directories
 DATA_DIR: Final[Path] = BASE_DIR / "data"
 RAW_DIR: Final[Path] = DATA_DIR / "raw"
@@ -34,6 +37,9 @@ CLEAN_FILE: Final[Path] = PROCESSED_DIR / "sections_clean.json"
 CHUNKS_FILE: Final[Path] = PROCESSED_DIR / "sections_chunks.json"
 FAISS_INDEX_FILE: Final[Path] = PROCESSED_DIR / "faiss.index"
 FAISS_META_FILE: Final[Path] = PROCESSED_DIR / "faiss_meta.pkl"
+FAISS_META_STORE_DIR: Final[Path] = PROCESSED_DIR / "faiss_meta"
+BM25_FILE: Final[Path] = PROCESSED_DIR / "bm25.npz"
+RERANK_VECTORS_FILE: Final[Path] = PROCESSED_DIR / "vectors_fp16.npy"
 METADATA_FILE: Final[Path] = METADATA_DIR / "acts_metadata.json"
 
 # =============================================================================
@@ -71,6 +77,37 @@ CHARS_PER_TOKEN: Final[float] = 4.0  # Approximate character to token ratio
 EMBEDDING_MODEL: Final[str] = "sentence-transformers/all-MiniLM-L6-v2"
 FAISS_TOP_K: Final[int] = 5
 
+# Embedding backend: "torch" or "onnx" (int8 export in ONNX_MODEL_DIR)
+EMBEDDING_BACKEND: Final[str] = os.getenv("EMBEDDING_BACKEND", "torch").lower()
+ONNX_MODEL_DIR: Final[Path] = Path(
+    os.getenv("ONNX_MODEL_DIR", str(PROCESSED_DIR / "onnx_embedder"))
+)
+
+# Minimum cosine similarity between int8 ONNX and torch vectors for the
+# same text; the export is rejected if it falls below these
+ONNX_MIN_MEAN_COSINE: Final[float] = 0.99
+ONNX_MIN_COSINE: Final[float] = 0.97
+
+# FAISS index type: a preset ("flat", "ivf", "hnsw", "ivfpq", sized to the
+# corpus) or any faiss.index_factory string such as "IVF256,Flat" or "HNSW32"
+FAISS_INDEX_FACTORY: Final[str] = os.getenv("FAISS_INDEX_FACTORY", "flat")
+
+# Vector storage for the presets: "float32", "fp16" / "sq8" (scalar
+# quantized), "pq" (product quantized) or "binary" (LSH bits, flat only).
+# Compressed modes also write a float16 copy of the vectors that the API
+# uses to re-rank over-fetched candidates exactly.
+FAISS_STORAGE: Final[str] = os.getenv("FAISS_STORAGE", "float32").lower()
+
+# Chunk text in the metadata store: "zstd" (compressed blocks, decompressed
+# per block on access; needs the zstandard package) or "none"
+METADATA_COMPRESSION: Final[str] = os.getenv("METADATA_COMPRESSION", "zstd").lower()
+
+# Auto-tuning of nprobe / efSearch: fastest setting whose recall@k against
+# exact search meets the target on a held-out query set
+AUTOTUNE_RECALL_TARGET: Final[float] = 0.95
+AUTOTUNE_K: Final[int] = 10
+AUTOTUNE_QUERIES: Final[int] = 200
+
 # =============================================================================
 # LLM SETTINGS (for query_and_explain.py)
 # =============================================================================
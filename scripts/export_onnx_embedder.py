@@ -0,0 +1,175 @@
+"""
+Export the embedding model to a dynamically quantized int8 ONNX model.
+
+Exports the transformer behind EMBEDDING_MODEL with torch.onnx, applies
+ONNX Runtime dynamic int8 quantization, and checks the quantized
+vectors against the sentence-transformers vectors on a sample of chunk
+texts before saving. The result is used by the "onnx" embedding backend
+(EMBEDDING_BACKEND=onnx) in the API and in build_faiss_index.py.
+"""
+
+import argparse
+import inspect
+import json
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+from config import (
+    BACKEND_DIR,
+    CHUNKS_FILE,
+    EMBEDDING_MODEL,
+    ONNX_MIN_COSINE,
+    ONNX_MIN_MEAN_COSINE,
+    ONNX_MODEL_DIR,
+)
+from utils import setup_logger
+
+sys.path.append(str(BACKEND_DIR))
+from embedders import (  # noqa: E402
+    ONNX_MODEL_FILE,
+    ONNX_TOKENIZER_FILE,
+    OnnxEmbedder,
+    SentenceTransformerEmbedder,
+)
+
+logger = setup_logger(__name__)
+
+
+def export_fp32(model_name: str, work_dir: Path) -> Path:
+    """
+    Export the float32 transformer to ONNX.
+
+    Args:
+        model_name: Hugging Face / sentence-transformers model name.
+        work_dir: Directory for the exported model and tokenizer.
+
+    Returns:
+        Path to the float32 ONNX model.
+    """
+    import torch
+    from transformers import AutoModel, AutoTokenizer
+
+    class _Encoder(torch.nn.Module):
+        """Fixes the forward signature and returns only token embeddings."""
+
+        def __init__(self, model: torch.nn.Module):
+            super().__init__()
+            self.model = model
+
+        def forward(self, input_ids, attention_mask, token_type_ids):
+            return self.model(
+                input_ids=input_ids,
+                attention_mask=attention_mask,
+                token_type_ids=token_type_ids,
+            ).last_hidden_state
+
+    logger.info(f"Loading {model_name}")
+    tokenizer = AutoTokenizer.from_pretrained(model_name)
+    model = _Encoder(AutoModel.from_pretrained(model_name).eval())
+
+    tokenizer.save_pretrained(work_dir)
+
+    dummy = tokenizer(["Section 302 of the Indian Penal Code"], return_tensors="pt")
+    input_names = ["input_ids", "attention_mask", "token_type_ids"]
+    dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in input_names}
+    dynamic_axes["last_hidden_state"] = {0: "batch", 1: "sequence"}
+
+    # Newer torch defaults to the dynamo exporter; the TorchScript exporter
+    # handles dynamic batch/sequence axes for BERT without extra dependencies
+    export_kwargs = {}
+    if "dynamo" in inspect.signature(torch.onnx.export).parameters:
+        export_kwargs["dynamo"] = False
+
+    fp32_path = work_dir / "model.onnx"
+    logger.info(f"Exporting float32 ONNX model to {fp32_path}")
+    with torch.no_grad():
+        torch.onnx.export(
+            model,
+            tuple(dummy[name] for name in input_names),
+            str(fp32_path),
+            input_names=input_names,
+            output_names=["last_hidden_state"],
+            dynamic_axes=dynamic_axes,
+            opset_version=17,
+            do_constant_folding=True,
+            **export_kwargs,
+        )
+    return fp32_path
+
+
+def quantize_int8(fp32_path: Path, int8_path: Path) -> None:
+    """Apply ONNX Runtime dynamic int8 weight quantization."""
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    logger.info(f"Quantizing to int8: {int8_path}")
+    quantize_dynamic(str(fp32_path), str(int8_path), weight_type=QuantType.QInt8)
+
+
+def load_sample_texts(sample_size: int) -> list[str]:
+    """Sample chunk texts for the tolerance check (falls back to fixed queries)."""
+    texts = [
+        "what is section 302",
+        "how to file an FIR",
+        "punishment for cheating under section 420",
+        "is defamation a cognizable offence",
+    ]
+    if CHUNKS_FILE.exists():
+        with open(CHUNKS_FILE, "r", encoding="utf-8") as f:
+            chunks = json.load(f)
+        rng = np.random.default_rng(0)
+        picks = rng.choice(len(chunks), size=min(sample_size, len(chunks)), replace=False)
+        texts.extend(chunks[i].get("text", "") for i in picks)
+    return texts
+
+
+def check_tolerance(model_name: str, model_dir: Path, texts: list[str]) -> tuple[float, float]:
+    """
+    Compare int8 ONNX vectors with sentence-transformers vectors.
+
+    Returns:
+        Tuple of (mean cosine, minimum cosine) over the texts.
+    """
+    reference = SentenceTransformerEmbedder(model_name, device="cpu").encode(texts)
+    quantized = OnnxEmbedder(model_dir).encode(texts)
+    cosines = np.sum(reference * quantized, axis=1)
+    return float(cosines.mean()), float(cosines.min())
+
+
+def main() -> None:
+    """Main entry point for exporting the ONNX embedder."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--model", default=EMBEDDING_MODEL, help="Model to export")
+    parser.add_argument("--output-dir", type=Path, default=ONNX_MODEL_DIR)
+    parser.add_argument("--sample-size", type=int, default=200,
+                        help="Chunk texts used for the cosine tolerance check")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        work_dir = Path(tmp)
+        fp32_path = export_fp32(args.model, work_dir)
+        quantize_int8(fp32_path, work_dir / ONNX_MODEL_FILE)
+
+        samples = load_sample_texts(args.sample_size)
+        mean_cos, min_cos = check_tolerance(args.model, work_dir, samples)
+        logger.info(f"Cosine vs torch: mean={mean_cos:.4f}, min={min_cos:.4f}")
+
+        if mean_cos < ONNX_MIN_MEAN_COSINE or min_cos < ONNX_MIN_COSINE:
+            logger.error(
+                f"Quantized model outside tolerance "
+                f"(need mean >= {ONNX_MIN_MEAN_COSINE}, min >= {ONNX_MIN_COSINE})"
+            )
+            sys.exit(1)
+
+        args.output_dir.mkdir(parents=True, exist_ok=True)
+        for name in (ONNX_MODEL_FILE, ONNX_TOKENIZER_FILE):
+            shutil.copy2(work_dir / name, args.output_dir / name)
+
+    logger.info(f"ONNX int8 embedder saved to {args.output_dir}")
+
+
+if __name__ == "__main__":
+    main()
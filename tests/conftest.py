@@ -0,0 +1,107 @@
+"""Shared fixtures: a small in-memory legal index with a deterministic embedder."""
+
+import zlib
+
+import faiss
+import numpy as np
+import pytest
+
+import rag_engine
+from filters import FilterIndex
+from lexical import BM25Index, tokenize
+from statutes import StatuteIndex
+
+DIMENSION = 64
+
+CORPUS = [
+    ("Indian Penal Code", 1860, "302", "ipc-302",
+     "Whoever commits murder shall be punished with death or imprisonment for life."),
+    ("Indian Penal Code", 1860, "420", "ipc-420",
+     "Whoever cheats and thereby dishonestly induces the person deceived to deliver any property."),
+    ("Indian Penal Code", 1860, "498A", "ipc-498a",
+     "Husband or relative of husband of a woman subjecting her to cruelty shall be punished."),
+    ("Bharatiya Nyaya Sanhita", 2023, "103", "bns-103",
+     "Whoever commits murder shall be punished with death or imprisonment for life and fine."),
+    ("Bharatiya Nyaya Sanhita", 2023, "318", "bns-318",
+     "Whoever cheats shall be punished with imprisonment which may extend to three years."),
+    ("Bharatiya Nyaya Sanhita", 2023, "85", "bns-85",
+     "Husband or relative of husband subjecting a woman to cruelty shall be punished."),
+    ("Information Technology Act", 2000, "66", "it-66",
+     "Computer related offences. Whoever dishonestly does any act referred to in section 43."),
+    ("Information Technology Act", 2000, "66", "it-66",
+     "Whoever dishonestly does any act referred to in section 43. "
+     "Such a person is punishable with imprisonment up to three years."),
+]
+
+
+class HashingEmbedder:
+    """Bag-of-words vectors: texts sharing words get similar embeddings."""
+
+    name = "hashing"
+    dimension = DIMENSION
+
+    def encode(self, texts, batch_size=32, show_progress_bar=False):
+        vectors = np.zeros((len(texts), DIMENSION), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for token in tokenize(text):
+                vectors[row, zlib.crc32(token.encode()) % DIMENSION] += 1.0
+        faiss.normalize_L2(vectors)
+        return vectors
+
+
+def corpus_records():
+    return [
+        {
+            "chunk_id": f"{parent}-{i}",
+            "parent_id": parent,
+            "act_name": act,
+            "act_year": year,
+            "category": "Criminal Law" if year != 2000 else "Cyber Law",
+            "section_number": section,
+            "text": text,
+        }
+        for i, (act, year, section, parent, text) in enumerate(CORPUS)
+    ]
+
+
+def make_artifacts(records, factory="Flat", rerank_fp16=False):
+    """Build every artifact rag_engine serves from, in memory."""
+    embeddings = HashingEmbedder().encode([r["text"] for r in records])
+    index = faiss.index_factory(DIMENSION, factory, faiss.METRIC_INNER_PRODUCT)
+    if not index.is_trained:
+        index.train(embeddings)
+    index.add(embeddings)
+
+    parent_chunks = {}
+    for chunk_id, record in enumerate(records):
+        parent_chunks.setdefault(record["parent_id"], []).append(chunk_id)
+
+    return rag_engine._Artifacts(
+        index=index,
+        rerank_vectors=embeddings.astype(np.float16) if rerank_fp16 else None,
+        metadata=records,
+        statute_index=StatuteIndex(records),
+        parent_chunks=parent_chunks,
+        filter_index=FilterIndex(records),
+        bm25=BM25Index.build(r["text"] for r in records),
+        query_analyzer=None,
+    )
+
+
+@pytest.fixture
+def rag(monkeypatch):
+    """rag_engine serving the small test corpus; every global is restored afterwards."""
+    for name in (
+        "_index", "_index_version", "_metadata", "_rerank_vectors", "_bm25", "_statute_index",
+        "_filter_index", "_query_analyzer", "_parent_chunks", "_reranker", "_batcher",
+    ):
+        monkeypatch.setattr(rag_engine, name, getattr(rag_engine, name))
+    monkeypatch.setattr(rag_engine, "_embedder", HashingEmbedder())
+    rag_engine._query_cache.clear()
+    rag_engine._result_cache.clear()
+
+    rag_engine._install(make_artifacts(corpus_records()), "test-v1")
+    yield rag_engine
+
+    rag_engine._query_cache.clear()
+    rag_engine._result_cache.clear()
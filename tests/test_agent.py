@@ -0,0 +1,370 @@
+"""Tests for the agent's tool execution and answer flow."""
+
+import asyncio
+import json
+import threading
+import time
+from types import SimpleNamespace as NS
+
+import pytest
+
+import agent
+import llm_client
+from executors import BoundedExecutor, shutdown_executors
+from query_analysis import QueryAnalyzer
+
+
+@pytest.fixture(autouse=True)
+def fresh_pools():
+    yield
+    shutdown_executors()
+
+
+@pytest.fixture
+def agent_rag(rag, monkeypatch):
+    """agent bound to the test corpus; records the thread each call ran on."""
+    threads = {}
+
+    def recorded(name, fn):
+        def call(*args, **kwargs):
+            threads[name] = threading.current_thread().name
+            return fn(*args, **kwargs)
+        return call
+
+    monkeypatch.setattr(agent, "_rag_engine", {
+        "retrieve": rag.retrieve,
+        "retrieve_multi": recorded("retrieve_multi", rag.retrieve_multi),
+        "count": rag.get_vectors_count,
+        "version": rag.get_index_version,
+        "lookup": recorded("lookup", rag.lookup_statute),
+        "infer": recorded("infer", rag.infer_filters),
+        "embed": rag.embed_query,
+    })
+    return threads
+
+
+class FakeCompletions:
+    """chat.completions stand-in replaying one scripted response per call."""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    async def create(self, **kwargs):
+        self.calls.append(kwargs)
+        return self.responses[len(self.calls) - 1]
+
+
+@pytest.fixture
+def llm(monkeypatch):
+    """Install a scripted LLM client: llm(responses) -> FakeCompletions."""
+    monkeypatch.setattr(agent, "GROQ_API_KEY", "test-key")
+    monkeypatch.setattr(agent, "ANSWER_CACHE_ENABLED", False)
+
+    def install(responses):
+        completions = FakeCompletions(responses)
+        monkeypatch.setattr(llm_client, "_client", NS(chat=NS(completions=completions)))
+        return completions
+
+    return install
+
+
+def completion(content="", tool_calls=None):
+    return NS(
+        usage=NS(prompt_tokens=20, completion_tokens=7),
+        choices=[NS(message=NS(content=content, tool_calls=tool_calls))],
+    )
+
+
+def tool_call(call_id, name, **args):
+    return NS(id=call_id, function=NS(name=name, arguments=json.dumps(args)))
+
+
+def stream(*chunks):
+    """A streamed completion: async iterator over the given chunks."""
+    async def chunk_iterator():
+        for chunk in chunks:
+            yield chunk
+    return chunk_iterator()
+
+
+def chunk(content=None, tool_calls=None, usage=None):
+    """One streamed chunk; Groq reports usage under x_groq on the last one."""
+    return NS(
+        choices=[NS(delta=NS(content=content, tool_calls=tool_calls))],
+        usage=None,
+        x_groq=NS(usage=usage) if usage else None,
+    )
+
+
+def fragment(index, call_id=None, name=None, arguments=None):
+    return NS(index=index, id=call_id, function=NS(name=name, arguments=arguments))
+
+
+def run_streaming(query):
+    async def collect():
+        return [event async for event in agent.run_agent_streaming(query)]
+    return asyncio.run(collect())
+
+
+def test_exact_reference_is_looked_up_off_the_event_loop(agent_rag):
+    result = asyncio.run(agent._exact_reference_result("Section 302 IPC"))
+    assert result["status"] == "success"
+    assert result["data"][0]["section"] == "302"
+    assert agent_rag["lookup"].startswith("cpu-pool")
+
+
+def test_rag_search_infers_filters_off_the_event_loop(agent_rag, rag, monkeypatch):
+    monkeypatch.setattr(rag, "_query_analyzer", QueryAnalyzer({
+        "India Code: Information Technology Act, 2000": {
+            "act_name": "Information Technology Act", "year": 2000, "category": "Cyber Law",
+        },
+    }))
+    query = "whoever dishonestly commits an offence under the Information Technology Act"
+    result = asyncio.run(agent.execute_tool("rag_search", {"query": query}))
+    assert result["status"] == "success"
+    assert result["filters"]["inferred"] is True
+    assert {r["act"] for r in result["data"]} == {"Information Technology Act"}
+    assert agent_rag["infer"].startswith("cpu-pool")
+    assert agent_rag["retrieve_multi"].startswith("cpu-pool")
+
+
+def test_answers_are_cached_off_the_event_loop(monkeypatch):
+    stored = {}
+
+    class RecordingCache:
+        def set(self, vector, numbers, version, value):
+            stored.update(value, thread=threading.current_thread().name)
+
+    monkeypatch.setattr(agent, "_answer_cache", RecordingCache())
+    key = (None, ("302",), "test-v1")
+    asyncio.run(agent._cache_answer(key, "Life imprisonment.", "grounded", []))
+
+    assert stored["answer"] == "Life imprisonment."
+    assert stored["thread"].startswith("cpu-pool")
+
+
+def test_uncacheable_modes_are_not_stored(monkeypatch):
+    class FailingCache:
+        def set(self, *args):
+            raise AssertionError("should not be called")
+
+    monkeypatch.setattr(agent, "_answer_cache", FailingCache())
+    asyncio.run(agent._cache_answer((None, (), "test-v1"), "Sorry.", "fallback", []))
+
+
+def test_cached_answer_replay_sends_the_answer_as_a_delta():
+    cached = {"answer": "Life imprisonment.", "mode": "grounded", "tools_used": []}
+    events = agent._replay_cached_answer(cached, 0.97)
+
+    types = [e["type"] for e in events]
+    assert types[-2:] == ["answer_delta", "answer"]
+    assert events[-2]["text"] == events[-1]["text"] == "Life imprisonment."
+
+
+def test_question_is_answered_in_one_completion_after_prefetch(agent_rag, llm, monkeypatch):
+    monkeypatch.setattr(agent, "AGENT_PREFETCH_RETRIEVAL", True)
+    completions = llm([completion("Theft is punished under Section 303 [1].")])
+
+    result = asyncio.run(agent.run_agent("what is the punishment for theft"))
+
+    assert len(completions.calls) == 1
+    first = completions.calls[0]
+    assert first["tool_choice"] == "auto"
+    assert [m["role"] for m in first["messages"]] == ["system", "user", "assistant", "tool"]
+    assert result["tools_used"][0]["name"] == "rag_search"
+    assert result["answer"] == "Theft is punished under Section 303 [1]."
+
+
+def test_exact_reference_is_prefetched_even_without_retrieval_prefetch(agent_rag, monkeypatch):
+    monkeypatch.setattr(agent, "AGENT_PREFETCH_RETRIEVAL", False)
+    result = asyncio.run(agent._prefetch_rag_search("Section 498A IPC"))
+    assert result["data"][0]["section"] == "498A"
+    assert asyncio.run(agent._prefetch_rag_search("what is the punishment for theft")) is None
+
+
+def test_greetings_are_not_prefetched(agent_rag, llm, monkeypatch):
+    monkeypatch.setattr(agent, "AGENT_PREFETCH_RETRIEVAL", True)
+    assert asyncio.run(agent._prefetch_rag_search("hello")) is None
+    assert "lookup" not in agent_rag and "retrieve_multi" not in agent_rag
+
+
+def test_without_prefetch_the_first_completion_must_search(agent_rag, llm, monkeypatch):
+    monkeypatch.setattr(agent, "AGENT_PREFETCH_RETRIEVAL", False)
+    completions = llm([
+        completion(tool_calls=[tool_call("call_1", "rag_search", query="theft")]),
+        completion("Theft is punished under Section 303 [1]."),
+    ])
+
+    asyncio.run(agent.run_agent("what is the punishment for theft"))
+
+    assert len(completions.calls) == 2
+    assert completions.calls[0]["tool_choice"]["function"]["name"] == "rag_search"
+
+
+def test_streamed_turn_assembles_tool_call_fragments():
+    turn = agent._StreamedTurn()
+    completions = FakeCompletions([stream(
+        chunk(tool_calls=[fragment(1, "call_b", "web_search", '{"query": ')]),
+        chunk(tool_calls=[fragment(0, "call_a", "rag_search", '{"query": "bail"}')]),
+        chunk(tool_calls=[fragment(1, arguments='"bail news"}')],
+              usage=NS(prompt_tokens=30, completion_tokens=9)),
+    )])
+
+    async def drain():
+        return [delta async for delta in turn.stream(NS(chat=NS(completions=completions)))]
+
+    assert asyncio.run(drain()) == []
+    assert turn.is_tool_turn
+    assert [(c.id, c.function.name, json.loads(c.function.arguments)) for c in turn.tool_calls] == [
+        ("call_a", "rag_search", {"query": "bail"}),
+        ("call_b", "web_search", {"query": "bail news"}),
+    ]
+    assert (turn.tokens_in, turn.tokens_out) == (30, 9)
+
+
+def test_answer_prefix_holds_back_a_possible_tool_tag():
+    turn = agent._StreamedTurn()
+    turn.content = "Murder is punished <"
+    assert turn.answer_prefix() == "Murder is punished "
+    turn.content = "Murder is punished <b>severely</b>"
+    assert turn.answer_prefix() == turn.content
+
+
+def test_streamed_answer_deltas_add_up_to_the_answer(agent_rag, llm, monkeypatch):
+    monkeypatch.setattr(agent, "AGENT_PREFETCH_RETRIEVAL", True)
+    completions = llm([stream(
+        chunk("Murder is "),
+        chunk("punished <"),
+        chunk("b>severely</b> [1]"),
+        chunk(usage=NS(prompt_tokens=20, completion_tokens=7)),
+    )])
+
+    events = run_streaming("What is the punishment for murder under IPC?")
+
+    answer = next(e for e in events if e["type"] == "answer")
+    deltas = "".join(e["text"] for e in events if e["type"] == "answer_delta")
+    assert deltas == answer["text"] == "Murder is punished <b>severely</b> [1]"
+    assert (answer["tokens_in"], answer["tokens_out"]) == (20, 7)
+    assert len(completions.calls) == 1 and completions.calls[0]["stream"] is True
+
+
+def test_text_before_a_tool_call_is_reset(agent_rag, llm, monkeypatch):
+    monkeypatch.setattr(agent, "AGENT_PREFETCH_RETRIEVAL", True)
+    completions = llm([
+        stream(
+            chunk("Let me check. "),
+            chunk(tool_calls=[fragment(0, "call_1", "rag_search", '{"query":')]),
+            chunk(tool_calls=[fragment(0, arguments=' "anticipatory bail"}')]),
+        ),
+        stream(chunk("Anticipatory bail is granted by the Sessions Court [1].")),
+    ])
+
+    events = run_streaming("How do I get anticipatory bail?")
+    types = [e["type"] for e in events]
+
+    assert "answer_reset" in types
+    after_reset = types[types.index("answer_reset"):]
+    assert "tool_start" in after_reset
+    final_turn = events[types.index("answer_reset"):]
+    deltas = "".join(e["text"] for e in final_turn if e["type"] == "answer_delta")
+    assert deltas == events[types.index("answer")]["text"]
+    assert len(completions.calls) == 2
+
+
+@pytest.fixture
+def slow_tools(monkeypatch):
+    """execute_tool replaced by sleeps of the query's length in tenths of a second."""
+    monkeypatch.setattr(agent, "AGENT_PREFETCH_RETRIEVAL", False)
+    monkeypatch.setattr(agent, "TOOL_TIMEOUT", 0.5)
+
+    async def execute_tool(name, args):
+        await asyncio.sleep(float(args["query"]) / 10)
+        return {"status": "success", "data": [{"query": args["query"]}]}
+
+    monkeypatch.setattr(agent, "execute_tool", execute_tool)
+
+
+def test_tool_calls_of_a_turn_run_concurrently(slow_tools, llm):
+    completions = llm([
+        completion(tool_calls=[
+            tool_call("call_a", "rag_search", query="3"),
+            tool_call("call_b", "rag_search", query="1"),
+            tool_call("call_c", "web_search", query="20"),
+        ]),
+        completion("Done."),
+    ])
+
+    started = time.perf_counter()
+    result = asyncio.run(agent.run_agent("what is anticipatory bail"))
+    elapsed = time.perf_counter() - started
+
+    # The slowest call is cut off at TOOL_TIMEOUT; the others overlap with it
+    assert elapsed < 1.0
+    tool_messages = [m for m in completions.calls[1]["messages"] if m["role"] == "tool"]
+    assert [m["tool_call_id"] for m in tool_messages] == ["call_a", "call_b", "call_c"]
+    assert [t["result"] for t in result["tools_used"]] == ["success", "success", "error"]
+    assert "timed out" in json.loads(tool_messages[2]["content"])["reason"]
+
+
+def test_streamed_tool_starts_precede_results_in_completion_order(slow_tools, llm):
+    llm([
+        stream(chunk(tool_calls=[
+            fragment(0, "call_a", "rag_search", '{"query": "3"}'),
+            fragment(1, "call_b", "rag_search", '{"query": "1"}'),
+        ])),
+        stream(chunk("Done.")),
+    ])
+
+    events = run_streaming("what is anticipatory bail")
+
+    tool_events = [
+        (e["type"], e.get("call_id"))
+        for e in events
+        if e["type"] in ("tool_start", "tool_result")
+    ]
+    assert tool_events == [
+        ("tool_start", "call_a"), ("tool_start", "call_b"),
+        ("tool_result", "call_b"), ("tool_result", "call_a"),
+    ]
+
+
+def test_searches_timing_out_in_the_queue_free_their_pool_slots(monkeypatch):
+    pool = BoundedExecutor("test_agent_cpu", max_workers=1, max_queue=1)
+    release = threading.Event()
+
+    def retrieve_multi(queries, *args):
+        release.wait(5)
+        return []
+
+    monkeypatch.setattr(agent, "get_executor", lambda name: pool)
+    monkeypatch.setattr(agent, "_rag_engine", {"retrieve_multi": retrieve_multi})
+    monkeypatch.setattr(agent, "TOOL_TIMEOUT", 0.05)
+    args = {"query": "murder", "act": "Indian Penal Code"}
+
+    async def main():
+        # One search runs, one waits in the queue; both time out
+        results = await asyncio.gather(*(agent._run_tool("rag_search", args) for _ in range(2)))
+        assert pool._queued == 0
+        release.set()
+        # The queued search was dropped, so the pool takes new work again
+        return results, await pool.run(lambda: "ok")
+
+    results, follow_up = asyncio.run(main())
+    assert [r["status"] for r in results] == ["error", "error"]
+    assert follow_up == "ok"
+    pool.shutdown()
+
+
+def test_text_tool_calls_report_the_same_event_fields(slow_tools, llm):
+    llm([
+        stream(chunk('<rag_search>{"query": "1"}</rag_search>')),
+        stream(chunk("Done.")),
+    ])
+
+    events = run_streaming("what is anticipatory bail")
+
+    result = next(e for e in events if e["type"] == "tool_result")
+    assert result["call_id"] == "text_0_0"
+    assert {"display_name", "icon", "message", "count"} <= result.keys()
+    assert result["message"] == "Found 1 results"
@@ -0,0 +1,89 @@
+"""Tests for the semantic answer cache."""
+
+import numpy as np
+import pytest
+
+import answer_cache
+from answer_cache import SemanticAnswerCache, question_numbers
+
+DIMENSION = 8
+
+
+def unit(*values):
+    vector = np.zeros(DIMENSION, dtype=np.float32)
+    vector[:len(values)] = values
+    return vector / np.linalg.norm(vector)
+
+
+MURDER = unit(1.0, 0.0)
+MURDER_PARAPHRASE = unit(1.0, 0.05)
+THEFT = unit(0.0, 1.0)
+
+
+@pytest.fixture
+def cache():
+    cache = SemanticAnswerCache(DIMENSION, threshold=0.95, maxsize=2)
+    cache.get(MURDER, (), "v1")  # Bind the cache to index version v1
+    return cache
+
+
+def test_question_numbers_are_distinct_and_sorted():
+    numbers = question_numbers("section 498a and section 302 of the ipc 1860 302")
+    assert numbers == ("1860", "302", "498a")
+
+
+def test_a_paraphrase_hits_and_a_different_question_misses(cache):
+    cache.set(MURDER, ("302",), "v1", {"answer": "murder"})
+
+    value, similarity = cache.get(MURDER_PARAPHRASE, ("302",), "v1")
+    assert value == {"answer": "murder"} and similarity >= 0.95
+    assert cache.get(THEFT, ("302",), "v1") is None
+
+
+def test_different_numbers_miss(cache):
+    cache.set(MURDER, ("302",), "v1", {"answer": "murder"})
+    assert cache.get(MURDER, ("304",), "v1") is None
+
+
+def test_near_identical_question_replaces_the_entry(cache):
+    cache.set(MURDER, (), "v1", {"answer": "old"})
+    cache.set(MURDER_PARAPHRASE, (), "v1", {"answer": "new"})
+    assert len(cache) == 1
+    assert cache.get(MURDER, (), "v1")[0] == {"answer": "new"}
+
+
+def test_least_recently_used_answer_is_evicted(cache):
+    cache.set(MURDER, (), "v1", {"answer": "murder"})
+    cache.set(THEFT, (), "v1", {"answer": "theft"})
+    cache.get(MURDER, (), "v1")
+    cache.set(unit(0.0, 0.0, 1.0), (), "v1", {"answer": "cheating"})
+
+    assert len(cache) == 2
+    assert cache.get(THEFT, (), "v1") is None
+    assert cache.get(MURDER, (), "v1") is not None
+
+
+def test_expired_answers_miss(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(answer_cache.time, "monotonic", lambda: now[0])
+    cache = SemanticAnswerCache(DIMENSION, ttl=60)
+    cache.get(MURDER, (), "v1")
+    cache.set(MURDER, (), "v1", {"answer": "murder"})
+
+    now[0] += 59
+    assert cache.get(MURDER, (), "v1") is not None
+    now[0] += 2
+    assert cache.get(MURDER, (), "v1") is None
+    assert len(cache) == 0
+
+
+def test_new_index_version_empties_the_cache(cache):
+    cache.set(MURDER, (), "v1", {"answer": "murder"})
+    assert cache.get(MURDER, (), "v2") is None
+    assert len(cache) == 0
+
+
+def test_answer_grounded_on_a_stale_version_is_not_cached(cache):
+    cache.get(MURDER, (), "v2")
+    cache.set(MURDER, (), "v1", {"answer": "stale"})
+    assert len(cache) == 0
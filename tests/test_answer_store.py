@@ -0,0 +1,66 @@
+"""Tests for the persistent SQLite answer cache."""
+
+import pytest
+
+import answer_store
+from answer_store import PersistentAnswerCache, cache_key
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1_000_000.0]
+    monkeypatch.setattr(answer_store.time, "time", lambda: now[0])
+    return now
+
+
+def _answer(text):
+    return {"answer": text, "local_sources": [{"act": "Indian Penal Code", "section": "302"}]}
+
+
+def test_cache_key_is_stable_and_distinguishes_parts():
+    key = cache_key("ask", "section 302 ipc", "model", "v1")
+    assert key == cache_key("ask", "section 302 ipc", "model", "v1")
+    assert key != cache_key("ask", "section 302 ipc", "model", "v2")
+
+
+def test_round_trip_survives_a_new_instance(tmp_path):
+    path = tmp_path / "answers.db"
+    PersistentAnswerCache(path, max_bytes=1 << 20).set("k", _answer("हत्या — murder"))
+
+    store = PersistentAnswerCache(path, max_bytes=1 << 20)
+    assert store.get("k") == _answer("हत्या — murder")
+    assert store.get("missing") is None
+
+
+def test_entries_expire_after_ttl(tmp_path, clock):
+    store = PersistentAnswerCache(tmp_path / "answers.db", max_bytes=1 << 20, ttl=60)
+    store.set("k", _answer("murder"))
+
+    clock[0] += 59
+    assert store.get("k") is not None
+    clock[0] += 2
+    assert store.get("k") is None
+
+
+def test_least_recently_used_entries_are_evicted_over_budget(tmp_path, clock):
+    store = PersistentAnswerCache(tmp_path / "answers.db", max_bytes=1 << 20)
+    store.set("a", _answer("murder"))
+    clock[0] += 1
+    store.set("b", _answer("theft"))
+    two_entries = store._connection().execute("SELECT SUM(size) FROM answers").fetchone()[0]
+
+    clock[0] += 100
+    assert store.get("a") is not None  # "a" is now more recently used than "b"
+    store.max_bytes = int(two_entries * 1.25)
+    store.set("c", _answer("cheating"))
+
+    assert store.get("b") is None
+    assert store.get("a") is not None
+    assert store.get("c") is not None
+
+
+def test_clear_deletes_everything(tmp_path):
+    store = PersistentAnswerCache(tmp_path / "answers.db", max_bytes=1 << 20)
+    store.set("k", _answer("murder"))
+    store.clear()
+    assert store.get("k") is None
@@ -0,0 +1,64 @@
+"""Tests for the retrieval micro-batcher."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from batcher import MicroBatcher
+
+
+def test_concurrent_submissions_share_a_batch():
+    batches: list[list[int]] = []
+    release = threading.Event()
+
+    def process(items: list[int]) -> list[int]:
+        release.wait(1.0)
+        batches.append(items)
+        return [item * 2 for item in items]
+
+    batcher = MicroBatcher("test_share", process, max_batch_size=8, max_wait_ms=50)
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [pool.submit(batcher.submit, i) for i in range(4)]
+        release.set()
+        results = [future.result(timeout=2) for future in futures]
+
+    assert results == [0, 2, 4, 6]
+    assert sum(len(batch) for batch in batches) == 4
+    assert len(batches) < 4
+
+
+def test_submit_many_keeps_order():
+    batcher = MicroBatcher(
+        "test_order", lambda items: [f"r{item}" for item in items], max_wait_ms=1
+    )
+    assert batcher.submit_many([3, 1, 2]) == ["r3", "r1", "r2"]
+
+
+def test_batch_size_is_capped():
+    sizes: list[int] = []
+
+    def process(items: list[int]) -> list[int]:
+        sizes.append(len(items))
+        return items
+
+    batcher = MicroBatcher("test_cap", process, max_batch_size=2, max_wait_ms=20)
+    assert batcher.submit_many(list(range(5))) == list(range(5))
+    assert max(sizes) <= 2
+
+
+def test_failure_reaches_every_caller():
+    def process(items: list[int]) -> list[int]:
+        raise ValueError("boom")
+
+    batcher = MicroBatcher("test_fail", process, max_wait_ms=1)
+    with pytest.raises(ValueError, match="boom"):
+        batcher.submit(1)
+
+
+def test_short_result_list_fails_leftover_items():
+    batcher = MicroBatcher("test_short", lambda items: items[:1], max_batch_size=4, max_wait_ms=20)
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        future = pool.submit(batcher.submit_many, [1, 2, 3])
+        with pytest.raises(RuntimeError, match="1 results for 3 items"):
+            future.result(timeout=2)
@@ -0,0 +1,89 @@
+"""Tests for the LRU cache and query canonicalization."""
+
+import pytest
+
+import cache
+from cache import LRUCache
+from sanitizer import canonicalize_query
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(cache.time, "monotonic", fake)
+    return fake
+
+
+def test_evicts_least_recently_used():
+    lru: LRUCache[str, int] = LRUCache("test_lru", maxsize=2)
+    lru.set("a", 1)
+    lru.set("b", 2)
+    assert lru.get("a") == 1  # "b" is now the oldest
+    lru.set("c", 3)
+
+    assert lru.get("b") is None
+    assert lru.get("a") == 1
+    assert lru.get("c") == 3
+    assert len(lru) == 2
+
+
+def test_entries_expire_after_ttl(clock):
+    lru: LRUCache[str, int] = LRUCache("test_ttl", maxsize=4, ttl=10)
+    lru.set("a", 1)
+    clock.now += 9
+    assert lru.get("a") == 1
+    clock.now += 2
+    assert lru.get("a") is None
+    assert len(lru) == 0
+
+
+def test_byte_budget_evicts_and_skips_oversized_values():
+    lru: LRUCache[str, bytes] = LRUCache("test_bytes", maxsize=10, max_bytes=10, sizeof=len)
+    lru.set("a", b"12345")
+    lru.set("b", b"12345")
+    lru.set("c", b"123")
+    assert lru.get("a") is None
+    assert lru.stats()["bytes"] == 8
+
+    lru.set("huge", b"x" * 11)
+    assert lru.get("huge") is None
+    assert lru.get("b") == b"12345"
+
+
+def test_byte_budget_requires_sizeof():
+    with pytest.raises(ValueError):
+        LRUCache("test_nosizeof", maxsize=1, max_bytes=10)
+
+
+def test_zero_maxsize_disables_cache():
+    lru: LRUCache[str, int] = LRUCache("test_disabled", maxsize=0)
+    lru.set("a", 1)
+    assert lru.get("a") is None
+
+
+def test_stats_count_hits_and_misses():
+    lru: LRUCache[str, int] = LRUCache("test_stats", maxsize=2)
+    lru.set("a", 1)
+    lru.get("a")
+    lru.get("missing")
+    stats = lru.stats()
+    assert (stats["hits"], stats["misses"], stats["hit_ratio"]) == (1, 1, 0.5)
+
+
+@pytest.mark.parametrize(
+    "text", ["What is Section 302?", "what is   section 302", "WHAT IS SECTION 302!!"]
+)
+def test_canonical_form_ignores_case_punctuation_and_spacing(text):
+    assert canonicalize_query(text) == "what is section 302"
+
+
+def test_canonical_form_undoes_html_escaping():
+    assert canonicalize_query("Tom &amp; Jerry") == canonicalize_query("tom & jerry")
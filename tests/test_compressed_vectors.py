@@ -0,0 +1,74 @@
+"""Tests for compressed indexes re-ranked with exact float16 vectors."""
+
+import faiss
+import numpy as np
+import pytest
+
+import rag_engine
+from conftest import HashingEmbedder, corpus_records, make_artifacts
+from manifest import write_manifest
+
+QUERY = "cheating and dishonestly inducing delivery of property"
+
+
+def _exact_ranking(records, query, k):
+    embedder = HashingEmbedder()
+    vectors = embedder.encode([r["text"] for r in records])
+    scores = vectors @ embedder.encode([query])[0]
+    order = np.argsort(-scores, kind="stable")[:k]
+    return order, scores[order]
+
+
+@pytest.mark.parametrize("factory", ["SQfp16", "SQ8", "SQ4"])
+def test_rerank_restores_exact_scores(rag, factory):
+    records = corpus_records()
+    artifacts = make_artifacts(records, factory=factory, rerank_fp16=True)
+    rag_engine._install(artifacts, "test-compressed")
+
+    query_vec = rag_engine._encode_queries([QUERY])
+    (scores, ids), = rag_engine._search_index(query_vec, 3)
+
+    expected_ids, expected_scores = _exact_ranking(records, QUERY, 3)
+    assert ids[0] == expected_ids[0]
+    np.testing.assert_allclose(scores, expected_scores, atol=2e-3)
+
+
+def test_rerank_skips_padding_ids(rag):
+    rag_engine._install(make_artifacts(corpus_records(), rerank_fp16=True), "test-fp16")
+    query_vec = rag_engine._encode_queries([QUERY])[0]
+
+    scores, ids = rag_engine._rerank(query_vec, np.array([1, -1, 4, -1]), top_k=5)
+    assert sorted(ids.tolist()) == [1, 4]
+    assert scores[0] >= scores[1]
+
+
+@pytest.fixture
+def index_dir(tmp_path, monkeypatch):
+    artifacts = make_artifacts(corpus_records(), factory="SQ8", rerank_fp16=True)
+    index_path = tmp_path / "faiss.index"
+    vectors_path = tmp_path / "vectors_fp16.npy"
+    faiss.write_index(artifacts.index, str(index_path))
+    np.save(vectors_path, artifacts.rerank_vectors)
+
+    monkeypatch.setattr(rag_engine, "FAISS_INDEX_PATH", index_path)
+    monkeypatch.setattr(rag_engine, "RERANK_VECTORS_PATH", vectors_path)
+    monkeypatch.setattr(rag_engine, "MANIFEST_PATH", tmp_path / "manifest.json")
+    return tmp_path, artifacts.rerank_vectors
+
+
+def test_rerank_vectors_listed_in_the_manifest_are_loaded(index_dir):
+    root, vectors = index_dir
+    manifest = write_manifest(root, [root / "faiss.index", root / "vectors_fp16.npy"])
+
+    _, rerank_vectors = rag_engine._load_index(manifest)
+    np.testing.assert_array_equal(rerank_vectors, vectors)
+
+
+def test_rerank_vectors_not_matching_the_manifest_are_ignored(index_dir):
+    root, vectors = index_dir
+    assert rag_engine._load_index(write_manifest(root, [root / "faiss.index"]))[1] is None
+
+    # Vectors of a newer build written before its manifest
+    manifest = write_manifest(root, [root / "faiss.index", root / "vectors_fp16.npy"])
+    np.save(root / "vectors_fp16.npy", vectors[::-1])
+    assert rag_engine._load_index(manifest)[1] is None
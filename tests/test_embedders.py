@@ -0,0 +1,22 @@
+"""Tests for embedder selection (no model weights needed)."""
+
+import pytest
+
+from embedders import create_embedder
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError, match="Unknown embedding backend"):
+        create_embedder("tensorflow", "all-MiniLM-L6-v2")
+
+
+def test_onnx_backend_requires_model_dir():
+    with pytest.raises(ValueError, match="onnx_model_dir"):
+        create_embedder("onnx", "all-MiniLM-L6-v2")
+
+
+def test_onnx_backend_reports_missing_export(tmp_path):
+    pytest.importorskip("onnxruntime")
+    pytest.importorskip("tokenizers")
+    with pytest.raises(FileNotFoundError, match="export_onnx_embedder"):
+        create_embedder("onnx", "all-MiniLM-L6-v2", onnx_model_dir=tmp_path)
@@ -0,0 +1,99 @@
+"""Tests for the bounded thread pools."""
+
+import asyncio
+import threading
+
+import pytest
+
+from executors import BoundedExecutor, ExecutorSaturated
+
+
+@pytest.fixture
+def pool():
+    executor = BoundedExecutor("test_bounded", max_workers=1, max_queue=1)
+    yield executor
+    executor.shutdown()
+
+
+def test_submissions_beyond_the_queue_are_rejected(pool):
+    release = threading.Event()
+    running = pool.submit(release.wait, 5)
+    queued = pool.submit(lambda: "queued")
+
+    with pytest.raises(ExecutorSaturated):
+        pool.submit(lambda: "rejected")
+
+    release.set()
+    assert running.result(timeout=5) is True
+    assert queued.result(timeout=5) == "queued"
+
+
+def test_slots_are_released_when_tasks_finish(pool):
+    for i in range(5):
+        assert pool.submit(lambda x: x * 2, i).result(timeout=5) == i * 2
+
+
+def test_slot_is_released_when_a_task_raises(pool):
+    def fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        pool.submit(fail).result(timeout=5)
+    assert pool.submit(lambda: "ok").result(timeout=5) == "ok"
+
+
+def test_run_awaits_the_result_from_the_event_loop(pool):
+    async def main():
+        return await pool.run(sum, [1, 2, 3])
+
+    assert asyncio.run(main()) == 6
+
+
+def test_cancelled_queued_tasks_give_their_slots_back():
+    pool = BoundedExecutor("test_cancel", max_workers=1, max_queue=2)
+    release = threading.Event()
+    running = pool.submit(release.wait, 5)
+    queued = [pool.submit(lambda: "never"), pool.submit(lambda: "never")]
+
+    assert all(future.cancel() for future in queued)
+    assert pool._queued == 0
+    # Both queue slots are free again while the first task still runs
+    follow_ups = [pool.submit(lambda: "ok"), pool.submit(lambda: "ok")]
+
+    release.set()
+    assert running.result(timeout=5) is True
+    assert [f.result(timeout=5) for f in follow_ups] == ["ok", "ok"]
+    pool.shutdown()
+
+
+def test_timed_out_waits_on_queued_tasks_give_their_slots_back():
+    pool = BoundedExecutor("test_timeout", max_workers=1, max_queue=2)
+    release = threading.Event()
+
+    async def main():
+        running = asyncio.ensure_future(pool.run(release.wait, 5))
+        for _ in range(2):
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(pool.run(lambda: "never"), 0.01)
+        assert pool._queued == 0
+        release.set()
+        await running
+        return await asyncio.gather(pool.run(lambda: 1), pool.run(lambda: 2))
+
+    assert asyncio.run(main()) == [1, 2]
+    assert pool._active == 0
+    pool.shutdown()
+
+
+def test_shutdown_releases_the_slots_of_dropped_tasks():
+    pool = BoundedExecutor("test_shutdown", max_workers=1, max_queue=1)
+    release = threading.Event()
+    running = pool.submit(release.wait, 5)
+    dropped = pool.submit(lambda: "never")
+
+    pool.shutdown()
+    release.set()
+    running.result(timeout=5)
+    assert dropped.cancelled()
+    assert pool._queued == 0 and pool._active == 0
+    assert pool._slots.acquire(blocking=False) and pool._slots.acquire(blocking=False)
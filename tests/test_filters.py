@@ -0,0 +1,44 @@
+"""Tests for act / category / year filters inside the search."""
+
+import pytest
+
+from conftest import corpus_records
+from filters import FilterIndex, SearchFilter
+
+
+@pytest.fixture(scope="module")
+def index():
+    return FilterIndex(corpus_records())
+
+
+def test_filter_from_arguments():
+    assert SearchFilter.from_dict(None) is None
+    assert SearchFilter.from_dict({"act": "", "year": ""}) is None
+    expected = SearchFilter(act="IPC", year=1860)
+    assert SearchFilter.from_dict({"act": "IPC", "year": "1860"}) == expected
+
+
+@pytest.mark.parametrize("act", ["Indian Penal Code", "IPC", "the Indian Penal Code, 1860"])
+def test_act_names_and_aliases_resolve(index, act):
+    assert index.resolve(SearchFilter(act=act)).ids.tolist() == [0, 1, 2]
+
+
+def test_partial_act_name_matches_every_act_containing_it(index):
+    assert index.resolve(SearchFilter(act="nyaya sanhita")).ids.tolist() == [3, 4, 5]
+
+
+def test_fields_are_combined(index):
+    match = index.resolve(SearchFilter(category="criminal law", year=2023))
+    assert match.ids.tolist() == [3, 4, 5]
+    assert 4 in match and 0 not in match
+    assert len(index.resolve(SearchFilter(act="IPC", year=2023))) == 0
+
+
+def test_filtered_retrieval_only_returns_matching_chunks(rag):
+    results = rag.retrieve_sections("punishment for murder", top_k=3, filters={"act": "BNS"})
+    assert [r["section_number"] for r in results][0] == "103"
+    assert all(r["act_name"] == "Bharatiya Nyaya Sanhita" for r in results)
+
+
+def test_unsatisfiable_filter_returns_nothing(rag):
+    assert rag.retrieve_sections("murder", filters={"act": "IPC", "year": 2023}) == []
@@ -0,0 +1,37 @@
+"""Tests for reading the FAISS index (memory-mapped when supported)."""
+
+import faiss
+import numpy as np
+import pytest
+
+import rag_engine
+
+
+@pytest.fixture
+def flat_index_path(tmp_path):
+    rng = np.random.default_rng(0)
+    vectors = rng.standard_normal((64, 16)).astype(np.float32)
+    faiss.normalize_L2(vectors)
+    index = faiss.IndexFlatIP(16)
+    index.add(vectors)
+    path = tmp_path / "index.faiss"
+    faiss.write_index(index, str(path))
+    return path, index, vectors
+
+
+@pytest.mark.parametrize("mmap", [True, False])
+def test_read_index_matches_the_written_index(flat_index_path, monkeypatch, mmap):
+    monkeypatch.setattr(rag_engine, "FAISS_MMAP", mmap)
+    path, original, vectors = flat_index_path
+
+    index = rag_engine._read_index(path)
+    assert index.ntotal == original.ntotal
+    expected = original.search(vectors[:4], 5)
+    found = index.search(vectors[:4], 5)
+    np.testing.assert_array_equal(found[1], expected[1])
+    np.testing.assert_allclose(found[0], expected[0], rtol=1e-6)
+
+
+def test_this_faiss_build_can_map_flat_codes():
+    # The worker count in the Dockerfile assumes a mapped (shared) index
+    assert hasattr(faiss, "IO_FLAG_MMAP_IFC")
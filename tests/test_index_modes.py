@@ -0,0 +1,53 @@
+"""Tests for approximate index presets and their search parameters."""
+
+import faiss
+import numpy as np
+import pytest
+
+import rag_engine
+from conftest import corpus_records, make_artifacts
+
+
+def _ivf_index(nlist=4):
+    rng = np.random.default_rng(0)
+    vectors = rng.standard_normal((200, 16)).astype(np.float32)
+    faiss.normalize_L2(vectors)
+    index = faiss.index_factory(16, f"IVF{nlist},Flat", faiss.METRIC_INNER_PRODUCT)
+    index.train(vectors)
+    index.add(vectors)
+    return index
+
+
+def test_manifest_search_params_are_applied(monkeypatch):
+    monkeypatch.setattr(rag_engine, "FAISS_SEARCH_PARAMS", "")
+    index = _ivf_index()
+    rag_engine._apply_search_params(index, {"search_params": "nprobe=3"})
+    assert faiss.extract_index_ivf(index).nprobe == 3
+
+
+def test_configured_search_params_override_the_manifest(monkeypatch):
+    monkeypatch.setattr(rag_engine, "FAISS_SEARCH_PARAMS", "nprobe=2")
+    index = _ivf_index()
+    rag_engine._apply_search_params(index, {"search_params": "nprobe=3"})
+    assert faiss.extract_index_ivf(index).nprobe == 2
+
+
+def test_exact_index_needs_no_params(monkeypatch):
+    monkeypatch.setattr(rag_engine, "FAISS_SEARCH_PARAMS", "")
+    rag_engine._apply_search_params(faiss.IndexFlatIP(16), None)
+
+
+@pytest.mark.parametrize("factory", ["IVF2,Flat", "HNSW8"])
+def test_filtered_search_keeps_tuned_params(rag, monkeypatch, factory):
+    # Push the filter down into FAISS instead of scanning the subset directly
+    monkeypatch.setattr(rag_engine, "FILTER_SCAN_MAX", 0)
+    artifacts = make_artifacts(corpus_records(), factory=factory)
+    faiss.ParameterSpace().set_index_parameters(
+        artifacts.index, "nprobe=2" if factory.startswith("IVF") else "efSearch=32"
+    )
+    rag_engine._install(artifacts, "test-approx")
+
+    results = rag.retrieve_sections(
+        "murder", top_k=2, filters={"act": "Indian Penal Code"}, group_sections=False
+    )
+    assert results and all(r["act_name"] == "Indian Penal Code" for r in results)
@@ -0,0 +1,90 @@
+"""Tests for the index read/write lock and validation before a reload."""
+
+import threading
+import time
+
+import faiss
+import pytest
+
+import rag_engine
+from conftest import corpus_records, make_artifacts
+
+
+def _start(target):
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    return thread
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not reached"
+        time.sleep(0.005)
+
+
+def test_readers_share_the_lock():
+    lock = rag_engine._ReadWriteLock()
+    both_inside = threading.Barrier(2, timeout=2)
+
+    def reader():
+        with lock.read():
+            both_inside.wait()
+
+    threads = [_start(reader) for _ in range(2)]
+    for thread in threads:
+        thread.join(timeout=5)
+    assert not both_inside.broken
+
+
+def test_writer_waits_for_readers_and_blocks_new_ones():
+    lock = rag_engine._ReadWriteLock()
+    order = []
+
+    def writer():
+        with lock.write():
+            order.append("writer")
+
+    def late_reader():
+        with lock.read():
+            order.append("late reader")
+
+    with lock.read():
+        writer_thread = _start(writer)
+        _wait_for(lambda: lock._writers_waiting == 1)
+        reader_thread = _start(late_reader)
+        time.sleep(0.05)
+        # Neither the writer nor a reader arriving after it gets in
+        assert order == []
+
+    writer_thread.join(timeout=5)
+    reader_thread.join(timeout=5)
+    assert order == ["writer", "late reader"]
+
+
+def test_valid_artifacts_pass(monkeypatch):
+    monkeypatch.setattr(rag_engine, "_embedder", None)
+    rag_engine._validate_artifacts(make_artifacts(corpus_records()), None)
+
+
+def test_artifacts_with_mismatched_metadata_are_rejected(monkeypatch):
+    monkeypatch.setattr(rag_engine, "_embedder", None)
+    artifacts = make_artifacts(corpus_records())
+    with pytest.raises(RuntimeError, match="metadata"):
+        rag_engine._validate_artifacts(artifacts._replace(metadata=artifacts.metadata[:-1]), None)
+
+
+def test_empty_index_is_rejected(monkeypatch):
+    monkeypatch.setattr(rag_engine, "_embedder", None)
+    artifacts = make_artifacts(corpus_records())
+    empty = faiss.IndexFlatIP(artifacts.index.d)
+    with pytest.raises(RuntimeError, match="empty"):
+        rag_engine._validate_artifacts(artifacts._replace(index=empty, metadata=[]), None)
+
+
+def test_index_built_with_another_model_is_rejected(monkeypatch):
+    monkeypatch.setattr(rag_engine, "_embedder", None)
+    with pytest.raises(RuntimeError, match="built with"):
+        rag_engine._validate_artifacts(
+            make_artifacts(corpus_records()), {"embedding_model": "some/other-model"}
+        )
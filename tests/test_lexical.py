@@ -0,0 +1,55 @@
+"""Tests for BM25 retrieval and reciprocal-rank fusion."""
+
+import numpy as np
+
+from lexical import BM25Index, reciprocal_rank_fusion, tokenize
+
+DOCS = [
+    "Section 498A deals with cruelty by husband or relatives",
+    "Section 302 prescribes punishment for murder",
+    "Cheating and dishonestly inducing delivery of property under section 420",
+]
+
+
+def test_tokenize_keeps_section_numbers():
+    assert tokenize("Section 498A, IPC") == ["section", "498a", "ipc"]
+
+
+def test_exact_token_ranks_its_document_first():
+    index = BM25Index.build(DOCS)
+    ids, scores = index.search("what is 498A", top_n=3)
+    assert ids.tolist() == [0]
+    assert scores[0] > 0
+
+
+def test_unknown_terms_score_nothing():
+    index = BM25Index.build(DOCS)
+    ids, _ = index.search("habeas corpus", top_n=3)
+    assert ids.size == 0
+
+
+def test_search_can_be_restricted_to_ids():
+    index = BM25Index.build(DOCS)
+    ids, _ = index.search("section", top_n=3, ids=np.array([1, 2]))
+    assert set(ids.tolist()) == {1, 2}
+
+
+def test_save_load_round_trip(tmp_path):
+    index = BM25Index.build(DOCS)
+    path = tmp_path / "bm25.npz"
+    index.save(path)
+    loaded = BM25Index.load(path)
+    assert loaded.vocabulary == index.vocabulary
+    np.testing.assert_allclose(loaded.score("punishment murder"), index.score("punishment murder"))
+
+
+def test_rrf_rewards_agreement_and_ignores_padding():
+    ids, scores = reciprocal_rank_fusion([np.array([1, 2, -1]), np.array([2, 3])], k=60)
+    assert ids[0] == 2
+    assert set(ids.tolist()) == {1, 2, 3}
+    assert np.isclose(scores[0], 1 / 62 + 1 / 61)
+
+
+def test_rrf_of_nothing_is_empty():
+    ids, scores = reciprocal_rank_fusion([np.array([-1])])
+    assert ids.size == 0 and scores.size == 0
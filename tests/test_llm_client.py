@@ -0,0 +1,28 @@
+"""Tests for the shared async LLM client."""
+
+import asyncio
+
+import pytest
+
+import llm_client
+
+
+@pytest.fixture(autouse=True)
+def no_client(monkeypatch):
+    monkeypatch.setattr(llm_client, "_client", None)
+
+
+def test_one_client_is_shared(monkeypatch):
+    monkeypatch.setattr(llm_client, "GROQ_API_KEY", "test-key")
+    client = llm_client.init_llm_client()
+    assert client is not None
+    assert llm_client.init_llm_client() is client
+    assert llm_client.get_llm_client() is client
+
+    asyncio.run(llm_client.close_llm_client())
+    assert llm_client._client is None
+
+
+def test_no_client_without_api_key(monkeypatch):
+    monkeypatch.setattr(llm_client, "GROQ_API_KEY", "")
+    assert llm_client.get_llm_client() is None
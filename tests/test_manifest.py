@@ -0,0 +1,39 @@
+"""Tests for the index artifact manifest."""
+
+from manifest import load_manifest, verify_manifest, write_manifest
+
+
+def _artifacts(root):
+    (root / "index.faiss").write_bytes(b"faiss" * 10)
+    store = root / "metadata"
+    store.mkdir()
+    (store / "text.bin").write_bytes(b"hello")
+    return [root / "index.faiss", store]
+
+
+def test_intact_artifacts_verify(tmp_path):
+    write_manifest(tmp_path, _artifacts(tmp_path), embedding_model="minilm")
+    manifest = load_manifest(tmp_path)
+
+    assert manifest["embedding_model"] == "minilm"
+    assert set(manifest["files"]) == {"index.faiss", "metadata/text.bin"}
+    assert verify_manifest(tmp_path, manifest, checksum=True) == []
+
+
+def test_missing_truncated_and_altered_files_are_reported(tmp_path):
+    write_manifest(tmp_path, _artifacts(tmp_path))
+    manifest = load_manifest(tmp_path)
+
+    (tmp_path / "index.faiss").write_bytes(b"faiss")
+    (tmp_path / "metadata" / "text.bin").write_bytes(b"HELLO")
+    problems = verify_manifest(tmp_path, manifest)
+    assert problems == ["index.faiss: size 5 != 50"]
+    problems = verify_manifest(tmp_path, manifest, checksum=True)
+    assert "metadata/text.bin: sha256 mismatch" in problems
+
+    (tmp_path / "index.faiss").unlink()
+    assert "index.faiss: missing" in verify_manifest(tmp_path, manifest)
+
+
+def test_no_manifest(tmp_path):
+    assert load_manifest(tmp_path) is None
@@ -0,0 +1,75 @@
+"""Tests for the columnar chunk metadata store."""
+
+import pytest
+
+from metadata_store import MetadataStore, write_metadata_store
+
+RECORDS = [
+    {"act_name": "Indian Penal Code", "category": "Criminal Law", "act_year": 1860,
+     "section_number": "302", "text": "Punishment for murder."},
+    {"act_name": "Bharatiya Nyaya Sanhita", "category": "Criminal Law", "act_year": 2023,
+     "section_number": "103", "text": "हत्या के लिए दंड — punishment for murder."},
+    {"act_name": "Indian Penal Code", "category": "Criminal Law", "act_year": None,
+     "section_number": "", "text": ""},
+]
+
+
+def test_round_trip(tmp_path):
+    write_metadata_store(RECORDS, tmp_path)
+    store = MetadataStore(tmp_path)
+
+    assert len(store) == len(RECORDS)
+    for record, expected in zip(store, RECORDS):
+        assert record["act_name"] == expected["act_name"]
+        assert record["act_year"] == (expected["act_year"] or 0)
+        assert record["section_number"] == expected["section_number"]
+        assert record["text"] == expected["text"]
+
+
+def test_columns_decode_whole_fields(tmp_path):
+    write_metadata_store(RECORDS, tmp_path)
+    store = MetadataStore(tmp_path)
+    assert store.column("act_name") == [r["act_name"] for r in RECORDS]
+    assert store.column("section_number") == ["302", "103", ""]
+
+
+def test_record_annotations_shadow_fields_without_touching_the_store(tmp_path):
+    write_metadata_store(RECORDS, tmp_path)
+    store = MetadataStore(tmp_path)
+
+    record = store[0]
+    record["score"] = 0.9
+    annotated = record.copy()
+    annotated["text"] = "snippet"
+
+    assert record["score"] == 0.9 and "score" in record
+    assert annotated["text"] == "snippet"
+    assert store[0]["text"] == RECORDS[0]["text"]
+    assert record.to_dict()["section_number"] == "302"
+    with pytest.raises(KeyError):
+        store[0]["missing"]
+
+
+
+def test_compressed_text_round_trips_across_blocks(tmp_path):
+    records = RECORDS * 5
+    write_metadata_store(records, tmp_path, compression="zstd", block_rows=2)
+    assert (tmp_path / "text.zst").exists() and not (tmp_path / "text.bin").exists()
+
+    store = MetadataStore(tmp_path)
+    assert [store[i]["text"] for i in reversed(range(len(records)))] == [
+        r["text"] for r in reversed(records)
+    ]
+    assert store.column("text") == [r["text"] for r in records]
+
+
+def test_rewriting_uncompressed_drops_the_compressed_files(tmp_path):
+    write_metadata_store(RECORDS, tmp_path, compression="zstd")
+    write_metadata_store(RECORDS, tmp_path)
+    assert not (tmp_path / "text.zst").exists()
+    assert MetadataStore(tmp_path)[1]["text"] == RECORDS[1]["text"]
+
+
+def test_unknown_compression_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        write_metadata_store(RECORDS, tmp_path, compression="lz4")
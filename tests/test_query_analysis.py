@@ -0,0 +1,66 @@
+"""Tests for inferring retrieval filters from the question text."""
+
+import pytest
+
+from query_analysis import AhoCorasick, QueryAnalyzer
+
+ACTS = {
+    "India Code: Bharatiya Nyaya Sanhita, 2023": {
+        "act_name": "Bharatiya Nyaya Sanhita", "year": 2023, "category": "Criminal Law",
+    },
+    "India Code: Bharatiya Nagarik Suraksha Sanhita, 2023": {
+        "act_name": "Bharatiya Nagarik Suraksha Sanhita", "year": 2023, "category": "Criminal Law",
+    },
+    "India Code: Indian Penal Code, 1860": {
+        "act_name": "Indian Penal Code", "year": 1860, "category": "Criminal Law",
+    },
+    "India Code: Companies Act, 1956": {
+        "act_name": "Companies Act", "year": 1956, "category": "Corporate Law",
+    },
+    "India Code: Companies Act, 2013": {
+        "act_name": "Companies Act", "year": 2013, "category": "Corporate Law",
+    },
+}
+
+
+@pytest.fixture(scope="module")
+def analyzer():
+    return QueryAnalyzer(ACTS)
+
+
+def test_aho_corasick_finds_overlapping_patterns():
+    matcher = AhoCorasick({"he": 1, "she": 2, "hers": 3})
+    assert sorted(matcher.finditer("ushers")) == [(1, 4, 2), (2, 4, 1), (2, 6, 3)]
+
+
+@pytest.mark.parametrize(
+    "query, filters",
+    [
+        ("punishment under the Bharatiya Nyaya Sanhita", {"act": "bharatiya nyaya sanhita"}),
+        ("what does BNSS say about arrest", {"act": "bharatiya nagarik suraksha sanhita"}),
+        ("director duties under the Companies Act, 2013", {"act": "companies act", "year": 2013}),
+        ("cheating under IPC", {"act": "indian penal code"}),
+    ],
+)
+def test_named_act_becomes_a_filter(analyzer, query, filters):
+    assert analyzer.analyze(query).filters == filters
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        # A bare year or category is the topic, not a slice of the corpus
+        "punishment for murder in 2023",
+        "is adultery a crime in criminal law",
+        # Two acts: do not narrow to either
+        "difference between IPC and BNS",
+        # "bns" must not match inside another word
+        "what are bnsx rules",
+    ],
+)
+def test_no_filter_without_a_single_act(analyzer, query):
+    assert analyzer.analyze(query).filters == {}
+
+
+def test_year_of_another_act_is_ignored(analyzer):
+    assert analyzer.analyze("murder under IPC in 2023").filters == {"act": "indian penal code"}
@@ -0,0 +1,57 @@
+"""Tests for old <-> new act query expansion and multi-phrasing retrieval."""
+
+import rag_engine
+from query_expansion import expand_query
+
+
+def test_section_reference_maps_to_its_counterpart_section():
+    assert expand_query("Section 302 IPC") == ["section 103 bharatiya nyaya sanhita"]
+    assert expand_query("What is section 103 of BNS?") == ["section 302 indian penal code"]
+
+
+def test_act_name_is_swapped_without_a_section():
+    assert expand_query("punishment for theft under IPC") == [
+        "punishment for theft under bharatiya nyaya sanhita"
+    ]
+
+
+def test_no_variant_without_a_counterpart_act():
+    assert expand_query("what is hacking under the IT Act") == []
+    # A section of an act without a mapped counterpart is not rewritten
+    assert expand_query("section 9999 IPC") == []
+
+
+def test_variants_are_deduplicated_and_limited(monkeypatch):
+    monkeypatch.setattr(rag_engine, "MULTI_QUERY_MAX", 2)
+    variants = rag_engine.query_variants(
+        ["Section 302 IPC", "section 302 ipc", "murder"], expand=True
+    )
+    assert variants == ["Section 302 IPC", "section 103 bharatiya nyaya sanhita"]
+    assert rag_engine.query_variants(["murder", "Murder"], expand=False) == ["murder"]
+
+
+def test_retrieve_multi_finds_both_old_and_new_sections(rag):
+    results = rag.retrieve_multi(
+        ["section 302 indian penal code murder"], top_k=4, expand=True
+    )
+    found = {(r["act_name"], r["section_number"]) for r in results}
+    assert ("Indian Penal Code", "302") in found
+    assert ("Bharatiya Nyaya Sanhita", "103") in found
+
+
+def test_act_filter_admits_the_counterpart_act_of_expanded_phrasings(rag):
+    query = "whoever cheats under IPC"
+    ipc_only = {"act": "indian penal code", "year": 1860}
+
+    expanded = rag.retrieve_multi([query], top_k=4, filters=ipc_only, expand=True)
+    assert {r["act_name"] for r in expanded} == {"Indian Penal Code", "Bharatiya Nyaya Sanhita"}
+    sections = {(r["act_name"], r["section_number"]) for r in expanded}
+    assert ("Bharatiya Nyaya Sanhita", "318") in sections
+
+    unexpanded = rag.retrieve_multi([query], top_k=4, filters=ipc_only, expand=False)
+    assert {r["act_name"] for r in unexpanded} == {"Indian Penal Code"}
+
+
+def test_act_filter_is_not_widened_without_expansion(rag):
+    results = rag.retrieve_multi(["whoever cheats"], top_k=4, filters={"act": "IPC"}, expand=True)
+    assert {r["act_name"] for r in results} == {"Indian Penal Code"}
@@ -0,0 +1,75 @@
+"""Tests for cross-encoder re-ranking under a latency budget (stub model)."""
+
+import threading
+
+import numpy as np
+import pytest
+
+from reranker import CrossEncoderReranker
+
+
+class StubModel:
+    """Scores a pair by the length of its text; can be held to simulate a slow batch."""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.release.set()
+        self.batches = []
+
+    def predict(self, pairs, batch_size=32, show_progress_bar=False):
+        self.release.wait(5)
+        self.batches.append(len(pairs))
+        return [float(len(text)) for _, text in pairs]
+
+
+@pytest.fixture
+def reranker():
+    reranker = CrossEncoderReranker("stub", max_queue=1)
+    reranker._model = StubModel()
+    yield reranker
+    reranker._model.release.set()
+    reranker.shutdown()
+
+
+def _score(reranker, query, texts, budget_ms=1000):
+    keys = [f"chunk-{i}" for i in range(len(texts))]
+    return reranker.score(query, query, keys, texts, budget_ms)
+
+
+def test_scores_and_caches_pairs(reranker):
+    scores = _score(reranker, "q", ["a", "abc", "ab"])
+    np.testing.assert_array_equal(scores, [1, 3, 2])
+
+    # Served from the pair cache: no new batch
+    assert _score(reranker, "q", ["a", "abc", "ab"]).tolist() == [1, 3, 2]
+    assert reranker._model.batches == [3]
+
+
+def test_over_budget_returns_none_and_fills_the_cache_later(reranker):
+    reranker._model.release.clear()
+    assert _score(reranker, "slow", ["a", "ab"], budget_ms=20) is None
+
+    reranker._model.release.set()
+    reranker._executor.submit(lambda: None).result(timeout=5)  # wait for the batch to drain
+    assert _score(reranker, "slow", ["a", "ab"], budget_ms=20).tolist() == [1, 2]
+
+
+def test_backlog_is_bounded(reranker):
+    reranker._model.release.clear()
+    # One batch running and one queued fill the worker...
+    assert _score(reranker, "q1", ["a"], budget_ms=10) is None
+    assert _score(reranker, "q2", ["a"], budget_ms=10) is None
+    # ...so further requests are turned away instead of queueing
+    queued = reranker._executor._queued + reranker._executor._active
+    assert _score(reranker, "q3", ["a"], budget_ms=10) is None
+    assert reranker._executor._queued + reranker._executor._active == queued == 2
+
+    reranker._model.release.set()
+
+
+def test_retrieval_uses_the_cross_encoder_order(rag, reranker, monkeypatch):
+    monkeypatch.setattr(rag, "_reranker", reranker)
+    results = rag.retrieve_sections("punishment", top_k=3, group_sections=False)
+    lengths = [len(r["text"]) for r in results]
+    assert lengths == sorted(lengths, reverse=True)
+    assert all("rerank_score" in r for r in results)
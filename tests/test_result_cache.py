@@ -0,0 +1,40 @@
+"""Tests for the ranked retrieval result cache."""
+
+import rag_engine
+from conftest import corpus_records, make_artifacts
+
+
+def test_repeated_query_is_served_from_the_cache(rag, monkeypatch):
+    first = rag.retrieve_sections("Punishment for murder?", top_k=2)
+
+    calls = []
+    rank_chunks = rag_engine._rank_chunks
+    monkeypatch.setattr(
+        rag_engine, "_rank_chunks", lambda *args: calls.append(args) or rank_chunks(*args)
+    )
+    again = rag.retrieve_sections("punishment for MURDER", top_k=2)
+
+    assert calls == []
+    assert [r["chunk_id"] for r in again] == [r["chunk_id"] for r in first]
+    assert [r["score"] for r in again] == [r["score"] for r in first]
+
+
+def test_cached_records_are_fresh_copies(rag):
+    rag.retrieve_sections("murder", top_k=2)[0]["text"] = "changed"
+    assert rag.retrieve_sections("murder", top_k=2)[0]["text"] != "changed"
+
+
+def test_filters_and_top_k_are_part_of_the_key(rag):
+    assert len(rag.retrieve_sections("murder", top_k=1, group_sections=False)) == 1
+    assert len(rag.retrieve_sections("murder", top_k=3, group_sections=False)) == 3
+    filtered = rag.retrieve_sections("murder", top_k=3, filters={"act": "IPC"})
+    assert {r["act_name"] for r in filtered} == {"Indian Penal Code"}
+
+
+def test_new_index_version_misses_the_cache(rag):
+    rag.retrieve_sections("murder", top_k=2)
+
+    records = corpus_records()
+    records[0]["text"] = "Murder: the new text."
+    rag_engine._install(make_artifacts(records), "test-v2")
+    assert rag.retrieve_sections("murder", top_k=1)[0]["text"] == "Murder: the new text."
@@ -0,0 +1,38 @@
+"""Tests for grouping chunk hits into sections."""
+
+import rag_engine
+
+
+def test_stitch_drops_the_overlap_between_chunks():
+    texts = [
+        "A person commits theft. The punishment is three years.",
+        "The punishment is three years. Fine may also be imposed.",
+    ]
+    assert rag_engine._stitch_texts(texts) == (
+        "A person commits theft. The punishment is three years. Fine may also be imposed."
+    )
+
+
+def test_stitch_joins_chunks_without_overlap_with_a_space():
+    assert rag_engine._stitch_texts(["First part.", "Second part."]) == "First part. Second part."
+
+
+def test_sections_are_returned_once_with_their_full_text(rag):
+    results = rag.retrieve_sections("computer offences section 43", top_k=3)
+    parents = [r["parent_id"] for r in results]
+    assert len(parents) == len(set(parents))
+
+    it_section = next(r for r in results if r["parent_id"] == "it-66")
+    assert it_section["chunk_count"] == 2
+    assert it_section["text"].count("referred to in section 43") == 1
+    assert it_section["text"].endswith("imprisonment up to three years.")
+
+
+def test_grouping_can_be_turned_off(rag):
+    results = rag.retrieve_sections("computer offences section 43", top_k=3, group_sections=False)
+    assert [r["parent_id"] for r in results].count("it-66") == 2
+
+
+def test_stitch_does_not_merge_a_shared_word():
+    stitched = rag_engine._stitch_texts(["Tried by the", "the Sessions Court."])
+    assert stitched == "Tried by the the Sessions Court."
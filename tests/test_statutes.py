@@ -0,0 +1,55 @@
+"""Tests for statute reference parsing and the (act, section) index."""
+
+import pytest
+
+from statutes import StatuteIndex, StatuteReference, act_key, parse_statute_reference, section_key
+
+IPC = "indian penal code"
+BNS = "bharatiya nyaya sanhita"
+
+
+@pytest.mark.parametrize(
+    "query, expected",
+    [
+        ("Section 302 IPC", StatuteReference(IPC, "302")),
+        ("what does s. 498A of the IPC say", StatuteReference(IPC, "498a")),
+        ("BNS 103", StatuteReference(BNS, "103")),
+        ("Bharatiya Nyaya Sanhita, 2023 section 103", StatuteReference(BNS, "103")),
+        ("u/s 65B Evidence Act", StatuteReference("indian evidence act", "65b")),
+        ("section 41 of bnss", StatuteReference("bharatiya nagarik suraksha sanhita", "41")),
+    ],
+)
+def test_parses_single_references(query, expected):
+    assert parse_statute_reference(query) == expected
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "what is the punishment for murder",
+        "section 302 and section 304 IPC",
+        "compare IPC 302 with BNS 103",
+        "BNS, 2023",
+    ],
+)
+def test_rejects_missing_or_ambiguous_references(query):
+    assert parse_statute_reference(query) is None
+
+
+def test_keys_normalize_names_and_sections():
+    assert act_key("India Code: Bharatiya Nyaya Sanhita, 2023") == BNS
+    assert act_key("The Indian Penal Code") == IPC
+    assert section_key("65 B") == "65b"
+
+
+def test_index_maps_references_to_chunks_in_order():
+    index = StatuteIndex([
+        {"act_name": "Indian Penal Code, 1860", "section_number": "302"},
+        {"act_name": "Bharatiya Nyaya Sanhita, 2023", "section_number": "103"},
+        {"act_name": "Indian Penal Code, 1860", "section_number": "302"},
+        {"act_name": "Indian Penal Code, 1860", "section_number": ""},
+    ])
+    assert index.lookup(StatuteReference(IPC, "302")) == [0, 2]
+    assert index.lookup(StatuteReference(BNS, "103")) == [1]
+    assert index.lookup(StatuteReference(IPC, "304")) == []
+    assert len(index) == 2